@@ -6,7 +6,6 @@ This module provides classes and functions for interacting with AWS DynamoDB.
 
 import os
 import time
-import boto3
 import json
 from datetime import datetime
 import sys
@@ -39,6 +38,8 @@ class DynamoDBClient:
         aws_secret_key = os.environ.get('AWS_SECRET_ACCESS_KEY')
         aws_region = os.environ.get('AWS_REGION', 'us-east-1')
         
+        import boto3
+        
         # Initialize DynamoDB resource with credentials if available
         if aws_access_key and aws_secret_key:
             self.dynamo = boto3.resource(
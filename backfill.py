@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script to backfill the whole proposal history into the seen-ID store.
+
+Pages through the data provider's proposals, oldest first, appending their
+IDs to the seen-ID store and checkpointing after every page. Run it again
+after an interruption to resume where it stopped.
+"""
+
+import argparse
+
+from database import ProposalScanner
+from database.backfill import Backfill
+from utils import get_config
+
+
+def main():
+    """Main function."""
+    config = get_config().config
+    parser = argparse.ArgumentParser(description="Backfill the proposal history")
+    parser.add_argument("--page-size", type=int, default=config.get('backfill_page_size', 500),
+                        help="Documents requested per page")
+    parser.add_argument("--restart", action="store_true", help="Discard an interrupted backfill and start over")
+    args = parser.parse_args()
+
+    scanner = ProposalScanner()
+    connection = scanner.create_firebase_client()
+    try:
+        stats = Backfill(scanner.data_provider, config['data_dir'], args.page_size).run(connection, restart=args.restart)
+    finally:
+        scanner.data_provider.disconnect(connection)
+
+    print(f"Backfilled {stats['rows']} proposals from {stats['documents']} documents in {stats['pages']} pages, "
+          f"{stats['seconds']:.1f}s ({stats['docs_per_second']:.0f} docs/s)")
+
+
+if __name__ == "__main__":
+    main()
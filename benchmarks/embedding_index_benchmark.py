@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lookup benchmark for the proposal embedding index.
+
+Fills an index with clustered synthetic embeddings, reopens it from disk and
+reports the warm lookup latency and the recall of the IVF search against an
+exact scan.
+
+Run with:
+    python -m benchmarks.embedding_index_benchmark --sizes 1000 10000 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.embedding_index import EmbeddingIndex, normalize
+from utils.metrics import RollingWindow
+
+
+def make_embeddings(n, dim=768, topics=200, noise=0.6, seed=0):
+    """
+    Generate embeddings grouped around random topic directions.
+
+    Args:
+        n (int): Number of embeddings
+        dim (int): Embedding dimension
+        topics (int): Number of topic directions
+        noise (float): Scale of the per-proposal noise
+        seed (int): Random seed
+
+    Returns:
+        np.ndarray: float32 matrix with one normalized embedding per row
+    """
+    rng = np.random.RandomState(seed)
+    centers = normalize(rng.randn(topics, dim))
+    vectors = centers[rng.randint(topics, size=n)] + noise * rng.randn(n, dim).astype(np.float32) / np.sqrt(dim)
+    return normalize(vectors)
+
+
+def run(size, queries=200, k=5, dim=768):
+    """
+    Benchmark one index size.
+
+    Args:
+        size (int): Number of indexed proposals
+        queries (int): Number of lookups
+        k (int): Neighbours per lookup
+        dim (int): Embedding dimension
+
+    Returns:
+        dict: Build time, latency percentiles and recall@k
+    """
+    vectors = make_embeddings(size + queries, dim)
+    stored, probes = vectors[:size], vectors[size:]
+
+    with tempfile.TemporaryDirectory() as path:
+        index = EmbeddingIndex(path, dim=dim)
+        started = time.perf_counter()
+        for start in range(0, size, 1000):
+            batch = stored[start:start + 1000]
+            index.add_batch([f"p{i}" for i in range(start, start + len(batch))], batch)
+        build_seconds = time.perf_counter() - started
+        index.close()
+
+        # Reopen from disk, as the bot does after a restart
+        started = time.perf_counter()
+        index = EmbeddingIndex(path)
+        open_seconds = time.perf_counter() - started
+
+        # Touch the mapped pages once so the timings reflect a running bot
+        for probe in probes:
+            index.search(probe, k=k)
+
+        latency = RollingWindow(queries)
+        hits = 0
+        for probe in probes:
+            started = time.perf_counter()
+            results = index.search(probe, k=k)
+            latency.add((time.perf_counter() - started) * 1000.0)
+            exact = {f"p{i}" for i in np.argsort(-(stored @ probe))[:k]}
+            hits += len(exact & {post_id for post_id, _, _ in results})
+        index.close()
+
+    summary = latency.summary()
+    return {
+        "size": size,
+        "build_seconds": build_seconds,
+        "open_seconds": open_seconds,
+        "p50_ms": summary["p50"],
+        "p99_ms": summary["p99"],
+        "recall": hits / (queries * k)
+    }
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the proposal embedding index")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'build s':>8} {'open s':>7} {'p50 ms':>7} {'p99 ms':>7} {'recall':>7}")
+    for size in args.sizes:
+        r = run(size, args.queries, args.k)
+        print(f"{r['size']:>8} {r['build_seconds']:>8.2f} {r['open_seconds']:>7.3f} "
+              f"{r['p50_ms']:>7.3f} {r['p99_ms']:>7.3f} {r['recall']:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
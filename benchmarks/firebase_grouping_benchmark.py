@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark for grouping Firestore documents by protocol.
+
+Compares FirebaseDataProvider.build_proposal_dict, which groups documents in
+one pass into ProposalBatches, with the previous implementation, which scanned
+every document for every protocol and grew each DataFrame with pd.concat.
+
+Run with:
+    python -m benchmarks.firebase_grouping_benchmark --sizes 1000 10000 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from database.scan_proposal import FirebaseDataProvider
+
+
+class FakeSnapshot:
+    """Minimal stand-in for a Firestore DocumentSnapshot."""
+
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+def make_docs(n_docs, n_protocols=50, snapshot_share=0.6, seed=0):
+    """
+    Generate Firestore-like proposal documents, newest first.
+
+    Args:
+        n_docs (int): Number of documents
+        n_protocols (int): Number of protocols
+        snapshot_share (float): Share of documents that are snapshot proposals
+        seed (int): Random seed
+
+    Returns:
+        list: FakeSnapshot documents
+    """
+    rng = random.Random(seed)
+    protocols = [f"protocol{i}" for i in range(n_protocols)]
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    docs = []
+    for i in range(n_docs):
+        protocol = rng.choice(protocols)
+        post_id = f"{protocol}--{i}"
+        data = {
+            "id": post_id,
+            "house_id": f"{protocol}.eth",
+            "post_type": "snapshot_proposal" if rng.random() < snapshot_share else "discourse_post",
+            "created_at": now - timedelta(minutes=i),
+            "title": f"Proposal {i}",
+            "description": f"<p>Proposal {i} for <b>{protocol}</b>: adjust parameters.</p>",
+        }
+        if rng.random() < 0.9:
+            data["post_url_link"] = f"https://forum.example.org/t/{i}"
+        docs.append(FakeSnapshot(post_id, data))
+    return docs
+
+
+def legacy_build_proposal_dict(provider, docs):
+    """
+    Previous grouping: one scan of all documents per protocol, one pd.concat per row.
+
+    Args:
+        provider (FirebaseDataProvider): Provider used to clean descriptions
+        docs (iterable): Document snapshots
+
+    Returns:
+        dict: DataFrame of proposals keyed by protocol
+    """
+    protocol_list = []
+    docs_list = []
+    for doc in docs:
+        protocol = str(doc.id).split('--')[0]
+        if protocol not in protocol_list:
+            protocol_list.append(protocol)
+        docs_list.append(doc.to_dict())
+
+    proposal_dict = {}
+    for key in protocol_list:
+        discourse_df = pd.DataFrame(columns=provider.PROPOSAL_COLUMNS)
+        for doc in docs_list:
+            try:
+                if doc['post_type'] == 'snapshot_proposal' and key in doc['house_id']:
+                    post_id = doc['id']
+                    description = provider._clean_content(doc['description'], post_id)
+                    discussion_link = doc.get('post_url_link', '')
+                    df_row = [key, post_id, doc['created_at'], doc['title'], description, discussion_link, True]
+                    temp_df = pd.DataFrame([df_row], columns=discourse_df.columns)
+                    discourse_df = pd.concat([discourse_df, temp_df], ignore_index=True)
+            except Exception:
+                continue
+        proposal_dict[key] = discourse_df
+    return proposal_dict
+
+
+def time_call(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark per-protocol grouping of Firestore documents")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--protocols", type=int, default=50)
+    parser.add_argument("--legacy-max", type=int, default=100000,
+                        help="Largest size the previous implementation is run on")
+    args = parser.parse_args()
+
+    provider = FirebaseDataProvider({})
+    print(f"{'docs':>8} {'single-pass s':>14} {'legacy s':>10} {'speedup':>8}")
+    for size in args.sizes:
+        docs = make_docs(size, args.protocols)
+        # Warm the HTML cleaner so both runs measure grouping rather than parsing
+        provider.build_proposal_dict(docs)
+
+        grouped, fast_seconds = time_call(provider.build_proposal_dict, docs)
+        if size > args.legacy_max:
+            print(f"{size:>8} {fast_seconds:>14.3f} {'skipped':>10} {'-':>8}")
+            continue
+
+        legacy, legacy_seconds = time_call(legacy_build_proposal_dict, provider, docs)
+        assert list(grouped) == list(legacy)
+        for key in grouped:
+            pd.testing.assert_frame_equal(grouped[key].to_frame(), legacy[key])
+        print(f"{size:>8} {fast_seconds:>14.3f} {legacy_seconds:>10.2f} {legacy_seconds / fast_seconds:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
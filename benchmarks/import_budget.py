@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import-time report and budget check.
+
+Imports each module in a fresh interpreter with `-X importtime`, parses the
+timings and fails when the cold import of a module exceeds its budget.
+Interpreter start-up imports are measured separately and excluded.
+
+Run with:
+    python -m benchmarks.import_budget                  # budgets from import_budget.json
+    python -m benchmarks.import_budget main --budget-ms 800 --top 15
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+DEFAULT_BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_budget.json')
+
+
+def parse_importtime(output):
+    """
+    Parse the stderr of `python -X importtime`.
+
+    Args:
+        output (str): Captured stderr
+
+    Returns:
+        list: (module, self_us, cumulative_us, depth) tuples in import order
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        name = fields[2]
+        # Nested imports are indented by two spaces per level after the first space
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    return entries
+
+
+def run_importtime(statement, python=sys.executable, cwd=current_dir):
+    """
+    Run a statement in a fresh interpreter with import timing enabled.
+
+    Args:
+        statement (str): Python statement to execute
+        python (str): Interpreter to use
+        cwd (str): Working directory, the project root by default
+
+    Returns:
+        list: Parsed import-time entries
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', statement],
+        cwd=cwd, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure_import(module, python=sys.executable):
+    """
+    Measure the cold import of a module.
+
+    Args:
+        module (str): Dotted module name
+        python (str): Interpreter to use
+
+    Returns:
+        dict: Total milliseconds and self time per top-level package
+    """
+    startup = {name for name, _, _, _ in run_importtime('pass', python)}
+    entries = [entry for entry in run_importtime(f'import {module}', python) if entry[0] not in startup]
+
+    total_us = sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+    by_package = defaultdict(int)
+    for name, self_us, _, _ in entries:
+        by_package[name.split('.')[0]] += self_us
+    return {
+        "module": module,
+        "total_ms": total_us / 1000.0,
+        "packages_ms": {name: us / 1000.0 for name, us in sorted(by_package.items(), key=lambda item: -item[1])}
+    }
+
+
+def load_budgets(path):
+    """
+    Load per-module import budgets.
+
+    Args:
+        path (str): JSON file mapping module names to budgets in milliseconds
+
+    Returns:
+        dict: Budgets keyed by module name
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    """Main function. Returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Check cold import times against a budget")
+    parser.add_argument("modules", nargs="*", help="Modules to measure (default: all modules in the budget file)")
+    parser.add_argument("--budget-file", default=DEFAULT_BUDGET_FILE)
+    parser.add_argument("--budget-ms", type=float, help="Budget applied to every module given on the command line")
+    parser.add_argument("--top", type=int, default=10, help="Number of packages listed per module")
+    args = parser.parse_args(argv)
+
+    budgets = load_budgets(args.budget_file) if os.path.exists(args.budget_file) else {}
+    modules = args.modules or list(budgets)
+    if not modules:
+        parser.error("no modules given and no budget file found")
+
+    failures = []
+    for module in modules:
+        budget = args.budget_ms if args.budget_ms is not None else budgets.get(module)
+        report = measure_import(module)
+        status = "ok" if budget is None or report["total_ms"] <= budget else "OVER BUDGET"
+        budget_text = f" / budget {budget:.0f} ms" if budget is not None else ""
+        print(f"{module}: {report['total_ms']:.1f} ms{budget_text} [{status}]")
+        for package, ms in list(report["packages_ms"].items())[:args.top]:
+            print(f"    {package:<30} {ms:8.1f} ms")
+        if status != "ok":
+            failures.append(module)
+
+    if failures:
+        print(f"Import budget exceeded by: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+End-to-end ingestion benchmark for the Firestore and MongoDB providers.
+
+Loads synthetic proposals spread over many protocols into the in-memory
+stand-ins from database.fakes and times what a scan cycle does with them:
+download_proposals followed by check_new_proposals against the seen-ID
+store. No credentials or servers are needed.
+
+Two figures are reported per backend and collection size:
+
+- catch-up: one cycle after the watermark, with every document new, as
+  after a restart or an outage; reported as seconds and documents per second
+- steady state: cycles on the full collection that each find a small burst
+  of new documents, as when polling; reported as cycle latency percentiles
+
+Run with:
+    python -m benchmarks.ingestion_benchmark --sizes 1000 10000 100000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from database.fakes import FakeFirestoreClient, FakeMongoClient, load_firestore, load_mongo, synthetic_proposals
+from database.mongo_provider import MongoDataProvider
+from database.scan_proposal import FirebaseDataProvider
+from database.seen_ids import get_seen_ids, seen_ids_path
+from utils.clean_html import get_html_cleaner
+from utils.metrics import RollingWindow
+
+BACKENDS = {
+    "firebase": (FirebaseDataProvider, FakeFirestoreClient, load_firestore),
+    "mongodb": (MongoDataProvider, FakeMongoClient, load_mongo),
+}
+
+
+def run_cycle(provider, connection, seen_ids):
+    """
+    Run one scan cycle and mark its proposals as processed.
+
+    Args:
+        provider: FirebaseDataProvider or MongoDataProvider
+        connection: Fake client
+        seen_ids (SeenIdStore): Seen-ID store of the provider's data directory
+
+    Returns:
+        tuple: (seconds for download and check, number of new proposals)
+    """
+    started = time.perf_counter()
+    proposal_dict = provider.download_proposals(connection)
+    new_proposals = provider.check_new_proposals(proposal_dict, seen_ids.path)
+    seconds = time.perf_counter() - started
+
+    provider.commit_watermark()
+    seen_ids.add_many(new_proposals.post_ids())
+    return seconds, len(new_proposals)
+
+
+def measure(backend, size, args):
+    """
+    Measure catch-up throughput and steady-state latency for one backend and size.
+
+    Args:
+        backend (str): Key of BACKENDS
+        size (int): Documents in the collection
+        args: Parsed command-line arguments
+
+    Returns:
+        dict: Catch-up seconds, documents per second and new proposals, and
+            the cycle latency summary in milliseconds
+    """
+    provider_class, client_class, load = BACKENDS[backend]
+    proposals = synthetic_proposals(size + args.cycles * args.burst, args.protocols, seed=args.seed)
+    backlog, bursts = proposals[:size], proposals[size:]
+    # Every run cleans its descriptions, rather than hitting the previous run's cache
+    get_html_cleaner().clear()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        provider = provider_class({"data_dir": data_dir, "watermark_page_size": args.page_size})
+        seen_ids = get_seen_ids(seen_ids_path(data_dir))
+        client = client_class()
+
+        # A watermark just before the first document makes every document new
+        provider.get_watermark().observe(backlog[0]["created_at"] - timedelta(seconds=1), "")
+        provider.commit_watermark()
+        load(client, backlog)
+
+        catch_up_seconds, new_count = run_cycle(provider, client, seen_ids)
+
+        latency_ms = RollingWindow(args.cycles)
+        for i in range(args.cycles):
+            load(client, bursts[i * args.burst:(i + 1) * args.burst])
+            seconds, _ = run_cycle(provider, client, seen_ids)
+            latency_ms.add(seconds * 1000.0)
+
+    return {
+        "catch_up_seconds": catch_up_seconds,
+        "docs_per_second": size / catch_up_seconds,
+        "new_proposals": new_count,
+        "latency_ms": latency_ms.summary(),
+    }
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end proposal ingestion on in-memory backends")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument("--protocols", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=100, help="WATERMARK_PAGE_SIZE of the providers")
+    parser.add_argument("--cycles", type=int, default=20, help="Steady-state cycles timed per size")
+    parser.add_argument("--burst", type=int, default=5, help="New documents per steady-state cycle")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Per-cycle provider logging would dominate the steady-state cycles
+    logging.disable(logging.INFO)
+
+    print(f"{'backend':>9} {'docs':>7} {'new':>7} {'catch-up s':>11} {'docs/s':>9} "
+          f"{'cycle p50 ms':>13} {'cycle p99 ms':>13}")
+    for backend in args.backends:
+        # Untimed run so the first size doesn't pay for imports and first-use setup
+        measure(backend, 10, args)
+        for size in args.sizes:
+            result = measure(backend, size, args)
+            latency = result["latency_ms"]
+            print(f"{backend:>9} {size:>7} {result['new_proposals']:>7} {result['catch_up_seconds']:>11.2f} "
+                  f"{result['docs_per_second']:>9.0f} {latency['p50']:>13.2f} {latency['p99']:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
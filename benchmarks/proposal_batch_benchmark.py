@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Latency and allocation benchmark for the scan cycle hand-off.
+
+Compares the previous hand-off, which built one DataFrame per protocol,
+filtered it with iterrows() into a DataFrame of new proposals and walked that
+with iterrows() again in trigger_trade, with ProposalRecords in
+ProposalBatches. Both paths start from the same parsed documents, so HTML
+cleaning and the data source are left out.
+
+Run with:
+    python -m benchmarks.proposal_batch_benchmark --sizes 20 1000 10000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from database.proposal_record import ProposalRecord, ProposalBatch, select_new
+
+COLUMNS = list(ProposalRecord.FIELDS)
+NEW_COLUMNS = ["post_id", "coin", "description", "discussion_link", "timestamp", "content_cleaned"]
+
+
+def make_rows(n_docs, n_protocols=20, seed=0):
+    """
+    Generate parsed proposal documents, newest first.
+
+    Args:
+        n_docs (int): Number of proposals
+        n_protocols (int): Number of protocols
+        seed (int): Random seed
+
+    Returns:
+        list: (protocol, post_id, timestamp, title, description, discussion_link) tuples
+    """
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for i in range(n_docs):
+        protocol = f"protocol{rng.randrange(n_protocols)}"
+        rows.append((protocol, f"{protocol}--{i}", now - timedelta(minutes=i), f"Proposal {i}",
+                     f"Proposal {i} for {protocol}: adjust parameters.", f"https://forum.example.org/t/{i}"))
+    return rows
+
+
+def legacy_cycle(rows, seen_ids):
+    """
+    Previous hand-off: per-protocol DataFrames, iterrows() filtering and an iterrows() walk.
+
+    Args:
+        rows (list): Parsed documents from make_rows()
+        seen_ids (set): Processed post IDs
+
+    Returns:
+        list: Post IDs handed to the trade logic
+    """
+    protocol_rows = {}
+    for protocol, post_id, timestamp, title, description, link in rows:
+        protocol_rows.setdefault(protocol, []).append([protocol, post_id, timestamp, title, description, link, True])
+    proposal_dict = {key: pd.DataFrame(value, columns=COLUMNS, dtype=object) for key, value in protocol_rows.items()}
+
+    new_rows = []
+    for coin_df in proposal_dict.values():
+        for _, row in coin_df.iterrows():
+            if row['post_id'] not in seen_ids:
+                new_rows.append({
+                    "post_id": row['post_id'],
+                    "coin": row['post_id'].split("--")[0],
+                    "description": row['description'],
+                    "discussion_link": row['discussion_link'],
+                    "timestamp": row['timestamp'],
+                    "content_cleaned": row.get('content_cleaned') is True,
+                })
+    new_row_df = pd.DataFrame(new_rows, columns=NEW_COLUMNS)
+
+    descriptions = [row['description'] for _, row in new_row_df.iterrows()]
+    handled = []
+    for (_, row), description in zip(new_row_df.iterrows(), descriptions):
+        fields = (row['coin'], row['post_id'], row['timestamp'], row['discussion_link'], description)
+        handled.append(fields[1])
+    return handled
+
+
+def record_cycle(rows, seen_ids):
+    """
+    Current hand-off: ProposalRecords in ProposalBatches, read by attribute.
+
+    Args:
+        rows (list): Parsed documents from make_rows()
+        seen_ids (set): Processed post IDs
+
+    Returns:
+        list: Post IDs handed to the trade logic
+    """
+    protocol_rows = {}
+    for protocol, post_id, timestamp, title, description, link in rows:
+        protocol_rows.setdefault(protocol, []).append(
+            ProposalRecord(protocol, post_id, timestamp, title, description, link, True))
+    proposal_dict = {key: ProposalBatch(value) for key, value in protocol_rows.items()}
+
+    new_proposals = select_new(proposal_dict, seen_ids)
+
+    descriptions = [record.description for record in new_proposals]
+    handled = []
+    for record, description in zip(new_proposals, descriptions):
+        fields = (record.coin, record.post_id, record.timestamp, record.discussion_link, description)
+        handled.append(fields[1])
+    return handled
+
+
+def measure(cycle, rows, seen_ids, repeats):
+    """
+    Measure one scan cycle.
+
+    Args:
+        cycle (callable): legacy_cycle or record_cycle
+        rows (list): Parsed documents
+        seen_ids (set): Processed post IDs
+        repeats (int): Timed runs
+
+    Returns:
+        tuple: (median seconds, peak traced bytes)
+    """
+    cycle(rows, seen_ids)
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        cycle(rows, seen_ids)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    cycle(rows, seen_ids)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the proposal hand-off of a scan cycle")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 1000, 10000])
+    parser.add_argument("--new-share", type=float, default=0.05,
+                        help="Share of proposals not processed yet")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'docs':>7} {'path':>8} {'median ms':>10} {'peak KiB':>9}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        seen_ids = {post_id for _, post_id, *_ in rows[int(size * args.new_share):]}
+        assert legacy_cycle(rows, seen_ids) == record_cycle(rows, seen_ids)
+        for name, cycle in (("legacy", legacy_cycle), ("records", record_cycle)):
+            seconds, peak = measure(cycle, rows, seen_ids, args.repeats)
+            print(f"{size:>7} {name:>8} {seconds * 1000:>10.2f} {peak / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmark for the text-validity classifier.
+
+Generates a synthetic corpus of proposal-like documents and compares the
+batched regex classifier against per-document classification and, when the
+punkt tokenizer data is installed, against the NLTK word_tokenize reference.
+
+Run with:
+    python -m benchmarks.text_verification_benchmark --docs 10000
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.text_verification import (
+    get_english_words, text_validity_scores, text_validity_check, nltk_text_validity_check
+)
+
+
+def make_corpus(n_docs, seed=0, min_words=20, max_words=400, junk_rate=0.3):
+    """
+    Generate a synthetic corpus of proposal-like documents.
+
+    Args:
+        n_docs (int): Number of documents
+        seed (int): Random seed
+        min_words (int): Minimum words per document
+        max_words (int): Maximum words per document
+        junk_rate (float): Mean share of non-dictionary tokens per document
+
+    Returns:
+        list: Generated documents
+    """
+    rng = random.Random(seed)
+    vocabulary = rng.sample(sorted(w for w in get_english_words() if w.islower()), 5000)
+    extras = ["don't", "it's", "we'll", "10,000", "7.5%", "v3", "$UNI", "well-known", "e.g.", "(see", "below)",
+              '"Treasury"', "...", "--", "https://forum.example.org/t/123"]
+    punctuation = [".", ",", ";", ":", "!", "?"]
+
+    corpus = []
+    for _ in range(n_docs):
+        junk = rng.random() * 2 * junk_rate
+        words = []
+        for _ in range(rng.randint(min_words, max_words)):
+            roll = rng.random()
+            if roll < junk:
+                words.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))))
+            elif roll < junk + 0.05:
+                words.append(rng.choice(extras))
+            else:
+                word = rng.choice(vocabulary)
+                words.append(word.capitalize() if rng.random() < 0.1 else word)
+            if rng.random() < 0.08:
+                words[-1] += rng.choice(punctuation)
+        corpus.append(' '.join(words))
+    return corpus
+
+
+def time_call(func, *args):
+    """Run func once and return (result, seconds)."""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the text-validity classifier")
+    parser.add_argument("--docs", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-words", type=int, default=20)
+    parser.add_argument("--max-words", type=int, default=400)
+    args = parser.parse_args()
+
+    get_english_words()
+    corpus = make_corpus(args.docs, args.seed, args.min_words, args.max_words)
+    n_words = sum(len(doc.split()) for doc in corpus)
+    print(f"Corpus: {len(corpus)} documents, {n_words} words")
+
+    batch_scores, batch_seconds = time_call(text_validity_scores, corpus)
+    print(f"batch regex:      {batch_seconds:8.3f}s  {len(corpus) / batch_seconds:10.0f} docs/s")
+
+    _, single_seconds = time_call(lambda docs: [text_validity_check(doc) for doc in docs], corpus)
+    print(f"per-doc regex:    {single_seconds:8.3f}s  {len(corpus) / single_seconds:10.0f} docs/s")
+
+    try:
+        reference, nltk_seconds = time_call(lambda docs: [nltk_text_validity_check(doc) for doc in docs], corpus)
+    except LookupError:
+        print("per-doc NLTK:     skipped (punkt tokenizer data not installed, run build_lexicon.py)")
+        return
+
+    print(f"per-doc NLTK:     {nltk_seconds:8.3f}s  {len(corpus) / nltk_seconds:10.0f} docs/s"
+          f"  ({nltk_seconds / batch_seconds:.1f}x slower than batch)")
+    differences = sorted(abs(a - b) for a, b in zip(batch_scores, reference))
+    flips = sum((a > 0.5) != (b > 0.5) for a, b in zip(batch_scores, reference))
+    print(f"score difference: max {differences[-1]:.4f}, p99 {differences[int(len(differences) * 0.99)]:.4f}; "
+          f"{flips} classification flips")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script to build and query the embedding index of historical proposals.
+
+Embeds every proposal in proposal_post_all.csv that is not yet indexed
+(the bot adds new proposals itself as it analyses them), and optionally
+lists the past proposals most similar to a given text.
+"""
+
+import argparse
+import os
+
+import pandas as pd
+
+from utils import get_config
+from utils.embedding_index import EmbeddingIndex
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Build or query the proposal embedding index")
+    parser.add_argument("--batch-size", type=int, default=32, help="Proposals embedded per forward pass")
+    parser.add_argument("--query", help="Print the proposals most similar to this text instead of building")
+    parser.add_argument("-k", type=int, default=5, help="Number of similar proposals to print")
+    args = parser.parse_args()
+
+    config = get_config().config
+    index = EmbeddingIndex(os.path.join(config['data_dir'], 'embedding_index'))
+
+    from models.sentiment import SentimentPredictor
+    predictor = SentimentPredictor(config['sentiment_dir'])
+
+    if args.query:
+        for post_id, similarity, metadata in index.search(predictor.embed(args.query)[0], k=args.k):
+            print(f"{similarity:.3f}  {post_id}  {metadata}")
+        return
+
+    proposals = pd.read_csv(os.path.join(config['data_dir'], 'proposal_post_all.csv'), index_col=0)
+    proposals = proposals.dropna(subset=['description'])
+    proposals = proposals[~proposals['post_id'].isin(index.ids)]
+
+    added = 0
+    for start in range(0, len(proposals), args.batch_size):
+        batch = proposals.iloc[start:start + args.batch_size]
+        vectors = predictor.embed(list(batch['description']))
+        for (_, row), vector in zip(batch.iterrows(), vectors):
+            added += index.add(row['post_id'], vector, coin=row['coin'], timestamp=row.get('timestamp'),
+                               sentiment=row['sentiment'], sentiment_score=row['sentiment_score'])
+        print(f"Indexed {added}/{len(proposals)} proposals")
+
+    index.close()
+    print(f"Index at {index.path} holds {len(index)} proposals")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script to build the offline English lexicon used by text verification.
+
+Downloads the NLTK words corpus and tokenizer data once and stores the
+lexicon as a pickled frozenset, so the bot never downloads anything at
+startup and runs on air-gapped hosts.
+"""
+
+import argparse
+import nltk
+
+from utils.text_verification import build_lexicon, get_lexicon_path
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Build the English lexicon artifact")
+    parser.add_argument("--output", default=get_lexicon_path(), help="Path of the lexicon artifact")
+    parser.add_argument("--no-download", action="store_true",
+                        help="Only use NLTK data that is already installed")
+    args = parser.parse_args()
+
+    if not args.no_download:
+        # Tokenizer data for the word_tokenize reference used by the benchmark (punkt_tab on NLTK >= 3.8.2)
+        nltk.download('punkt', quiet=True)
+        nltk.download('punkt_tab', quiet=True)
+
+    lexicon = build_lexicon(args.output, download=not args.no_download)
+    print(f"Wrote {len(lexicon)} words to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,6 @@ import json
 import time
 import os
 import sys
-from binance.client import Client
 
 # Add the parent directory to sys.path for direct imports
 current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -3,7 +3,6 @@ import pandas as pd
 import time
 import json
 import os
-import firebase_admin
 from datetime import datetime
 import logging
 
@@ -14,16 +13,19 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 from database import ProposalScanner
+from database.seen_ids import get_seen_ids, seen_ids_path
+from database.proposal_record import ProposalBatch
 from models.summarization import Summarization
 from utils import format_time_utc, btc_price_check, get_config
 from utils.logging_utils import get_logger
 from exchange import BinanceAPI
 from services import SlackBot, post_to_slack, post_error_to_slack
-from models.bullish_price import RobertaForRegressionBullish
-from models.bearish_price import RobertaForRegressionBearish
-from utils.text_verification import classify_text
+from utils.text_verification import classify_texts
 from utils.clean_html import remove_html_tags
 from utils.save_trades import Save
+from utils.deadline import Deadline, DeadlineExceeded, parse_timestamp
+from utils.near_duplicate import NearDuplicateIndex, NearDuplicateAuditLog, POLICIES as NEAR_DUPLICATE_POLICIES
+from utils.embedding_index import EmbeddingIndex
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -60,6 +62,25 @@ class TradeLogic:
         
         # Initialize BinanceAPI
         self.binance_api = BinanceAPI(config_path)
+        
+        # Recently analysed descriptions, so cross-posts and re-submissions can reuse earlier scores
+        self.near_duplicate_policy = self.config.get('near_duplicate_policy', 'reuse')
+        if self.near_duplicate_policy not in NEAR_DUPLICATE_POLICIES:
+            logger.warning(f"Unknown near-duplicate policy '{self.near_duplicate_policy}', using 'reuse'")
+            self.near_duplicate_policy = 'reuse'
+        self.duplicate_index = NearDuplicateIndex(
+            threshold=self.config.get('near_duplicate_threshold', 0.85),
+            window_seconds=self.config.get('near_duplicate_window_hours', 72.0) * 3600
+        )
+        self.duplicate_audit = NearDuplicateAuditLog(
+            os.path.join(self.config.get('data_dir', 'data'), 'near_duplicate_audit.jsonl')
+        )
+        self._duplicate_index_loaded = False
+        
+        # Embeddings of every analysed proposal, for similar-case lookup
+        self.embedding_index = None
+        if self.config.get('embedding_index_enabled', True):
+            self.embedding_index = EmbeddingIndex(os.path.join(self.config.get('data_dir', 'data'), 'embedding_index'))
     
     def store_data(self, db):
         """
@@ -69,8 +90,8 @@ class TradeLogic:
             db: Firestore database client
         """
         print("Initating first DB creation")
-        proposal_dict = self.proposal_scanner.download_and_save_proposal(db, False)
-        start_time = self.proposal_scanner.store_into_db(proposal_dict)
+        # Pages through the whole history and resumes if a previous run was interrupted
+        start_time = self.proposal_scanner.store_data(db)
         print("Key DB created successfully")
         
         proposal_post_all = pd.DataFrame(columns=["timestamp", "post_id", "coin", "description", "summary", "sentiment", "sentiment_score", "text_verify"])    
@@ -243,12 +264,79 @@ class TradeLogic:
             sentiment_score = (sentiment_score + crypto_score) / 2
             return sentiment, sentiment_score
     
-    def trigger_trade(self, new_row_df, summary_obj, sentiment_analyzer, reasoning, dynamo, slack_bot=None):
+    def mark_processed(self, post_id):
+        """
+        Record a proposal as processed so later scans skip it.
+        
+        Appends one line to the seen-ID store instead of rewriting the file.
+        
+        Args:
+            post_id (str): Post ID
+        """
+        get_seen_ids(seen_ids_path(self.config['data_dir'])).add(post_id)
+    
+    def load_duplicate_index(self, proposal_post_all):
+        """
+        Seed the near-duplicate index with the most recently analysed proposals.
+        
+        Entries keep the proposal's recorded timestamp, so proposals older than
+        the index window, or without a readable timestamp, are not seeded.
+        
+        Args:
+            proposal_post_all (DataFrame): Analysed proposals
+        """
+        recent = proposal_post_all.dropna(subset=['description', 'summary']).tail(self.duplicate_index.max_entries)
+        for _, row in recent.iterrows():
+            added_at = parse_timestamp(row['timestamp'])
+            if added_at is None:
+                continue
+            self.duplicate_index.add(row['post_id'], row['description'], {
+                "summary": row['summary'],
+                "sentiment": None if pd.isna(row['sentiment']) else row['sentiment'],
+                "sentiment_score": row['sentiment_score']
+            }, added_at=added_at)
+        self._duplicate_index_loaded = True
+        logger.info(f"Near-duplicate index seeded with {len(self.duplicate_index)} proposals")
+    
+    def update_embedding_index(self, proposals, sentiment_analyzer):
+        """
+        Embed newly analysed proposals in one batch and add them to the embedding index.
+        
+        Failures are logged and never interrupt trading.
+        
+        Args:
+            proposals (list): Dicts with post_id, description and the metadata to store
+            sentiment_analyzer: Sentiment analyzer object providing `embed`
+        """
+        if self.embedding_index is None or not proposals or not hasattr(sentiment_analyzer, 'embed'):
+            return
+        
+        proposals = [p for p in proposals if p['post_id'] not in self.embedding_index]
+        if not proposals:
+            return
+        
+        try:
+            vectors = sentiment_analyzer.embed([p['description'] for p in proposals])
+            for proposal, vector in zip(proposals, vectors):
+                metadata = {key: value for key, value in proposal.items() if key not in ('post_id', 'description')}
+                self.embedding_index.add(proposal['post_id'], vector, **metadata)
+        except Exception as e:
+            logger.error(f"Error updating embedding index: {e}")
+    
+    def trigger_trade(self, new_proposals, summary_obj, sentiment_analyzer, reasoning, dynamo, slack_bot=None):
         """
         Trigger trades based on new proposals.
         
+        Each proposal gets a deadline of its timestamp plus the configured
+        `proposal_time_budget`. The deadline is passed to every stage, and
+        proposals whose deadline passes are abandoned with a logged reason.
+        Near-duplicates of recently analysed proposals are handled according
+        to `near_duplicate_policy`, and every match is written to the audit log.
+        Analysed proposals are added to the embedding index in one batch once
+        every proposal has been processed, or when processing stops on an error.
+        
         Args:
-            new_row_df (DataFrame): DataFrame with new proposals
+            new_proposals (ProposalBatch): New proposals; a DataFrame with the same columns is also accepted
             summary_obj: Summarization object
             sentiment_analyzer: Sentiment analyzer object
             reasoning: Reasoning object
@@ -258,11 +346,12 @@ class TradeLogic:
         # Use provided SlackBot if available
         slack_bot = slack_bot or self.slack_bot
         
-        if len(new_row_df) == 0:
+        if len(new_proposals) == 0:
             return
+        if isinstance(new_proposals, pd.DataFrame):
+            new_proposals = ProposalBatch.from_frame(new_proposals)
             
         proposal_post_all = pd.read_csv(self.config['data_dir'] + '/proposal_post_all.csv', index_col=0)
-        proposal_post_id = pd.read_csv(self.config['data_dir'] + '/proposal_post_id.csv', index_col=0)
         
         with open(self.config['data_dir'] + '/proposal_post_live.json', 'r') as json_file:
             proposal_post_live = json.load(json_file)
@@ -270,114 +359,187 @@ class TradeLogic:
         live_post_ids = []
         for key, live_trade in proposal_post_live.items():
             live_post_ids.append(proposal_post_live[key]['post_id'])
+        
+        time_budget = self.config.get('proposal_time_budget', 3600.0)
+        
+        check_duplicates = self.near_duplicate_policy != 'off'
+        if check_duplicates and not self._duplicate_index_loaded:
+            self.load_duplicate_index(proposal_post_all)
+
+        # Clean and verify every description in one batch; providers that already
+        # cleaned a description at ingestion flag it so it isn't parsed again
+        descriptions = [
+            record.description if record.content_cleaned is True
+            else self.proposal_scanner.clean_content(record.description, record.post_id)
+            for record in new_proposals
+        ]
+        text_verifies = classify_texts(descriptions)
+        analysed = []
 
-        for index, row in new_row_df.iterrows():
-            coin = row['coin']
-            post_id = row['post_id']
-            slack_bot.post_error_to_slack(str(post_id))
-            description = row['description']
-            description = self.proposal_scanner.clean_content(description)
-            timestamp = row['timestamp']
-            discussion_link = row['discussion_link']
+        try:
+            for record, description, text_verify in zip(new_proposals, descriptions, text_verifies):
+                coin = record.coin
+                post_id = record.post_id
+                slack_bot.post_error_to_slack(str(post_id))
+                timestamp = record.timestamp
+                discussion_link = record.discussion_link
+            
+                deadline = Deadline.from_timestamp(timestamp, time_budget)
+                if deadline.expired():
+                    logger.warning(f"Abandoning proposal {post_id}: deadline passed {-deadline.remaining():.0f}s ago "
+                                   f"(budget {time_budget:.0f}s from {timestamp})")
+                    self.mark_processed(post_id)
+                    continue
+            
+                match = None
+                if check_duplicates:
+                    signature = self.duplicate_index.signature(description)
+                    match = self.duplicate_index.query(description, signature=signature, exclude=post_id)
             
-            text_verify = classify_text(description)
-            summary = summary_obj.summarize_text(description)
-            sentiment, sentiment_score = sentiment_analyzer.predict(summary)
+                if match is not None and self.near_duplicate_policy == 'skip':
+                    matched_post_id, similarity, _ = match
+                    logger.info(f"Skipping proposal {post_id}: near-duplicate of {matched_post_id} ({similarity:.2f})")
+                    self.duplicate_audit.record(post_id, matched_post_id, similarity, 'skip', 'skipped')
+                    self.mark_processed(post_id)
+                    continue
             
-            # Calculating deepseek and openAI sentiment
-            sentiment, sentiment_score = reasoning.predict_sentiment(summary, sentiment_score)
+                if match is not None and self.near_duplicate_policy == 'reuse':
+                    # Reuse the earlier analysis instead of running the summarizer and the models again
+                    matched_post_id, similarity, result = match
+                    summary, sentiment, sentiment_score = result['summary'], result['sentiment'], result['sentiment_score']
+                    logger.info(f"Reusing analysis of {matched_post_id} for near-duplicate {post_id} ({similarity:.2f})")
+                    self.duplicate_audit.record(post_id, matched_post_id, similarity, 'reuse', 'reused',
+                                                sentiment=sentiment, sentiment_score=sentiment_score)
+                else:
+                    if match is not None:
+                        self.duplicate_audit.record(post_id, match[0], match[1], self.near_duplicate_policy, 'logged')
+                
+                    summary = summary_obj.summarize_text(description, deadline=deadline)
+                    sentiment, sentiment_score = sentiment_analyzer.predict(summary)
+                
+                    # Calculating deepseek and openAI sentiment
+                    sentiment, sentiment_score = reasoning.predict_sentiment(summary, sentiment_score, deadline=deadline)
+            
+                if check_duplicates:
+                    self.duplicate_index.add(post_id, description, {
+                        "summary": summary,
+                        "sentiment": sentiment,
+                        "sentiment_score": sentiment_score
+                    }, signature=signature)
                         
-            # Saving into DB
-            new_row = {
-                "post_id": post_id,
-                "coin": coin,
-                "description": description,
-                "summary": summary,
-                "sentiment": sentiment,
-                "sentiment_score": sentiment_score,
-                "text_verify": text_verify
-            }
-            if post_id not in list(proposal_post_all['post_id']):
-                proposal_post_all = pd.concat([proposal_post_all, pd.DataFrame([new_row])], ignore_index=True) 
-        
-            proposal_post_all.to_csv(self.config['data_dir'] + '/proposal_post_all.csv')
+                # Saving into DB
+                new_row = {
+                    "timestamp": timestamp,
+                    "post_id": post_id,
+                    "coin": coin,
+                    "description": description,
+                    "summary": summary,
+                    "sentiment": sentiment,
+                    "sentiment_score": sentiment_score,
+                    "text_verify": text_verify
+                }
+                if post_id not in list(proposal_post_all['post_id']):
+                    proposal_post_all = pd.concat([proposal_post_all, pd.DataFrame([new_row])], ignore_index=True) 
+        
+                proposal_post_all.to_csv(self.config['data_dir'] + '/proposal_post_all.csv')
+                analysed.append({
+                    "post_id": post_id,
+                    "description": description,
+                    "coin": coin,
+                    "timestamp": timestamp,
+                    "sentiment": sentiment,
+                    "sentiment_score": sentiment_score
+                })
             
-            # Store into proposal_post_id 
-            new_row1 = {
-                "post_id": post_id
-            }
-            if post_id not in list(proposal_post_id['post_id']):
-                proposal_post_id = pd.concat([proposal_post_id, pd.DataFrame([new_row1])], ignore_index=True)
+                # Mark as processed in the seen-ID store
+                self.mark_processed(post_id)
             
-            proposal_post_id.to_csv(self.config['data_dir'] + '/proposal_post_id.csv')  
+                if deadline.expired():
+                    logger.warning(f"Abandoning proposal {post_id}: deadline passed {-deadline.remaining():.0f}s ago "
+                                   f"during analysis, no trade taken")
+                    continue
                         
-            # Get sentiment thresholds from environment variables, defaulting to 0.80 if not set
-            sentiment_score_bullish = self.config.get('sentiment_score_bullish', 0.80)
-            sentiment_score_bearish = self.config.get('sentiment_score_bearish', 0.80)
-            # Taking trade from here
-            if sentiment == 'positive' and sentiment_score >= sentiment_score_bullish and text_verify == 'genuine' and not btc_price_check(self.config): 
-                # Making an object for bullish price prediction
-                bullish_predictor = RobertaForRegressionBullish(self.config['bullish_dir'])
-                target_price = bullish_predictor.predict(summary)[0]
+                # Get sentiment thresholds from environment variables, defaulting to 0.80 if not set
+                sentiment_score_bullish = self.config.get('sentiment_score_bullish', 0.80)
+                sentiment_score_bearish = self.config.get('sentiment_score_bearish', 0.80)
+                # Taking trade from here
+                if sentiment == 'positive' and sentiment_score >= sentiment_score_bullish and text_verify == 'genuine' and not btc_price_check(self.config): 
+                    # Making an object for bullish price prediction (torch is only imported when a trade is likely)
+                    from models.bullish_price import RobertaForRegressionBullish
+                    bullish_predictor = RobertaForRegressionBullish(self.config['bullish_dir'])
+                    target_price = bullish_predictor.predict(summary)[0]
                 
-                if post_id not in live_post_ids:
-                    self.send_new_post_slack(coin, post_id, discussion_link, sentiment, sentiment_score, target_price, summary, slack_bot)
+                    if post_id not in live_post_ids:
+                        self.send_new_post_slack(coin, post_id, discussion_link, sentiment, sentiment_score, target_price, summary, slack_bot)
                 
-                check_status = self.check_trade_limit(coin)
-                if check_status:
-                    # Divide by 100 because target profit is in number ex 5 bringing it to 0.05
-                    buying_price, trade_id, stop_loss_price, stop_loss_orderID, target_orderId, targetPrice, quantity = self.binance_api.create_buy_order_long(coin, target_price/100)
-                    buying_time = format_time_utc()
-                    print("---------------TRADE BOUGHT---------------------")
+                    check_status = self.check_trade_limit(coin)
+                    if check_status:
+                        # Divide by 100 because target profit is in number ex 5 bringing it to 0.05
+                        try:
+                            buying_price, trade_id, stop_loss_price, stop_loss_orderID, target_orderId, targetPrice, quantity = self.binance_api.create_buy_order_long(coin, target_price/100, deadline=deadline)
+                        except DeadlineExceeded as e:
+                            logger.warning(f"Abandoning proposal {post_id}: {e}")
+                            continue
+                        buying_time = format_time_utc()
+                        print("---------------TRADE BOUGHT---------------------")
                     
-                    self.store_into_live(coin, post_id, trade_id, description, buying_price, buying_time, 
-                                        stop_loss_price, "long", stop_loss_orderID, proposal_post_live, 
-                                        target_orderId, targetPrice)
+                        self.store_into_live(coin, post_id, trade_id, description, buying_price, buying_time, 
+                                            stop_loss_price, "long", stop_loss_orderID, proposal_post_live, 
+                                            target_orderId, targetPrice)
                                         
-                    self.send_trade_info_slack(coin, "Long", buying_price, stop_loss_price, targetPrice, 
-                                              trade_id, stop_loss_orderID, target_orderId, quantity, slack_bot)
+                        self.send_trade_info_slack(coin, "Long", buying_price, stop_loss_price, targetPrice, 
+                                                  trade_id, stop_loss_orderID, target_orderId, quantity, slack_bot)
                     
-                    # Saving info to dynamoDB
-                    try:
-                        save_object = Save(dynamo, 'trade_table')
-                        save_object.save_to_dynamo(coin, description, sentiment_score, post_id)
-                        print("--saved to dynamoDB--")
-                    except Exception as e:
-                        print(f"Error saving to DynamoDB: {e}")
-                        slack_bot.post_error_to_slack(f"Error saving to DynamoDB: {e}")
-                        print("Continuing with remaining operations...")
+                        # Saving info to dynamoDB
+                        try:
+                            save_object = Save(dynamo, 'trade_table')
+                            save_object.save_to_dynamo(coin, description, sentiment_score, post_id)
+                            print("--saved to dynamoDB--")
+                        except Exception as e:
+                            print(f"Error saving to DynamoDB: {e}")
+                            slack_bot.post_error_to_slack(f"Error saving to DynamoDB: {e}")
+                            print("Continuing with remaining operations...")
                     
-            if sentiment == 'negative' and sentiment_score >= sentiment_score_bearish and text_verify == 'genuine' and not btc_price_check(self.config):
-                # Making an object for bearish price prediction
-                bearish_predictor = RobertaForRegressionBearish(model_path=self.config['bearish_dir'])
-                target_price = bearish_predictor.predict(summary)[0]
+                if sentiment == 'negative' and sentiment_score >= sentiment_score_bearish and text_verify == 'genuine' and not btc_price_check(self.config):
+                    # Making an object for bearish price prediction
+                    from models.bearish_price import RobertaForRegressionBearish
+                    bearish_predictor = RobertaForRegressionBearish(model_path=self.config['bearish_dir'])
+                    target_price = bearish_predictor.predict(summary)[0]
                 
-                if post_id not in live_post_ids:
-                    self.send_new_post_slack(coin, post_id, description, sentiment, sentiment_score, target_price, summary, slack_bot)
+                    if post_id not in live_post_ids:
+                        self.send_new_post_slack(coin, post_id, description, sentiment, sentiment_score, target_price, summary, slack_bot)
 
-                check_status = self.check_trade_limit(coin)
-                if check_status:
-                    # Divide by 100 because target profit is in number ex 5 bringing it to 0.05
-                    buying_price, trade_id, stop_loss_price, stop_loss_orderID, target_orderId, targetPrice, quantity = self.binance_api.create_buy_order_short(coin, target_price/100)
-                    buying_time = format_time_utc()
-                    print("---------------TRADE BOUGHT---------------------")
+                    check_status = self.check_trade_limit(coin)
+                    if check_status:
+                        # Divide by 100 because target profit is in number ex 5 bringing it to 0.05
+                        try:
+                            buying_price, trade_id, stop_loss_price, stop_loss_orderID, target_orderId, targetPrice, quantity = self.binance_api.create_buy_order_short(coin, target_price/100, deadline=deadline)
+                        except DeadlineExceeded as e:
+                            logger.warning(f"Abandoning proposal {post_id}: {e}")
+                            continue
+                        buying_time = format_time_utc()
+                        print("---------------TRADE BOUGHT---------------------")
                     
-                    self.store_into_live(coin, post_id, trade_id, description, buying_price, buying_time, 
-                                        stop_loss_price, "short", stop_loss_orderID, proposal_post_live, 
-                                        target_orderId, targetPrice)
+                        self.store_into_live(coin, post_id, trade_id, description, buying_price, buying_time, 
+                                            stop_loss_price, "short", stop_loss_orderID, proposal_post_live, 
+                                            target_orderId, targetPrice)
                                         
-                    self.send_trade_info_slack(coin, "Short", buying_price, stop_loss_price, targetPrice, 
-                                              trade_id, stop_loss_orderID, target_orderId, quantity, slack_bot)
+                        self.send_trade_info_slack(coin, "Short", buying_price, stop_loss_price, targetPrice, 
+                                                  trade_id, stop_loss_orderID, target_orderId, quantity, slack_bot)
                     
-                    # Saving info to dynamoDB
-                    try:
-                        save_object = Save(dynamo, 'trade_table')
-                        save_object.save_to_dynamo(coin, description, sentiment_score, post_id)
-                        print("--saved to dynamoDB--")
-                    except Exception as e:
-                        print(f"Error saving to DynamoDB: {e}")
-                        slack_bot.post_error_to_slack(f"Error saving to DynamoDB: {e}")
-                        print("Continuing with remaining operations...")
+                        # Saving info to dynamoDB
+                        try:
+                            save_object = Save(dynamo, 'trade_table')
+                            save_object.save_to_dynamo(coin, description, sentiment_score, post_id)
+                            print("--saved to dynamoDB--")
+                        except Exception as e:
+                            print(f"Error saving to DynamoDB: {e}")
+                            slack_bot.post_error_to_slack(f"Error saving to DynamoDB: {e}")
+                            print("Continuing with remaining operations...")
+        finally:
+            # Indexed after the trade decisions so embedding never delays an order; also when
+            # a proposal fails, so the ones already analysed and marked processed are not lost
+            self.update_embedding_index(analysed, sentiment_analyzer)
     
     def close_firebase_client(self, app):
         """
@@ -386,6 +548,7 @@ class TradeLogic:
         Args:
             app: Firebase app instance
         """
+        import firebase_admin
         firebase_admin.delete_app(app)
         print("Firebase client closed successfully.")
 
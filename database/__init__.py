@@ -21,6 +21,10 @@ logger = get_logger(__name__)
 
 from .scan_proposal import ProposalScanner, create_firebase_client, close_firebase_client
 from .scan_proposal import DataProvider, create_data_provider
+from .proposal_listener import ProposalListener, ListenerUnavailable
+from .proposal_record import ProposalRecord, ProposalBatch
+from .async_provider import AsyncDataProvider, ThreadedDataProvider, create_async_data_provider
+from .composite_provider import CompositeDataProvider
 
 # Register MongoDB provider if available
 try:
@@ -37,6 +41,8 @@ try:
         elif provider_type == 'firebase':
             logger.info("Using Firebase provider as specified")
             return original_create_provider(provider_type, config)
+        elif provider_type == 'replay' or ',' in provider_type:
+            return original_create_provider(provider_type, config)
         else:
             logger.warning(f"Provider type '{provider_type}' not recognized, using default provider")
             return original_create_provider(provider_type, config)
@@ -56,5 +62,13 @@ __all__ = [
     'create_firebase_client',
     'close_firebase_client',
     'DataProvider',
-    'create_data_provider'
+    'create_data_provider',
+    'ProposalListener',
+    'ListenerUnavailable',
+    'ProposalRecord',
+    'ProposalBatch',
+    'AsyncDataProvider',
+    'ThreadedDataProvider',
+    'create_async_data_provider',
+    'CompositeDataProvider'
 ] 
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Asynchronous data provider interface with streaming downloads.
+
+AsyncDataProvider.download_proposals is an async generator yielding
+ProposalRecords as the backend returns them, so a consumer can start on the
+first proposal before the query finishes. ThreadedDataProvider adapts any
+synchronous DataProvider by running its blocking calls and its
+stream_proposals() generator on a worker thread.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from database.proposal_record import ProposalBatch, select_new
+from database.seen_ids import get_seen_ids
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Marks the end of a stream in the queue between the worker thread and the event loop
+_DONE = object()
+
+
+class _StreamError:
+    """Carries an exception raised by the worker thread to the consumer."""
+
+    __slots__ = ('error',)
+
+    def __init__(self, error):
+        self.error = error
+
+
+async def _drain(queue):
+    while True:
+        await queue.get()
+
+
+class AsyncDataProvider:
+    """
+    Base class for asynchronous data providers.
+    """
+
+    async def connect(self):
+        """Connect to the data source. Return connection object."""
+        raise NotImplementedError("Subclasses must implement connect()")
+
+    async def disconnect(self, connection):
+        """Disconnect from the data source."""
+        raise NotImplementedError("Subclasses must implement disconnect()")
+
+    async def download_proposals(self, connection, scan_mode=True):
+        """
+        Stream proposals from the data source.
+
+        Args:
+            connection: Connection object from connect()
+            scan_mode: If True, limit to recent proposals, otherwise get more
+
+        Yields:
+            ProposalRecord: One record per proposal and protocol
+        """
+        raise NotImplementedError("Subclasses must implement download_proposals()")
+        yield
+
+    async def collect_proposals(self, connection, scan_mode=True):
+        """
+        Drain download_proposals into the synchronous format.
+
+        Args:
+            connection: Connection object from connect()
+            scan_mode: If True, limit to recent proposals, otherwise get more
+
+        Returns:
+            dict: ProposalBatch of proposals keyed by protocol, in order of first appearance
+        """
+        proposal_dict = {}
+        async for record in self.download_proposals(connection, scan_mode):
+            proposal_dict.setdefault(record.protocol, ProposalBatch()).append(record)
+        return proposal_dict
+
+    def check_new_proposals(self, proposals_dict, existing_data_path):
+        """
+        Check for new proposals not in existing data.
+
+        Args:
+            proposals_dict (dict): ProposalBatch of proposals keyed by protocol
+            existing_data_path: Path of the seen-ID store (see database.seen_ids); a missing
+                store counts every proposal as new
+
+        Returns:
+            ProposalBatch: New proposals, once each
+        """
+        seen_ids = get_seen_ids(existing_data_path)
+        new_proposals = select_new(proposals_dict, seen_ids)
+        logger.info(f"Found {len(new_proposals)} new proposals")
+        return new_proposals
+
+    def commit_watermark(self):
+        """Persist the newest document seen, once the fetched proposals have been processed."""
+
+
+class ThreadedDataProvider(AsyncDataProvider):
+    """
+    Async adapter running a synchronous DataProvider on worker threads.
+
+    Records cross from the worker thread to the event loop through a bounded
+    queue, so a slow consumer pauses the backend read instead of buffering
+    the whole result.
+    """
+
+    def __init__(self, provider, queue_size=64):
+        """
+        Initialize the adapter.
+
+        Args:
+            provider (DataProvider): Synchronous provider to wrap, e.g. FirebaseDataProvider
+            queue_size (int): Records buffered ahead of the consumer
+        """
+        self.provider = provider
+        self.queue_size = queue_size
+        self.logger = get_logger(f"{__name__}.ThreadedDataProvider")
+
+    async def connect(self):
+        # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+        return await asyncio.get_running_loop().run_in_executor(None, self.provider.connect)
+
+    async def disconnect(self, connection):
+        await asyncio.get_running_loop().run_in_executor(None, self.provider.disconnect, connection)
+
+    async def download_proposals(self, connection, scan_mode=True):
+        """
+        Stream the wrapped provider's stream_proposals() from a worker thread.
+
+        Closing the generator early stops the worker after its current record.
+
+        Args:
+            connection: Connection object from connect()
+            scan_mode: If True, limit to recent proposals, otherwise get more
+
+        Yields:
+            ProposalRecord: One record per proposal and protocol
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(self.queue_size)
+        stopped = threading.Event()
+
+        def put(item):
+            # Blocks the worker while the queue is full
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce():
+            records = self.provider.stream_proposals(connection, scan_mode)
+            try:
+                for record in records:
+                    if stopped.is_set():
+                        return
+                    put(record)
+                put(_DONE)
+            except Exception as e:
+                put(_StreamError(e))
+            finally:
+                records.close()
+
+        worker = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _StreamError):
+                    raise item.error
+                yield item
+        finally:
+            stopped.set()
+            # Keep taking records so a worker blocked on a full queue can reach the `stopped` check
+            drain = asyncio.ensure_future(_drain(queue))
+            try:
+                await worker
+            finally:
+                drain.cancel()
+
+    def check_new_proposals(self, proposals_dict, existing_data_path):
+        return self.provider.check_new_proposals(proposals_dict, existing_data_path)
+
+    def commit_watermark(self):
+        self.provider.commit_watermark()
+
+
+def create_async_data_provider(provider_type, config):
+    """
+    Create an async provider wrapping the synchronous provider of the given type.
+
+    Args:
+        provider_type (str): Type of data provider ('firebase', 'mongodb')
+        config (dict): Configuration for the provider
+
+    Returns:
+        ThreadedDataProvider: Async adapter around the provider
+    """
+    from database import create_data_provider
+
+    return ThreadedDataProvider(create_data_provider(provider_type, config))
@@ -0,0 +1,165 @@
+"""
+Resumable backfill of the proposal history.
+
+The initial load pages through the whole proposal collection, oldest first,
+with start_after cursors. Every page's proposal IDs are appended to the
+seen-ID store before a checkpoint records the cursor after that page, so an
+interrupted backfill resumes where it stopped instead of starting over.
+"""
+
+import json
+import os
+import sys
+import time
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from database.seen_ids import get_seen_ids, seen_ids_path
+from database.watermark import encode_value, decode_value
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+CHECKPOINT_FILE = 'backfill_checkpoint.json'
+
+
+class Backfill:
+    """
+    Pages a data provider's whole proposal history into the seen-ID file.
+    """
+
+    def __init__(self, data_provider, data_dir, page_size=500, clock=time.monotonic):
+        """
+        Initialize the backfill.
+
+        Args:
+            data_provider (DataProvider): Provider implementing backfill_pages()
+            data_dir (str): Directory holding the seen-ID store and the checkpoint
+            page_size (int): Documents requested per page
+            clock (callable): Monotonic clock in seconds, replaceable in tests
+        """
+        self.data_provider = data_provider
+        self.data_dir = data_dir
+        self.page_size = page_size
+        self.clock = clock
+        self.checkpoint_path = os.path.join(data_dir, CHECKPOINT_FILE)
+        self.seen_ids = get_seen_ids(seen_ids_path(data_dir))
+
+    @staticmethod
+    def is_pending(data_dir):
+        """
+        Check whether a backfill in `data_dir` was interrupted before it completed.
+
+        Args:
+            data_dir (str): Data directory
+
+        Returns:
+            bool: True if an incomplete checkpoint exists
+        """
+        path = os.path.join(data_dir, CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return False
+        with open(path, 'r') as f:
+            return not json.load(f).get('complete', False)
+
+    def load_checkpoint(self):
+        """
+        Load the checkpoint of an interrupted backfill.
+
+        Returns:
+            dict: Checkpoint with the decoded cursor, or None to start from scratch
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, 'r') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('complete'):
+            return None
+        cursor = checkpoint.get('cursor')
+        checkpoint['cursor'] = (decode_value(cursor['created_at']), cursor['doc_id']) if cursor else None
+        return checkpoint
+
+    def save_checkpoint(self, cursor, documents, rows, pages, elapsed, complete=False):
+        """
+        Atomically record progress after a page has been written.
+
+        Args:
+            cursor (tuple): (created_at, document id) of the last document written
+            documents (int): Documents fetched so far
+            rows (int): IDs in the seen-ID store
+            pages (int): Pages fetched so far
+            elapsed (float): Seconds spent fetching so far, across resumptions
+            complete (bool): True once the whole collection has been read
+        """
+        checkpoint = {
+            'cursor': {'created_at': encode_value(cursor[0]), 'doc_id': cursor[1]} if cursor else None,
+            'documents': documents,
+            'rows': rows,
+            'pages': pages,
+            'elapsed': elapsed,
+            'complete': complete,
+        }
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def run(self, connection, restart=False, max_pages=None):
+        """
+        Backfill the proposal history, resuming an interrupted run unless `restart` is set.
+
+        Args:
+            connection: Connection object from the provider's connect()
+            restart (bool): Discard an incomplete checkpoint and start over
+            max_pages (int, optional): Stop after this many pages in this call, leaving the checkpoint open
+
+        Returns:
+            dict: documents, rows, pages, seconds, docs_per_second and complete
+        """
+        os.makedirs(self.data_dir, exist_ok=True)
+        checkpoint = None if restart else self.load_checkpoint()
+        if checkpoint is None:
+            cursor, documents, pages, elapsed = None, 0, 0, 0.0
+            self.seen_ids.replace([])
+            logger.info(f"Starting backfill in pages of {self.page_size}")
+        else:
+            # IDs appended after the last checkpoint are fetched again, and re-adding them is a no-op
+            cursor, documents, pages, elapsed = (checkpoint['cursor'], checkpoint['documents'],
+                                                 checkpoint['pages'], checkpoint['elapsed'])
+            logger.info(f"Resuming backfill after {documents} documents in {pages} pages")
+
+        complete = True
+        started = self.clock()
+        pages_this_run = 0
+        for proposal_dict, page_cursor, count in self.data_provider.backfill_pages(connection, cursor, self.page_size):
+            self.seen_ids.add_many(post_id for batch in proposal_dict.values() for post_id in batch.post_ids())
+            cursor = page_cursor
+            documents += count
+            pages += 1
+            pages_this_run += 1
+            seconds = elapsed + self.clock() - started
+            self.save_checkpoint(cursor, documents, len(self.seen_ids), pages, seconds)
+            logger.info(f"Backfilled {documents} documents in {pages} pages "
+                        f"({documents / seconds if seconds else 0:.0f} docs/s)")
+            if max_pages is not None and pages_this_run >= max_pages:
+                complete = False
+                break
+
+        seconds = elapsed + self.clock() - started
+        rows = len(self.seen_ids)
+        if complete:
+            self.save_checkpoint(cursor, documents, rows, pages, seconds, complete=True)
+            self.data_provider.commit_watermark()
+            logger.info(f"Backfill complete: {rows} proposals from {documents} documents in {seconds:.1f}s")
+
+        return {
+            'documents': documents,
+            'rows': rows,
+            'pages': pages,
+            'seconds': seconds,
+            'docs_per_second': documents / seconds if seconds else 0.0,
+            'complete': complete,
+        }
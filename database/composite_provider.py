@@ -0,0 +1,221 @@
+"""
+Data provider merging several proposal sources.
+
+CompositeDataProvider queries every configured provider concurrently on a
+thread pool and merges their proposals, keeping each post_id once. Records
+are tagged with the source that delivered them first, and per-source
+latency is kept in rolling windows.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from database.scan_proposal import DataProvider
+from database.proposal_record import ProposalBatch
+from utils.logging_utils import get_logger
+from utils.metrics import RollingWindow
+
+
+class SourceStats:
+    """
+    Rolling fetch statistics of one source.
+    """
+
+    def __init__(self, window_size=500):
+        """
+        Initialize the statistics.
+
+        Args:
+            window_size (int): Number of recent fetches kept
+        """
+        self.calls = 0
+        self.errors = 0
+        self.latency_ms = RollingWindow(window_size)
+        self.delivered = 0
+        self.first = 0
+
+    def summary(self):
+        """
+        Summarise the statistics.
+
+        Returns:
+            dict: Call and error counts, latency percentiles, and the records
+                delivered and delivered first by this source
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_ms": self.latency_ms.summary(),
+            "delivered": self.delivered,
+            "first": self.first,
+        }
+
+
+class CompositeDataProvider(DataProvider):
+    """
+    Fans every download out to several data providers and merges the results.
+
+    A source that fails to connect or download is skipped for that scan and
+    retried on the next one; the scan only fails when every source does.
+    """
+
+    def __init__(self, providers, config):
+        """
+        Initialize the composite provider.
+
+        Args:
+            providers (dict): DataProviders keyed by source name, in priority order for ties
+            config (dict): Configuration; `source_timeout` bounds the wait for the sources in seconds
+        """
+        self.providers = dict(providers)
+        self.config = config
+        self.logger = get_logger(f"{__name__}.CompositeDataProvider")
+        self.timeout = config.get('source_timeout') or None
+        self._stats = {name: SourceStats() for name in self.providers}
+        self._stats_lock = threading.Lock()
+        # Sources whose proposals the last download merged
+        self._merged_sources = []
+        self._executor = ThreadPoolExecutor(max_workers=len(self.providers), thread_name_prefix="source")
+
+    def connect(self):
+        """
+        Connect to every source.
+
+        Returns:
+            dict: Connection per source name, None for sources that failed to connect
+        """
+        connection = {}
+        for name, provider in self.providers.items():
+            connection[name] = self._connect_source(name, provider)
+        return connection
+
+    def _connect_source(self, name, provider):
+        try:
+            return provider.connect()
+        except Exception as e:
+            self.logger.error(f"Could not connect to source {name}: {e}")
+            return None
+
+    def disconnect(self, connection):
+        """Disconnect from every connected source."""
+        for name, provider in self.providers.items():
+            if connection.get(name) is None:
+                continue
+            try:
+                provider.disconnect(connection[name])
+            except Exception as e:
+                self.logger.warning(f"Error disconnecting from source {name}: {e}")
+            connection[name] = None
+
+    def _download_source(self, name, connection, scan_mode):
+        """Download from one source, timing the call."""
+        provider = self.providers[name]
+        if connection.get(name) is None:
+            connection[name] = self._connect_source(name, provider)
+            if connection[name] is None:
+                raise ConnectionError(f"source {name} is not connected")
+        started = time.perf_counter()
+        try:
+            return provider.download_proposals(connection[name], scan_mode)
+        finally:
+            with self._stats_lock:
+                stats = self._stats[name]
+                stats.calls += 1
+                stats.latency_ms.add((time.perf_counter() - started) * 1000.0)
+
+    def download_proposals(self, connection, scan_mode=True):
+        """
+        Download from every source concurrently and merge the proposals.
+
+        Results are merged in the order the sources finish. A post_id keeps
+        the records of the first source that delivered it, tagged with that
+        source's name; later copies from other sources are dropped.
+
+        Args:
+            connection (dict): Connections from connect()
+            scan_mode: If True, limit to recent proposals, otherwise get more
+
+        Returns:
+            dict: ProposalBatch of proposals keyed by protocol
+
+        Raises:
+            Exception: The last source's error, if every source failed
+        """
+        futures = {self._executor.submit(self._download_source, name, connection, scan_mode): name
+                   for name in self.providers}
+        merged = {}
+        owners = {}
+        self._merged_sources = []
+        error = None
+        try:
+            for future in as_completed(futures, timeout=self.timeout):
+                name = futures[future]
+                try:
+                    proposal_dict = future.result()
+                except Exception as e:
+                    error = e
+                    with self._stats_lock:
+                        self._stats[name].errors += 1
+                    self.logger.error(f"Download from source {name} failed: {e}")
+                    continue
+                self._merge(name, proposal_dict, merged, owners)
+                self._merged_sources.append(name)
+        except FuturesTimeoutError as e:
+            error = e
+            late = [name for future, name in futures.items() if not future.done()]
+            with self._stats_lock:
+                for name in late:
+                    self._stats[name].errors += 1
+            self.logger.error(f"Sources {', '.join(late)} did not answer within {self.timeout}s")
+
+        if not self._merged_sources and error is not None:
+            raise error
+        self.logger.info(f"Merged {len(owners)} proposals from {len(self._merged_sources)} of "
+                         f"{len(self.providers)} sources")
+        return merged
+
+    def _merge(self, name, proposal_dict, merged, owners):
+        """Add a source's proposals whose post_id no other source delivered first."""
+        delivered = first = 0
+        for protocol, batch in proposal_dict.items():
+            target = merged.setdefault(protocol, ProposalBatch())
+            for record in batch:
+                delivered += 1
+                owner = owners.setdefault(record.post_id, name)
+                if owner != name:
+                    continue
+                if record.source is None:
+                    record.source = name
+                target.append(record)
+                first += 1
+        with self._stats_lock:
+            self._stats[name].delivered += delivered
+            self._stats[name].first += first
+
+    def commit_watermark(self):
+        """
+        Commit the watermark of every source merged by the last download.
+
+        A source that failed or timed out keeps its watermark, so its
+        documents are fetched again on the next scan.
+        """
+        for name in self._merged_sources:
+            self.providers[name].commit_watermark()
+
+    def source_stats(self):
+        """
+        Get fetch statistics per source.
+
+        Returns:
+            dict: SourceStats summary keyed by source name
+        """
+        with self._stats_lock:
+            return {name: stats.summary() for name, stats in self._stats.items()}
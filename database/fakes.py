@@ -0,0 +1,850 @@
+"""
+In-memory stand-ins for the Firestore and MongoDB clients, for tests,
+benchmarks and offline runs.
+
+FakeFirestoreClient implements the subset of the google-cloud-firestore API
+the data providers use: collections, documents, filters, ordering, cursors,
+limits and snapshot listeners. FakeMongoClient implements the subset of
+PyMongo they use: inserts, indexes, the aggregation stages of
+MongoDataProvider's pipelines and, when created with replica_set=True,
+change streams of inserts. synthetic_proposals generates proposal
+documents to load into either.
+"""
+
+import bisect
+import copy
+import enum
+import functools
+import itertools
+import operator
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda value, options: value in options,
+}
+
+
+class ChangeType(enum.Enum):
+    """Kinds of document change delivered to snapshot listeners."""
+    ADDED = 1
+    MODIFIED = 2
+    REMOVED = 3
+
+
+class FakeDocumentChange:
+    """A document change delivered to snapshot listeners."""
+
+    def __init__(self, change_type, document):
+        self.type = change_type
+        self.document = document
+
+
+class FakeWatch:
+    """Handle of a snapshot listener; `disconnect` simulates a dropped stream."""
+
+    def __init__(self, query, callback):
+        self._query = query
+        self._callback = callback
+        self.is_active = True
+
+    def unsubscribe(self):
+        self.is_active = False
+        self._query._collection._watches.discard(self)
+
+    def disconnect(self):
+        self.unsubscribe()
+
+    def _notify(self, changes):
+        if self.is_active and changes:
+            self._callback(self._query._snapshots(), changes, datetime.now(timezone.utc))
+
+
+class FakeDocumentSnapshot:
+    """Snapshot of a fake document."""
+
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+    def get(self, field_path):
+        value = self._data
+        for part in field_path.split('.'):
+            value = value[part]
+        return copy.deepcopy(value)
+
+
+class FakeDocumentReference:
+    """Reference to a document in a FakeCollectionReference."""
+
+    def __init__(self, collection, doc_id):
+        self._collection = collection
+        self.id = doc_id
+
+    @property
+    def path(self):
+        return f"{self._collection.id}/{self.id}"
+
+    def set(self, data):
+        self._collection._write(self.id, data)
+
+    def get(self):
+        return FakeDocumentSnapshot(self, self._collection._documents.get(self.id))
+
+    def delete(self):
+        self._collection._write(self.id, None)
+
+
+def _field_value(snapshot, field_path):
+    """Value of an ordering field; '__name__' orders by document ID."""
+    if field_path == '__name__':
+        return snapshot.id
+    return snapshot.get(field_path)
+
+
+def _cursor_value(value):
+    """Document references in cursors compare by their ID."""
+    return value.id if isinstance(value, FakeDocumentReference) else value
+
+
+def _first_after(items, is_after):
+    """Index of the first item for which `is_after` holds, in a list where it holds for a suffix."""
+    start, end = 0, len(items)
+    while start < end:
+        middle = (start + end) // 2
+        if is_after(items[middle]):
+            end = middle
+        else:
+            start = middle + 1
+    return start
+
+
+class FakeQuery:
+    """Immutable query over a fake collection."""
+
+    def __init__(self, collection, filters=(), orders=(), limit=None, start_after=None, fields=None):
+        self._collection = collection
+        self._filters = tuple(filters)
+        self._orders = tuple(orders)
+        self._limit = limit
+        self._start_after = start_after
+        self._fields = fields
+
+    def _copy(self, **changes):
+        values = {
+            "filters": self._filters,
+            "orders": self._orders,
+            "limit": self._limit,
+            "start_after": self._start_after,
+            "fields": self._fields,
+        }
+        values.update(changes)
+        return FakeQuery(self._collection, **values)
+
+    def where(self, field_path=None, op_string=None, value=None, filter=None):
+        """Add a filter, given as arguments or as a FieldFilter-like object."""
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(filters=self._filters + ((field_path, _OPERATORS[op_string], value),))
+
+    def _matches(self, snapshot):
+        try:
+            return all(test(_field_value(snapshot, field), value) for field, test, value in self._filters)
+        except (KeyError, TypeError):
+            return False
+
+    def select(self, field_paths):
+        """Return only the given top-level fields of each document."""
+        return self._copy(fields=tuple(field_paths))
+
+    def order_by(self, field_path, direction='ASCENDING'):
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count):
+        return self._copy(limit=count)
+
+    def start_after(self, document_fields):
+        """
+        Start after a snapshot or after a dict of values for the ordered fields.
+
+        Args:
+            document_fields: FakeDocumentSnapshot or dict keyed by field path
+        """
+        if isinstance(document_fields, FakeDocumentSnapshot):
+            values = [_field_value(document_fields, field) for field, _ in self._orders]
+        else:
+            values = [_cursor_value(document_fields[field]) for field, _ in self._orders if field in document_fields]
+        return self._copy(start_after=values)
+
+    def _compare(self, left, right):
+        """Compare two value lists under the query's ordering."""
+        for (_, direction), a, b in zip(self._orders, left, right):
+            if a != b:
+                result = -1 if a < b else 1
+                return -result if direction == 'DESCENDING' else result
+        return 0
+
+    def _ordered(self):
+        """
+        Matching (values, snapshot) pairs in query order.
+
+        Like a Firestore index, the result is kept per filters and ordering
+        and new documents are inserted into it, so paging through a large
+        collection with cursors doesn't re-sort it for every page.
+        """
+        key = (self._filters, self._orders)
+        try:
+            return self._collection._index_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Filters on unhashable values, e.g. 'in' with a list, are not cached
+            key = None
+
+        snapshots = []
+        for doc_id, data in self._collection._documents.items():
+            entry = self._entry(FakeDocumentSnapshot(FakeDocumentReference(self._collection, doc_id), data))
+            if entry is not None:
+                snapshots.append(entry)
+
+        if self._orders:
+            snapshots.sort(key=functools.cmp_to_key(lambda a, b: self._compare(a[0], b[0])))
+        if key is not None:
+            self._collection._index_cache[key] = snapshots
+        return snapshots
+
+    def _entry(self, snapshot):
+        """(values, snapshot) of a document matching the filters, or None."""
+        if snapshot._data is None or not self._matches(snapshot):
+            return None
+        try:
+            # Like Firestore, documents without an ordered field are left out
+            return [_field_value(snapshot, field) for field, _ in self._orders], snapshot
+        except (KeyError, TypeError):
+            return None
+
+    def _insert(self, snapshots, snapshot):
+        """Insert a new document into an ordered result, after those it ties with."""
+        entry = self._entry(snapshot)
+        if entry is not None:
+            snapshots.insert(_first_after(snapshots, lambda item: self._compare(item[0], entry[0]) > 0), entry)
+
+    def _snapshots(self):
+        snapshots = self._ordered()
+        start = 0
+        if self._start_after is not None:
+            # First document ordered after the cursor; a cursor may name a prefix of the ordered fields
+            start = _first_after(snapshots, lambda item: self._compare(item[0][:len(self._start_after)],
+                                                                        self._start_after) > 0)
+        stop = None if self._limit is None else start + self._limit
+        snapshots = snapshots[start:stop]
+        if self._fields is not None:
+            return [FakeDocumentSnapshot(snapshot.reference, {field: snapshot._data[field] for field in self._fields
+                                                              if field in snapshot._data})
+                    for _, snapshot in snapshots]
+        return [snapshot for _, snapshot in snapshots]
+
+    def stream(self, retry=None, timeout=None):
+        """Iterate over the matching documents."""
+        self._collection.stream_calls += 1
+        return iter(self._snapshots())
+
+    def get(self, retry=None, timeout=None):
+        return list(self.stream(retry=retry, timeout=timeout))
+
+    def on_snapshot(self, callback):
+        """
+        Listen to the query; the callback receives (documents, changes, read_time).
+
+        Like Firestore, the first call delivers every matching document as ADDED.
+        Later writes are delivered synchronously on the writing thread.
+        """
+        watch = FakeWatch(self, callback)
+        self._collection._watches.add(watch)
+        snapshots = self._snapshots()
+        callback(snapshots, [FakeDocumentChange(ChangeType.ADDED, s) for s in snapshots], datetime.now(timezone.utc))
+        return watch
+
+
+class FakeCollectionReference(FakeQuery):
+    """In-memory collection; documents keep insertion order."""
+
+    def __init__(self, collection_id):
+        self.id = collection_id
+        self._documents = {}
+        self._ids = itertools.count(1)
+        self._watches = set()
+        self._index_cache = {}
+        self.stream_calls = 0
+        super().__init__(self)
+
+    def document(self, doc_id=None):
+        return FakeDocumentReference(self, doc_id if doc_id is not None else f"auto-{next(self._ids)}")
+
+    def add(self, data):
+        reference = self.document()
+        reference.set(data)
+        return None, reference
+
+    def _write(self, doc_id, data):
+        before = self._documents.get(doc_id)
+        if data is None:
+            self._documents.pop(doc_id, None)
+        else:
+            self._documents[doc_id] = copy.deepcopy(data)
+
+        reference = FakeDocumentReference(self, doc_id)
+        old = FakeDocumentSnapshot(reference, before) if before is not None else None
+        new = FakeDocumentSnapshot(reference, self._documents[doc_id]) if data is not None else None
+        if old is None and new is not None:
+            for filters, orders in self._index_cache:
+                FakeQuery(self, filters, orders)._insert(self._index_cache[(filters, orders)], new)
+        else:
+            self._index_cache.clear()
+        for watch in list(self._watches):
+            was_in = old is not None and watch._query._matches(old)
+            is_in = new is not None and watch._query._matches(new)
+            if is_in and not was_in:
+                watch._notify([FakeDocumentChange(ChangeType.ADDED, new)])
+            elif is_in:
+                watch._notify([FakeDocumentChange(ChangeType.MODIFIED, new)])
+            elif was_in:
+                watch._notify([FakeDocumentChange(ChangeType.REMOVED, old)])
+
+    def disconnect_listeners(self):
+        """Drop every snapshot listener, as a network failure would."""
+        for watch in list(self._watches):
+            watch.disconnect()
+
+
+class FakeFirestoreClient:
+    """In-memory replacement for google.cloud.firestore.Client."""
+
+    def __init__(self):
+        self._collections = {}
+
+    def collection(self, collection_id):
+        if collection_id not in self._collections:
+            self._collections[collection_id] = FakeCollectionReference(collection_id)
+        return self._collections[collection_id]
+
+
+_MISSING = object()
+
+
+def _bson_key(value):
+    """Sort key following MongoDB's order across types: null, numbers, strings, objects, booleans, dates."""
+    if value is None or value is _MISSING:
+        return (0, 0)
+    if isinstance(value, bool):
+        return (5, value)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    if isinstance(value, dict):
+        return (3, sorted(value.items(), key=lambda item: item[0]))
+    if isinstance(value, (list, tuple)):
+        return (4, [_bson_key(item) for item in value])
+    if isinstance(value, datetime):
+        return (6, value)
+    return (7, str(value))
+
+
+def _get_path(document, path):
+    """Value at a dotted field path, or _MISSING."""
+    value = document
+    for part in path.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _comparison(test):
+    # Like MongoDB, values only compare with values of the same type
+    def check(value, bound):
+        if value is _MISSING or _bson_key(value)[0] != _bson_key(bound)[0]:
+            return False
+        try:
+            return test(value, bound)
+        except TypeError:
+            return False
+    return check
+
+
+def _equals(value, bound):
+    # A missing field equals null
+    return bound is None if value is _MISSING else value == bound
+
+
+_QUERY_OPERATORS = {
+    '$eq': _equals,
+    '$ne': lambda value, bound: not _equals(value, bound),
+    '$gt': _comparison(operator.gt),
+    '$gte': _comparison(operator.ge),
+    '$lt': _comparison(operator.lt),
+    '$lte': _comparison(operator.le),
+    '$in': lambda value, options: any(_equals(value, option) for option in options),
+    '$exists': lambda value, wanted: (value is not _MISSING) == bool(wanted),
+}
+
+
+def _is_operator_document(condition):
+    return isinstance(condition, dict) and bool(condition) and all(key.startswith('$') for key in condition)
+
+
+def _matches(document, query):
+    """Whether a document matches a $match query."""
+    for key, condition in query.items():
+        if key == '$and':
+            if not all(_matches(document, clause) for clause in condition):
+                return False
+        elif key == '$or':
+            if not any(_matches(document, clause) for clause in condition):
+                return False
+        elif key == '$nor':
+            if any(_matches(document, clause) for clause in condition):
+                return False
+        else:
+            value = _get_path(document, key)
+            if _is_operator_document(condition):
+                if not all(_QUERY_OPERATORS[op](value, bound) for op, bound in condition.items()):
+                    return False
+            elif not _equals(value, condition):
+                return False
+    return True
+
+
+def _lower_bound(query, field):
+    """
+    Smallest value of `field` a document matching `query` can have.
+
+    Returns:
+        The bound, or _MISSING if the query doesn't bound the field from below
+    """
+    bounds = []
+    for key, condition in query.items():
+        if key == '$and':
+            bounds.extend(bound for bound in (_lower_bound(clause, field) for clause in condition)
+                          if bound is not _MISSING)
+        elif key == '$or':
+            branches = [_lower_bound(clause, field) for clause in condition]
+            if branches and _MISSING not in branches:
+                bounds.append(min(branches, key=_bson_key))
+        elif key == field:
+            if not _is_operator_document(condition):
+                bounds.append(condition)
+            else:
+                bounds.extend(condition[op] for op in ('$eq', '$gt', '$gte') if op in condition)
+    return max(bounds, key=_bson_key) if bounds else _MISSING
+
+
+def _if_null(args):
+    for value in args[:-1]:
+        if value is not _MISSING and value is not None:
+            return value
+    return args[-1]
+
+
+def _array_elem_at(args):
+    array, index = args
+    if array is _MISSING or array is None:
+        return None
+    return array[index] if -len(array) <= index < len(array) else _MISSING
+
+
+def _split(args):
+    text, delimiter = args
+    return None if text is _MISSING or text is None else text.split(delimiter)
+
+
+_EXPRESSION_OPERATORS = {
+    '$ifNull': _if_null,
+    '$arrayElemAt': _array_elem_at,
+    '$split': _split,
+}
+
+
+def _evaluate(expression, document):
+    """Evaluate an aggregation expression against a document."""
+    if isinstance(expression, str) and expression.startswith('$'):
+        return _get_path(document, expression[1:])
+    if isinstance(expression, dict):
+        if len(expression) == 1 and next(iter(expression)).startswith('$'):
+            op, args = next(iter(expression.items()))
+            args = args if isinstance(args, list) else [args]
+            return _EXPRESSION_OPERATORS[op]([_evaluate(arg, document) for arg in args])
+        # Fields that evaluate to missing are left out, as in MongoDB
+        values = ((key, _evaluate(value, document)) for key, value in expression.items())
+        return {key: value for key, value in values if value is not _MISSING}
+    if isinstance(expression, list):
+        return [_evaluate(item, document) for item in expression]
+    return expression
+
+
+def _accumulate(op, values):
+    """Reduce the values of one $group accumulator."""
+    if op == '$push':
+        return [value for value in values if value is not _MISSING]
+    present = [value for value in values if value is not _MISSING and value is not None]
+    if op == '$max':
+        return max(present, key=_bson_key, default=None)
+    if op == '$min':
+        return min(present, key=_bson_key, default=None)
+    if op == '$sum':
+        return sum(value for value in present if isinstance(value, (int, float)) and not isinstance(value, bool))
+    if op == '$first':
+        return values[0] if values and values[0] is not _MISSING else None
+    if op == '$last':
+        return values[-1] if values and values[-1] is not _MISSING else None
+    raise NotImplementedError(f"Unsupported accumulator {op}")
+
+
+def _compare_documents(spec, left, right):
+    for field, direction in spec.items():
+        a, b = _bson_key(_get_path(left, field)), _bson_key(_get_path(right, field))
+        if a != b:
+            return (-1 if a < b else 1) * direction
+    return 0
+
+
+def _sort_documents(documents, spec):
+    # Stable sorts from the last key to the first give the compound order
+    documents = list(documents)
+    for field, direction in reversed(list(spec.items())):
+        documents.sort(key=lambda document: _bson_key(_get_path(document, field)), reverse=direction < 0)
+    return documents
+
+
+def _project(document, spec):
+    projected = {}
+    if spec.get('_id', 1) and '_id' in document:
+        projected['_id'] = document['_id']
+    for field, value in spec.items():
+        if field == '_id':
+            continue
+        if value is True or value == 1:
+            value = _get_path(document, field)
+        elif value is False or value == 0:
+            raise NotImplementedError("Exclusion projections are not supported")
+        else:
+            value = _evaluate(value, document)
+        if value is not _MISSING:
+            projected[field] = value
+    return projected
+
+
+def _group(documents, spec):
+    groups = {}
+    for document in documents:
+        key = _evaluate(spec['_id'], document)
+        key = None if key is _MISSING else key
+        values = groups.setdefault(repr(key), (key, {field: [] for field in spec if field != '_id'}))[1]
+        for field, accumulator in values.items():
+            (op, expression), = spec[field].items()
+            accumulator.append(_evaluate(expression, document))
+    return [dict(_id=key, **{field: _accumulate(next(iter(spec[field])), values)
+                             for field, values in accumulated.items()})
+            for key, accumulated in groups.values()]
+
+
+class FakeChangeStream:
+    """Change stream over the inserts into a FakeMongoCollection, in insert order."""
+
+    def __init__(self, collection, position, max_await_time_ms=None):
+        self._collection = collection
+        self._position = position
+        self._await_seconds = (max_await_time_ms or 1000) / 1000.0
+        self.alive = True
+
+    def try_next(self):
+        """Return the next change, or None if none arrives within max_await_time_ms."""
+        with self._collection._changed:
+            if self.alive and self._position >= len(self._collection._oplog):
+                self._collection._changed.wait(self._await_seconds)
+            if not self.alive or self._position >= len(self._collection._oplog):
+                return None
+            change = self._collection._oplog[self._position]
+            self._position += 1
+        return copy.deepcopy(change)
+
+    def close(self):
+        with self._collection._changed:
+            self.alive = False
+            self._collection._changed.notify_all()
+
+
+class FakeMongoCollection:
+    """
+    In-memory MongoDB collection.
+
+    A leading $match, $sort and $limit runs like an index scan: documents
+    are kept sorted per sort specification, with inserts placed into the
+    sorted orders, and the scan starts at the lower bound the query puts on the first sort field,
+    so paging after a cursor stays cheap on large collections.
+    """
+
+    def __init__(self, name, replica_set=False):
+        self.name = name
+        self.replica_set = replica_set
+        self._oplog = []
+        self._changed = threading.Condition()
+        self._documents = []
+        self._indexes = {'_id_': {'key': [('_id', 1)]}}
+        self._sorted_cache = {}
+        self._ids = itertools.count(1)
+        self.aggregate_calls = 0
+
+    def insert_one(self, document):
+        """Insert a document, adding an `_id` if it has none."""
+        document.setdefault('_id', next(self._ids))
+        stored = copy.deepcopy(document)
+        self._documents.append(stored)
+        for key, (documents, keys) in self._sorted_cache.items():
+            spec = dict(key)
+            position = _first_after(documents, lambda other: _compare_documents(spec, other, stored) > 0)
+            documents.insert(position, stored)
+            keys.insert(position, _bson_key(_get_path(stored, key[0][0])))
+        with self._changed:
+            self._oplog.append({'_id': {'_data': f"{len(self._oplog) + 1:016x}"}, 'operationType': 'insert',
+                                'fullDocument': copy.deepcopy(stored)})
+            self._changed.notify_all()
+        return SimpleNamespace(inserted_id=document['_id'], acknowledged=True)
+
+    def insert_many(self, documents):
+        inserted_ids = [self.insert_one(document).inserted_id for document in documents]
+        return SimpleNamespace(inserted_ids=inserted_ids, acknowledged=True)
+
+    def count_documents(self, query):
+        return sum(1 for document in self._documents if _matches(document, query))
+
+    def index_information(self):
+        return copy.deepcopy(self._indexes)
+
+    def create_index(self, keys, name=None, **kwargs):
+        if isinstance(keys, str):
+            keys = [(keys, 1)]
+        name = name or '_'.join(f"{field}_{direction}" for field, direction in keys)
+        self._indexes[name] = {'key': list(keys)}
+        return name
+
+    def _sorted(self, spec):
+        """Documents in `spec` order with the sort keys of the first field."""
+        key = tuple(spec.items())
+        if key not in self._sorted_cache:
+            documents = _sort_documents(self._documents, spec)
+            first = next(iter(spec))
+            self._sorted_cache[key] = (documents, [_bson_key(_get_path(document, first)) for document in documents])
+        return self._sorted_cache[key]
+
+    def _scan(self, query, spec, limit):
+        """Run $match, $sort and $limit by walking the sorted documents from the query's lower bound."""
+        documents, keys = self._sorted(spec)
+        start = 0
+        field, direction = next(iter(spec.items()))
+        bound = _lower_bound(query, field) if direction > 0 else _MISSING
+        if bound is not _MISSING:
+            start = bisect.bisect_left(keys, _bson_key(bound))
+        matched = []
+        for document in itertools.islice(documents, start, None):
+            if len(matched) >= limit:
+                break
+            if _matches(document, query):
+                matched.append(document)
+        return matched
+
+    def aggregate(self, pipeline, batchSize=None, **kwargs):
+        """
+        Run an aggregation pipeline.
+
+        Supports $match, $sort, $skip, $limit, $project (inclusion) and $group
+        with the $max, $min, $sum, $first, $last and $push accumulators.
+
+        Returns:
+            iterator: Result documents
+        """
+        self.aggregate_calls += 1
+        stages = list(pipeline)
+        if (len(stages) >= 3 and list(stages[0]) == ['$match'] and list(stages[1]) == ['$sort']
+                and list(stages[2]) == ['$limit']):
+            documents = self._scan(stages[0]['$match'], stages[1]['$sort'], stages[2]['$limit'])
+            stages = stages[3:]
+        else:
+            documents = self._documents
+
+        for stage in stages:
+            (name, spec), = stage.items()
+            if name == '$match':
+                documents = [document for document in documents if _matches(document, spec)]
+            elif name == '$sort':
+                documents = _sort_documents(documents, spec)
+            elif name == '$skip':
+                documents = documents[spec:]
+            elif name == '$limit':
+                documents = documents[:spec]
+            elif name == '$project':
+                documents = [_project(document, spec) for document in documents]
+            elif name == '$group':
+                documents = _group(documents, spec)
+            else:
+                raise NotImplementedError(f"Unsupported aggregation stage {name}")
+        return iter(copy.deepcopy(list(documents)))
+
+    def watch(self, pipeline=None, resume_after=None, max_await_time_ms=None, **kwargs):
+        """
+        Open a change stream of inserts, starting now or after `resume_after`.
+
+        The pipeline is ignored. Like a standalone server, a collection
+        created without replica_set fails; an unknown token fails like one
+        that fell off the oplog.
+
+        Returns:
+            FakeChangeStream: The opened stream
+        """
+        from pymongo.errors import OperationFailure
+
+        if not self.replica_set:
+            raise OperationFailure("The $changeStream stage is only supported on replica sets", code=40573)
+        with self._changed:
+            position = len(self._oplog)
+            if resume_after is not None:
+                tokens = [change['_id'] for change in self._oplog]
+                if resume_after not in tokens:
+                    raise OperationFailure("resume point may no longer be in the oplog", code=286)
+                position = tokens.index(resume_after) + 1
+        return FakeChangeStream(self, position, max_await_time_ms)
+
+
+class FakeMongoDatabase:
+    """In-memory MongoDB database; collections are created on first access."""
+
+    def __init__(self, name, replica_set=False):
+        self.name = name
+        self.replica_set = replica_set
+        self._collections = {}
+
+    def __getitem__(self, name):
+        if name not in self._collections:
+            self._collections[name] = FakeMongoCollection(name, self.replica_set)
+        return self._collections[name]
+
+    get_collection = __getitem__
+
+    def list_collection_names(self):
+        return list(self._collections)
+
+
+class FakeMongoClient:
+    """
+    In-memory replacement for pymongo.MongoClient.
+
+    Args:
+        replica_set (bool): Support change streams, like a replica set; otherwise watch() fails like a standalone server
+    """
+
+    def __init__(self, replica_set=False):
+        self.replica_set = replica_set
+        self._databases = {}
+        self.closed = False
+
+    def __getitem__(self, name):
+        if name not in self._databases:
+            self._databases[name] = FakeMongoDatabase(name, self.replica_set)
+        return self._databases[name]
+
+    get_database = __getitem__
+
+    def close(self):
+        self.closed = True
+
+
+def synthetic_proposals(n_docs, n_protocols=50, snapshot_share=0.6, start=None, spacing_seconds=60, seed=0):
+    """
+    Generate proposal documents across many protocols, oldest first.
+
+    Protocol names are zero-padded so that none is contained in another,
+    which keeps the Firestore `house_id` matching one protocol per document.
+
+    Args:
+        n_docs (int): Number of documents
+        n_protocols (int): Number of protocols
+        snapshot_share (float): Share of documents that are snapshot proposals; the rest are forum posts
+        start (datetime, optional): Creation time of the first document
+        spacing_seconds (float): Seconds between consecutive documents
+        seed (int): Random seed
+
+    Returns:
+        list: Dicts with post_id, protocol, post_type, created_at, title,
+            description and, for most documents, discussion_link
+    """
+    rng = random.Random(seed)
+    start = start or datetime(2026, 1, 1, tzinfo=timezone.utc)
+    protocols = [f"protocol{i:05d}" for i in range(n_protocols)]
+    proposals = []
+    for i in range(n_docs):
+        protocol = rng.choice(protocols)
+        proposal = {
+            "post_id": f"{protocol}--{i}",
+            "protocol": protocol,
+            "post_type": "snapshot_proposal" if rng.random() < snapshot_share else "discourse_post",
+            "created_at": start + timedelta(seconds=i * spacing_seconds),
+            "title": f"Proposal {i}",
+            "description": f"<p>Proposal {i} for <b>{protocol}</b>: adjust parameters.</p>",
+        }
+        if rng.random() < 0.9:
+            proposal["discussion_link"] = f"https://forum.example.org/t/{i}"
+        proposals.append(proposal)
+    return proposals
+
+
+def load_firestore(client, proposals, collection_id='ai_posts'):
+    """
+    Write synthetic proposals into a FakeFirestoreClient as FirebaseDataProvider reads them.
+
+    Args:
+        client (FakeFirestoreClient): Target client
+        proposals (iterable): Dicts from synthetic_proposals
+        collection_id (str): Collection to write to
+    """
+    collection = client.collection(collection_id)
+    for proposal in proposals:
+        data = {
+            "id": proposal["post_id"],
+            "house_id": f"{proposal['protocol']}.eth",
+            "post_type": proposal["post_type"],
+            "created_at": proposal["created_at"],
+            "title": proposal["title"],
+            "description": proposal["description"],
+        }
+        if "discussion_link" in proposal:
+            data["post_url_link"] = proposal["discussion_link"]
+        collection.document(proposal["post_id"]).set(data)
+
+
+def load_mongo(client, proposals, db_name='governance_data'):
+    """
+    Insert synthetic proposals into the proposals collection of a FakeMongoClient.
+
+    Args:
+        client (FakeMongoClient): Target client
+        proposals (iterable): Dicts from synthetic_proposals
+        db_name (str): Database holding the proposals collection
+    """
+    client[db_name]['proposals'].insert_many(dict(proposal) for proposal in proposals)
@@ -1,8 +1,9 @@
 import pandas as pd
+import json
 import os
 import sys
-from datetime import datetime
-from pymongo import MongoClient
+import threading
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 import logging
 
@@ -12,7 +13,133 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 from .scan_proposal import DataProvider
+from .proposal_listener import ProposalListener, ListenerUnavailable
+from .proposal_record import ProposalRecord, ProposalBatch
+from .watermark import sort_key
 from utils.logging_utils import get_logger
+from utils.clean_html import get_html_cleaner
+
+# Server error codes: change streams need a replica set, and a resume token can fall off the oplog
+CHANGE_STREAM_UNSUPPORTED = 40573
+CHANGE_STREAM_HISTORY_LOST = 286
+
+
+class ResumeToken:
+    """
+    Change-stream resume token, persisted as JSON once its events have been processed.
+    
+    Like the watermark, the token only moves on `commit`, so a restart resumes
+    right after the last insert the bot actually handled.
+    """
+    
+    def __init__(self, path):
+        """
+        Initialize the token, loading it from `path` if it exists.
+        
+        Args:
+            path (str): JSON file holding the committed token
+        """
+        self.path = path
+        self.value = None
+        self._pending = None
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self.value = json.load(f).get('resume_token')
+    
+    def observe(self, token):
+        """Record the token of a delivered event; events arrive in oplog order."""
+        with self._lock:
+            self._pending = token
+    
+    def commit(self):
+        """
+        Persist the newest observed token.
+        
+        Returns:
+            bool: True if the token moved
+        """
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if pending is None or pending == self.value:
+                return False
+            self.value = pending
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'resume_token': pending}, f)
+            os.replace(tmp_path, self.path)
+            return True
+    
+    def clear(self):
+        """Forget the token, e.g. after it fell off the oplog."""
+        with self._lock:
+            self.value = None
+            self._pending = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class ChangeEvent:
+    """An inserted proposal delivered by the change stream."""
+    
+    __slots__ = ('id', 'document', 'resume_token')
+    
+    def __init__(self, document, resume_token):
+        self.id = document['post_id']
+        self.document = document
+        self.resume_token = resume_token
+
+
+class ChangeStreamHandle:
+    """
+    Tails a change stream on a daemon thread, handing each insert to a callback.
+    
+    Exposes `is_active` and `unsubscribe()` for ProposalListener.
+    """
+    
+    def __init__(self, stream, on_event, logger):
+        """
+        Start tailing an opened change stream.
+        
+        Args:
+            stream: pymongo ChangeStream
+            on_event (callable): Called with each change event document
+            logger: Logger for stream errors
+        """
+        self._stream = stream
+        self._on_event = on_event
+        self._logger = logger
+        self._stopped = threading.Event()
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="mongo-change-stream", daemon=True)
+        self._thread.start()
+    
+    @property
+    def is_active(self):
+        return self._thread.is_alive()
+    
+    def _run(self):
+        try:
+            while not self._stopped.is_set() and self._stream.alive:
+                # try_next returns None after max_await_time_ms, so stop requests are noticed promptly
+                change = self._stream.try_next()
+                if change is not None:
+                    self._on_event(change)
+        except Exception as e:
+            if not self._stopped.is_set():
+                self.error = e
+                self._logger.warning(f"Change stream stopped: {e}")
+    
+    def unsubscribe(self):
+        self._stopped.set()
+        try:
+            self._stream.close()
+        except Exception as e:
+            self._logger.warning(f"Error closing change stream: {e}")
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=5)
+
 
 class MongoDataProvider(DataProvider):
     """
@@ -21,13 +148,34 @@ class MongoDataProvider(DataProvider):
     This provider connects to a MongoDB database and retrieves proposal data.
     """
     
+    # Only snapshot proposals are traded, as with the Firebase provider
+    POST_TYPE = 'snapshot_proposal'
+    
+    # The only fields read from each proposal document
+    PROJECTED_FIELDS = ('post_id', 'protocol', 'created_at', 'title', 'description', 'discussion_link')
+    
+    WATERMARK_NAME = 'mongo'
+    
+    # Longest a change-stream getMore waits on the server before returning empty
+    CHANGE_STREAM_AWAIT_MS = 500
+    
     def __init__(self, config):
         """Initialize the MongoDB provider with configuration."""
         self.config = config
         self.logger = get_logger(f"{__name__}.MongoDataProvider")
+        self._indexes_checked = False
+        self._resume_token = None
+    
+    def _get_database(self, connection):
+        """Get the database from a MongoDB client or a (client, db) tuple."""
+        if isinstance(connection, tuple):
+            return connection[1]
+        return connection[self.config.get('mongo_db_name', 'governance_data')]
     
     def connect(self):
         """Connect to MongoDB and return the client."""
+        from pymongo import MongoClient
+        
         connection_string = self.config.get('mongo_connection_string', 'mongodb://localhost:27017/')
         db_name = self.config.get('mongo_db_name', 'governance_data')
         
@@ -57,107 +205,409 @@ class MongoDataProvider(DataProvider):
         Returns:
             dict: Dictionary containing proposal data by protocol
         """
-        # Handle connection as either a client object or a tuple
-        if isinstance(connection, tuple):
-            client, db = connection
+        collection = self._get_database(connection)['proposals']
+        self.ensure_indexes(collection)
+        
+        batch_size = self.config.get('mongo_batch_size', 200)
+        watermark = self.get_watermark()
+        protocol_rows = {}
+        
+        if scan_mode and watermark.is_set():
+            # Page through everything after the watermark, oldest first, until caught up
+            page_size = self.config.get('watermark_page_size', 100)
+            fetched = 0
+            pages = 0
+            for page, _ in self.iter_pages(collection, (watermark.created_at, watermark.doc_id), page_size, protocol_rows):
+                pages += 1
+                fetched += len(page)
+            self.logger.info(f"Fetched {fetched} documents in {pages} page(s) since {watermark}")
         else:
-            # If connection is just a MongoDB client directly, use it
-            client = connection
-            db_name = self.config.get('mongo_db_name', 'governance_data')
-            db = client[db_name]
+            # Filtering, projection and grouping all run on the server
+            cursor = collection.aggregate(self.build_scan_pipeline(scan_mode), batchSize=batch_size)
+            self._collect_rows(cursor, protocol_rows)
         
-        collection = db['proposals']
+        return self._build_batches(protocol_rows)
+    
+    def stream_proposals(self, connection, scan_mode=True):
+        """
+        Yield proposals as MongoDB returns them.
         
-        # Limit the number of documents based on scan_mode
-        limit = 20 if scan_mode else 1000
+        After the watermark, each page is yielded as soon as it arrives;
+        otherwise each protocol group is yielded as the cursor returns it.
+        
+        Args:
+            connection: Either a MongoDB client or a tuple (client, db)
+            scan_mode: If True, limit to recent proposals, otherwise get more
+            
+        Yields:
+            ProposalRecord: One record per proposal
+        """
+        collection = self._get_database(connection)['proposals']
+        self.ensure_indexes(collection)
         
-        self.logger.info(f"Downloading proposals from MongoDB (limit: {limit})")
+        watermark = self.get_watermark()
+        protocol_rows = {}
+        if scan_mode and watermark.is_set():
+            page_size = self.config.get('watermark_page_size', 100)
+            for _ in self.iter_pages(collection, (watermark.created_at, watermark.doc_id), page_size, protocol_rows):
+                for rows in protocol_rows.values():
+                    yield from rows
+                protocol_rows.clear()
+        else:
+            batch_size = self.config.get('mongo_batch_size', 200)
+            for group in collection.aggregate(self.build_scan_pipeline(scan_mode), batchSize=batch_size):
+                self._collect_rows([group], protocol_rows)
+                yield from protocol_rows.pop(group['_id'])
+    
+    def build_scan_pipeline(self, scan_mode):
+        """
+        Build the pipeline for a scan without a watermark, or for a full download.
         
-        # Get documents ordered by timestamp
-        cursor = collection.find().sort('created_at', -1).limit(limit)
+        Args:
+            scan_mode (bool): If True, the 20 newest proposals within the scan window, otherwise up to 1000
+            
+        Returns:
+            list: Aggregation pipeline stages
+        """
+        limit = 20 if scan_mode else 1000
+        window_hours = self.config.get('mongo_scan_window_hours', 168.0) if scan_mode else 0
+        since = datetime.now(timezone.utc) - timedelta(hours=window_hours) if window_hours else None
         
-        # Process documents similar to Firebase provider
-        protocol_list = []
-        docs_list = []
+        self.logger.info(f"Downloading proposals from MongoDB (limit: {limit}, window: {window_hours or 'none'}h)")
+        return self.build_pipeline(limit, since)
+    
+    def iter_pages(self, collection, after, page_size, protocol_rows):
+        """
+        Fetch proposals in (created_at, post_id) order, one page at a time, until a short page.
         
-        for doc in cursor:
-            # Extract protocol from post_id or use a field in your database
-            protocol = doc['post_id'].split('--')[0] if 'post_id' in doc else doc.get('protocol', 'unknown')
-            if protocol not in protocol_list:
-                protocol_list.append(protocol)
-            docs_list.append(doc)
+        Args:
+            collection: The proposals collection
+            after (tuple, optional): (created_at, post_id) to start after, or None for the beginning
+            page_size (int): Documents per page
+            protocol_rows (dict): Rows per protocol, extended in place with each page
+            
+        Yields:
+            tuple: (documents, cursor) for each non-empty page, where `cursor` is
+                the (created_at, post_id) of the page's newest document
+        """
+        batch_size = self.config.get('mongo_batch_size', 200)
+        while True:
+            pipeline = self.build_pipeline(page_size, after=after, oldest_first=True)
+            page = self._collect_rows(collection.aggregate(pipeline, batchSize=batch_size), protocol_rows)
+            if page:
+                after = max(((doc.get('created_at'), doc['post_id']) for doc in page), key=lambda pair: sort_key(*pair))
+                yield page, after
+            if len(page) < page_size:
+                return
+    
+    def backfill_pages(self, connection, after=None, page_size=500):
+        """
+        Page through every proposal in the collection, oldest first.
         
-        self.logger.info(f"Found {len(docs_list)} documents across {len(protocol_list)} protocols")
+        Args:
+            connection: Either a MongoDB client or a tuple (client, db)
+            after (tuple, optional): (created_at, post_id) cursor to resume after
+            page_size (int): Documents requested per page
+            
+        Yields:
+            tuple: (proposal_dict, cursor, document_count) for each page
+        """
+        collection = self._get_database(connection)['proposals']
+        self.ensure_indexes(collection)
+        protocol_rows = {}
+        for page, cursor in self.iter_pages(collection, after, page_size, protocol_rows):
+            yield self._build_batches(protocol_rows), cursor, len(page)
+            protocol_rows.clear()
+    
+    def _build_batches(self, protocol_rows):
+        """
+        Build one ProposalBatch per protocol from collected records.
         
-        # Create a dictionary to store DataFrames by protocol
+        Args:
+            protocol_rows (dict): ProposalRecords per protocol
+            
+        Returns:
+            dict: ProposalBatch of proposals keyed by protocol
+        """
         proposal_dict = {}
+        for key, rows in protocol_rows.items():
+            proposal_dict[key] = ProposalBatch(list(rows))
+            self.logger.debug(f"Processed {len(rows)} proposals for protocol {key}")
         
-        for key in protocol_list:
-            # Create an empty DataFrame with required columns
-            discourse_df = pd.DataFrame(columns=['protocol', 'post_id', 'timestamp', 'title', 'description', 'discussion_link'])
+        self.logger.info(f"Found {sum(len(rows) for rows in protocol_rows.values())} documents "
+                         f"across {len(proposal_dict)} protocols")
+        return proposal_dict
+    
+    def get_resume_token(self):
+        """
+        Get the change-stream resume token, loading it from the data directory on first use.
+        
+        Returns:
+            ResumeToken: The persisted token
+        """
+        if self._resume_token is None:
+            path = os.path.join(self.config.get('data_dir', 'data'), 'mongo_resume_token.json')
+            self._resume_token = ResumeToken(path)
+        return self._resume_token
+    
+    def commit_watermark(self):
+        """Persist the watermark and the resume token once the delivered proposals have been processed."""
+        super().commit_watermark()
+        if self._resume_token is not None and self._resume_token.commit():
+            self.logger.debug("Committed change stream resume token")
+    
+    def build_change_stream_pipeline(self):
+        """
+        Build the change-stream pipeline: proposal inserts only, with the fields the pipeline reads.
+        
+        Returns:
+            list: Change-stream pipeline stages
+        """
+        return [
+            {'$match': {
+                'operationType': 'insert',
+                'fullDocument.post_id': {'$exists': True},
+                # None also matches documents written before post_type existed
+                'fullDocument.post_type': {'$in': [self.POST_TYPE, None]}
+            }},
+            # _id is the resume token and must be kept
+            {'$project': {'_id': 1, **{f'fullDocument.{field}': 1 for field in self.PROJECTED_FIELDS}}}
+        ]
+    
+    def listen(self, connection):
+        """
+        Tail inserts into the proposals collection with a change stream.
+        
+        Each (re)subscription resumes after the newest event delivered, or after
+        the committed resume token on a fresh start, so restarts continue where
+        they left off. A stream without a token starts at the time it opens, so
+        proposals inserted since the watermark, e.g. between the poll that runs
+        before listening and the subscription, are fetched once it is open.
+        Change streams need a replica set or sharded cluster; on a
+        standalone server this raises ListenerUnavailable and the bot keeps
+        polling from the watermark.
+        
+        Args:
+            connection: Either a MongoDB client or a tuple (client, db)
             
-            for doc in docs_list:
+        Returns:
+            ProposalListener: Listener queuing ChangeEvent objects
+            
+        Raises:
+            ListenerUnavailable: If the server doesn't support change streams
+        """
+        from pymongo.errors import OperationFailure
+        
+        collection = self._get_database(connection)['proposals']
+        resume_token = self.get_resume_token()
+        watermark = self.get_watermark()
+        latest = {'token': resume_token.value}
+        
+        def subscribe(on_documents):
+            def on_event(change):
+                latest['token'] = change['_id']
+                document = change.get('fullDocument') or {}
+                # Inserts the watermark poll already handed over are not queued again
+                if not watermark.covers(document.get('created_at'), document.get('post_id')):
+                    on_documents([ChangeEvent(document, change['_id'])])
+            
+            try:
+                stream = collection.watch(
+                    self.build_change_stream_pipeline(),
+                    resume_after=latest['token'],
+                    max_await_time_ms=self.CHANGE_STREAM_AWAIT_MS,
+                    batch_size=self.config.get('mongo_batch_size', 200)
+                )
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_UNSUPPORTED:
+                    raise ListenerUnavailable(f"MongoDB change streams are unavailable: {e}") from e
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    # Start from now; the catch-up fetch of the next subscription covers the gap
+                    self.logger.warning("Resume token is no longer in the oplog, starting a new change stream")
+                    resume_token.clear()
+                    latest['token'] = None
+                raise
+            if latest['token'] is None:
                 try:
-                    protocol = doc.get('protocol', doc['post_id'].split('--')[0])
-                    
-                    if protocol == key:
-                        post_id = doc['post_id']
-                        timestamp = doc.get('created_at', datetime.now().isoformat())
-                        title = doc.get('title', '')
-                        description = doc.get('description', '')
-                        discussion_link = doc.get('discussion_link', '')
-                        
-                        df_row = [protocol, post_id, timestamp, title, description, discussion_link]
-                        temp_df = pd.DataFrame([df_row], columns=discourse_df.columns)
-                        discourse_df = pd.concat([discourse_df, temp_df], ignore_index=True)
-                
+                    on_documents(self.catch_up_events(collection))
+                except Exception:
+                    stream.close()
+                    raise
+            return ChangeStreamHandle(stream, on_event, self.logger)
+        
+        return ProposalListener(
+            subscribe,
+            max_failures=self.config.get('listener_max_failures', 5),
+            name="MongoDB change stream"
+        )
+    
+    def catch_up_events(self, collection):
+        """
+        Fetch the proposals after the committed watermark as ChangeEvents.
+        
+        Without a watermark this fetches the same recent window as a poll. The
+        watermark itself only moves once the events have been processed.
+        
+        Args:
+            collection: The proposals collection
+            
+        Returns:
+            list: ChangeEvent objects without resume tokens, oldest first
+        """
+        watermark = self.get_watermark()
+        batch_size = self.config.get('mongo_batch_size', 200)
+        
+        def fetch(pipeline):
+            groups = collection.aggregate(pipeline, batchSize=batch_size)
+            return [dict(doc, protocol=group['_id']) for group in groups for doc in group['docs']]
+        
+        if not watermark.is_set():
+            documents = fetch(self.build_scan_pipeline(True))
+        else:
+            page_size = self.config.get('watermark_page_size', 100)
+            after = (watermark.created_at, watermark.doc_id)
+            documents = []
+            while True:
+                page = fetch(self.build_pipeline(page_size, after=after, oldest_first=True))
+                documents.extend(page)
+                if len(page) < page_size:
+                    break
+                after = max(((doc.get('created_at'), doc['post_id']) for doc in page), key=lambda pair: sort_key(*pair))
+        
+        documents.sort(key=lambda doc: sort_key(doc.get('created_at'), doc['post_id']))
+        self.logger.info(f"Caught up on {len(documents)} proposals before tailing the change stream")
+        return [ChangeEvent(doc, None) for doc in documents]
+    
+    def proposals_from_documents(self, documents):
+        """
+        Convert inserts delivered by the change stream into proposals by protocol.
+        
+        Args:
+            documents (list): ChangeEvent objects from ProposalListener.get_batch()
+            
+        Returns:
+            dict: ProposalBatch of proposals keyed by protocol
+        """
+        groups = {}
+        resume_token = self.get_resume_token()
+        for event in documents:
+            document = event.document
+            protocol = document.get('protocol') or document['post_id'].split('--')[0]
+            groups.setdefault(protocol, []).append(document)
+            # Events of the catch-up fetch carry no token
+            if event.resume_token is not None:
+                resume_token.observe(event.resume_token)
+        
+        def newest(docs):
+            return max(sort_key(doc.get('created_at'), doc['post_id']) for doc in docs)
+        
+        protocol_rows = {}
+        # Newest first within and across protocols, like the aggregation pipeline
+        ordered = sorted(groups.items(), key=lambda item: newest(item[1]), reverse=True)
+        self._collect_rows(({'_id': protocol, 'docs': docs[::-1]} for protocol, docs in ordered), protocol_rows)
+        return self._build_batches(protocol_rows)
+    
+    def _collect_rows(self, groups, protocol_rows):
+        """
+        Convert protocol groups returned by the pipeline into ProposalRecords.
+        
+        Args:
+            groups (iterable): Group documents with the protocol as `_id` and the proposals in `docs`
+            protocol_rows (dict): ProposalRecords per protocol, extended in place
+            
+        Returns:
+            list: Every proposal document in the groups
+        """
+        watermark = self.get_watermark()
+        seen = []
+        for group in groups:
+            key = group['_id']
+            rows = protocol_rows.setdefault(key, [])
+            for doc in group['docs']:
+                seen.append(doc)
+                try:
+                    post_id = doc['post_id']
+                    watermark.observe(doc.get('created_at'), post_id)
+                    timestamp = doc.get('created_at', datetime.now().isoformat())
+                    # Clean once at ingestion so the trade logic can skip it
+                    description = get_html_cleaner().clean(doc.get('description', ''), post_id)
+                    rows.append(ProposalRecord(key, post_id, timestamp, doc.get('title', ''), description,
+                                               doc.get('discussion_link', ''), True))
                 except Exception as e:
                     self.logger.error(f"Error processing MongoDB document: {e}")
                     continue
+        return seen
+    
+    def build_pipeline(self, limit, since=None, after=None, oldest_first=False):
+        """
+        Build the aggregation pipeline that selects proposals and groups them by protocol.
+        
+        Documents without a `post_type` are kept, so collections written before
+        the field existed still work. `created_at` may be stored as a BSON date
+        or an ISO-8601 string; the time window matches either.
+        
+        Args:
+            limit (int): Maximum number of proposals
+            since (datetime, optional): Only proposals created at or after this time, newest first
+            after (tuple, optional): (created_at, post_id) watermark; only later proposals, oldest first
+            oldest_first (bool): Sort oldest first even without `after`, to page from the beginning
             
-            proposal_dict[key] = discourse_df
-            self.logger.debug(f"Processed {len(discourse_df)} proposals for protocol {key}")
+        Returns:
+            list: Aggregation pipeline stages
+        """
+        conditions = [{'$or': [{'post_type': self.POST_TYPE}, {'post_type': {'$exists': False}}]}]
+        if since is not None:
+            conditions.append({'$or': [
+                {'created_at': {'$gte': since}},
+                {'created_at': {'$gte': since.isoformat()}}
+            ]})
+        if after is not None:
+            created_at, post_id = after
+            conditions.append({'$or': [
+                {'created_at': {'$gt': created_at}},
+                {'created_at': created_at, 'post_id': {'$gt': post_id}}
+            ]})
+        sort = {'created_at': 1, 'post_id': 1} if after is not None or oldest_first else {'created_at': -1}
         
-        return proposal_dict
+        return [
+            {'$match': {'post_id': {'$exists': True}, '$and': conditions}},
+            {'$sort': sort},
+            {'$limit': limit},
+            {'$project': {field: 1 for field in self.PROJECTED_FIELDS}},
+            {'$group': {
+                # The protocol field wins over the post_id prefix, as before
+                '_id': {'$ifNull': ['$protocol', {'$arrayElemAt': [{'$split': ['$post_id', '--']}, 0]}]},
+                'latest': {'$max': '$created_at'},
+                'docs': {'$push': {
+                    'post_id': '$post_id',
+                    'created_at': '$created_at',
+                    'title': '$title',
+                    'description': '$description',
+                    'discussion_link': '$discussion_link'
+                }}
+            }},
+            # Protocols in order of their newest proposal, like the client-side grouping
+            {'$sort': {'latest': -1}}
+        ]
     
-    def check_new_proposals(self, proposals_dict, existing_data_path):
+    def ensure_indexes(self, collection):
         """
-        Check for new proposals not in existing data.
+        Create the `created_at` index the pipeline sorts on, once per provider, if it is missing.
         
-        This implementation is similar to the Firebase provider since
-        the output format requirements are the same.
+        Args:
+            collection: The proposals collection
         """
+        if self._indexes_checked:
+            return
+        self._indexes_checked = True
         try:
-            proposal_post_id = list(pd.read_csv(existing_data_path, index_col=0)['post_id'])
-            self.logger.info(f"Found {len(proposal_post_id)} existing proposals in {existing_data_path}")
-        except (FileNotFoundError, pd.errors.EmptyDataError):
-            # If the file doesn't exist or is empty, treat all proposals as new
-            self.logger.warning(f"No existing proposals found at {existing_data_path}. Treating all as new.")
-            proposal_post_id = []
-        
-        columns = ["post_id", "coin", "description", "discussion_link", "timestamp"]
-        new_row_df = pd.DataFrame(columns=columns)
-        
-        for key, coin_df in proposals_dict.items():
-            for index, row in coin_df.iterrows():
-                post_id = row['post_id']
-                if post_id not in proposal_post_id:
-                    coin = post_id.split("--")[0]  # Extract coin from post_id
-                    description = row['description']
-                    discussion_link = row['discussion_link']
-                    timestamp = row['timestamp']
-                    
-                    new_row = {
-                        "post_id": post_id,
-                        "coin": coin,
-                        "description": description,
-                        "discussion_link": discussion_link,
-                        "timestamp": timestamp
-                    }
-                    new_row_df = pd.concat([new_row_df, pd.DataFrame([new_row])], ignore_index=True)
-        
-        self.logger.info(f"Found {len(new_row_df)} new proposals")
-        return new_row_df
+            indexes = collection.index_information()
+            if not any(spec['key'][0][0] == 'created_at' for spec in indexes.values()):
+                collection.create_index([('created_at', -1)], name='created_at_-1')
+                self.logger.info("Created index on proposals.created_at")
+        except Exception as e:
+            # Read-only users can still query, just without the index
+            self.logger.warning(f"Could not ensure the created_at index: {e}")
 
 # Register the provider (uncomment this to register the provider)
 # from database.scan_proposal import create_data_provider
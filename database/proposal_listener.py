@@ -0,0 +1,140 @@
+"""
+Push-based proposal feed for the Governance Trading Bot.
+
+A ProposalListener keeps a subscription to the data source open and queues
+documents as they arrive, so the bot can react within a second instead of
+waiting for the next poll. When the subscription drops it is re-established
+from the provider's committed watermark; when that keeps failing the caller
+gets ListenerUnavailable and falls back to polling.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class ListenerUnavailable(Exception):
+    """Raised when a push-based subscription can't be established or keeps failing."""
+
+
+class ProposalListener:
+    """
+    Queue of newly created proposal documents fed by a data-source subscription.
+    """
+
+    def __init__(self, subscribe, max_failures=5, backoff_seconds=1.0, max_backoff_seconds=30.0,
+                 sleep=time.sleep, name="listener"):
+        """
+        Initialize the listener without subscribing yet.
+
+        Args:
+            subscribe (callable): Called with `on_documents(documents)`; starts a subscription
+                from the committed watermark and returns a handle exposing `is_active` and `unsubscribe()`
+            max_failures (int): Consecutive failed or dropped subscriptions tolerated before giving up
+            backoff_seconds (float): Delay before the first resubscription attempt, doubled after each failure
+            max_backoff_seconds (float): Upper bound of the resubscription delay
+            sleep (callable): Sleep function, replaceable in tests
+            name (str): Name used in log messages
+        """
+        self.subscribe = subscribe
+        self.max_failures = max_failures
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.sleep = sleep
+        self.name = name
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._seen = set()
+        self._handle = None
+        self._failures = 0
+        self.subscriptions = 0
+
+    def _on_documents(self, documents):
+        """Queue documents not delivered before; called from the subscription's thread."""
+        with self._lock:
+            for document in documents:
+                if document.id in self._seen:
+                    continue
+                self._seen.add(document.id)
+                self._queue.put(document)
+
+    def ensure_active(self):
+        """
+        Subscribe, or resubscribe after the subscription dropped, backing off between attempts.
+
+        Raises:
+            ListenerUnavailable: If the subscription failed `max_failures` times in a row
+        """
+        while self._handle is None or not self._handle.is_active:
+            if self._handle is not None:
+                logger.warning(f"{self.name} subscription dropped, resubscribing from the watermark")
+                self._handle = None
+                self._failures += 1
+
+            if self._failures >= self.max_failures:
+                raise ListenerUnavailable(f"{self.name} failed {self._failures} times in a row")
+            if self._failures:
+                self.sleep(min(self.backoff_seconds * 2 ** (self._failures - 1), self.max_backoff_seconds))
+
+            try:
+                self._handle = self.subscribe(self._on_documents)
+                self.subscriptions += 1
+                logger.info(f"{self.name} subscribed (subscription #{self.subscriptions})")
+            except ListenerUnavailable:
+                raise
+            except Exception as e:
+                self._failures += 1
+                logger.warning(f"{self.name} could not subscribe: {e}")
+
+    def get_batch(self, timeout):
+        """
+        Wait for new documents.
+
+        Blocks until at least one document arrives or `timeout` passes, then
+        returns everything queued so far.
+
+        Args:
+            timeout (float): Maximum wait in seconds
+
+        Returns:
+            list: New documents, oldest arrival first; empty on timeout
+
+        Raises:
+            ListenerUnavailable: If the subscription can't be kept alive
+        """
+        self.ensure_active()
+        try:
+            batch = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            batch = []
+        if self._handle.is_active:
+            # The subscription outlived the wait, so earlier drops no longer count as a failure streak
+            self._failures = 0
+        if not batch:
+            return batch
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def stop(self):
+        """Cancel the subscription."""
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            try:
+                handle.unsubscribe()
+            except Exception as e:
+                logger.warning(f"Error stopping {self.name}: {e}")
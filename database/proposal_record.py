@@ -0,0 +1,178 @@
+"""
+Compact proposal records passed from the data providers to the trade logic.
+
+A scan cycle handles a handful of proposals, so the hand-off uses slotted
+records in plain lists instead of per-protocol DataFrames. DataFrames are
+only built where proposals are persisted or inspected in bulk.
+"""
+
+import pandas as pd
+
+
+class ProposalRecord:
+    """
+    One proposal as listed under one protocol.
+    """
+
+    # Field order, also the column order of to_frame()
+    FIELDS = ('protocol', 'post_id', 'timestamp', 'title', 'description', 'discussion_link', 'content_cleaned')
+
+    # `source` names the feed that delivered the record when several are merged; it is not persisted
+    __slots__ = FIELDS + ('source',)
+
+    def __init__(self, protocol, post_id, timestamp, title='', description='', discussion_link='',
+                 content_cleaned=False, source=None):
+        """
+        Initialize the record.
+
+        Args:
+            protocol (str): Protocol the proposal is listed under
+            post_id (str): Proposal ID, prefixed with its coin ("coin--hash")
+            timestamp: Creation time as stored by the data source
+            title (str): Proposal title
+            description (str): Proposal body
+            discussion_link (str): Link to the discussion
+            content_cleaned (bool): True if the description is already plain text
+            source (str, optional): Name of the data provider that delivered the record
+        """
+        self.protocol = protocol
+        self.post_id = post_id
+        self.timestamp = timestamp
+        self.title = title
+        self.description = description
+        self.discussion_link = discussion_link
+        self.content_cleaned = content_cleaned
+        self.source = source
+
+    @property
+    def coin(self):
+        """Coin the proposal trades, taken from the post ID prefix."""
+        return self.post_id.split("--")[0]
+
+    def to_dict(self):
+        """
+        Convert the record to a dict.
+
+        Returns:
+            dict: Field values keyed by field name
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if not isinstance(other, ProposalRecord):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.FIELDS)
+
+    def __repr__(self):
+        return f"ProposalRecord(protocol={self.protocol!r}, post_id={self.post_id!r})"
+
+
+class ProposalBatch:
+    """
+    Ordered list of ProposalRecords with DataFrame conversion for persistence.
+    """
+
+    __slots__ = ('records',)
+
+    def __init__(self, records=None):
+        """
+        Initialize the batch.
+
+        Args:
+            records (list, optional): ProposalRecords, kept as given
+        """
+        self.records = records if records is not None else []
+
+    def append(self, record):
+        self.records.append(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    @property
+    def empty(self):
+        return not self.records
+
+    def post_ids(self):
+        """
+        Get the post IDs in order.
+
+        Returns:
+            list: Post ID of each record
+        """
+        return [record.post_id for record in self.records]
+
+    def to_frame(self, columns=ProposalRecord.FIELDS):
+        """
+        Build a DataFrame of the records.
+
+        Args:
+            columns (sequence): Record attributes to include, e.g. FIELDS plus 'coin'
+
+        Returns:
+            DataFrame: One row per record, object dtype
+        """
+        rows = [[getattr(record, column) for column in columns] for record in self.records]
+        return pd.DataFrame(rows, columns=list(columns), dtype=object)
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        Build a batch from a DataFrame with the record fields as columns.
+
+        Frames from earlier versions, which have `coin` but no `protocol`
+        or `title`, are accepted too.
+
+        Args:
+            frame (DataFrame): Proposals, one per row
+
+        Returns:
+            ProposalBatch: The records
+        """
+        records = []
+        for row in frame.to_dict('records'):
+            post_id = row['post_id']
+            records.append(ProposalRecord(
+                row.get('protocol', row.get('coin', post_id.split("--")[0])),
+                post_id,
+                row.get('timestamp'),
+                row.get('title', ''),
+                row.get('description', ''),
+                row.get('discussion_link', ''),
+                row.get('content_cleaned') is True,
+                row.get('source')
+            ))
+        return cls(records)
+
+    def __repr__(self):
+        return f"ProposalBatch({len(self.records)} records)"
+
+
+def select_new(proposal_dict, seen_ids):
+    """
+    Collect the proposals not processed yet, once each.
+
+    A proposal listed under several protocols is returned once, under the
+    first protocol it appears in.
+
+    Args:
+        proposal_dict (dict): ProposalBatch of proposals keyed by protocol
+        seen_ids: Container of processed post IDs, usually a SeenIdStore
+
+    Returns:
+        ProposalBatch: New proposals in scan order
+    """
+    new = ProposalBatch()
+    selected = set()
+    for batch in proposal_dict.values():
+        for record in batch:
+            if record.post_id not in seen_ids and record.post_id not in selected:
+                selected.add(record.post_id)
+                new.append(record)
+    return new
@@ -0,0 +1,251 @@
+"""
+Offline data provider replaying a recorded proposal dump.
+
+ReplayDataProvider reads proposals from a JSONL or Parquet file and releases
+them at their recorded creation times scaled by a speed factor (1x, 100x,
+or as fast as possible), so the pipeline can be load-tested and debugged
+without a live data source. Records are ordered by (created_at, post_id)
+and the clock is injectable, so a replay driven by a VirtualClock always
+produces the same batches.
+"""
+
+import bisect
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from database.scan_proposal import DataProvider
+from database.proposal_record import ProposalRecord, ProposalBatch
+from utils.clean_html import get_html_cleaner
+from utils.deadline import parse_timestamp
+from utils.logging_utils import get_logger
+
+# Only snapshot proposals are traded, as with the live providers
+POST_TYPE = 'snapshot_proposal'
+
+
+class VirtualClock:
+    """
+    Clock that only moves when advanced, for deterministic replays.
+    """
+
+    def __init__(self, start=0.0):
+        """
+        Initialize the clock.
+
+        Args:
+            start (float): Initial time in epoch seconds
+        """
+        self.now = float(start)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Move the clock forward by `seconds`."""
+        self.now += seconds
+
+    sleep = advance
+
+
+def parse_speed(value):
+    """
+    Parse a replay speed.
+
+    Args:
+        value: Factor such as 1, '100' or '100x', or 'max' for as fast as possible
+
+    Returns:
+        float: Speed factor, or None for 'max'
+
+    Raises:
+        ValueError: If the value is not a positive factor or 'max'
+    """
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value == 'max':
+            return None
+        value = value.rstrip('x')
+    speed = float(value)
+    if speed <= 0:
+        raise ValueError(f"Replay speed must be positive or 'max', got {value!r}")
+    return speed
+
+
+def read_replay_rows(path):
+    """
+    Read the rows of a proposal dump.
+
+    Args:
+        path (str): JSONL file with one JSON object per line, or a .parquet file
+
+    Returns:
+        list: Row dicts in file order
+    """
+    if path.endswith('.parquet'):
+        import pandas as pd
+
+        # Needs pyarrow or fastparquet
+        frame = pd.read_parquet(path)
+        return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+    rows = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                rows.append(json.loads(line))
+    return rows
+
+
+def write_replay_rows(rows, path):
+    """
+    Write proposal rows as a JSONL dump that ReplayDataProvider can read.
+
+    Args:
+        rows (iterable): Row dicts; datetimes are written as ISO-8601 strings
+        path (str): Output file
+    """
+    def encode(value):
+        return value.isoformat() if isinstance(value, datetime) else str(value)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, default=encode) + '\n')
+
+
+class ReplayDataProvider(DataProvider):
+    """
+    DataProvider releasing the proposals of a recorded dump on a scaled clock.
+
+    With a speed factor, a scan returns every proposal whose recorded
+    creation time has been reached: the replay starts at the first
+    proposal and recorded time runs `speed` times faster than the clock.
+    With speed 'max', each scan jumps to the next pending proposal and
+    returns it with the ones recorded up to `replay_window_seconds` after
+    it, i.e. the burst one poll would have seen, without waiting.
+    """
+
+    WATERMARK_NAME = 'replay'
+
+    def __init__(self, config, clock=time.time):
+        """
+        Initialize the provider.
+
+        Args:
+            config (dict): Configuration with `replay_path`, `replay_speed`,
+                `replay_window_seconds` and `replay_rebase_timestamps`
+            clock (callable): Epoch-seconds clock, e.g. a VirtualClock
+        """
+        self.config = config
+        self.logger = get_logger(f"{__name__}.ReplayDataProvider")
+        self.path = config.get('replay_path')
+        self.speed = parse_speed(config.get('replay_speed', 1))
+        self.window = float(config.get('replay_window_seconds', 60.0))
+        # Shift timestamps to when each proposal is released, so deadlines behave as if it were live
+        self.rebase = config.get('replay_rebase_timestamps', True)
+        self.clock = clock
+        self._rows = []
+        self._times = []
+        self._started = None
+        self._committed = 0
+        self._pending = 0
+
+    def connect(self):
+        """
+        Load the dump and start the replay clock.
+
+        Returns:
+            ReplayDataProvider: The provider itself, which holds the loaded proposals
+        """
+        if not self.path:
+            raise ValueError("REPLAY_PATH must point to a JSONL or Parquet proposal dump")
+
+        rows = []
+        skipped = 0
+        for row in read_replay_rows(self.path):
+            post_id = row.get('post_id') or row.get('id')
+            created_at = parse_timestamp(row.get('created_at', row.get('timestamp')))
+            if not post_id or created_at is None or row.get('post_type', POST_TYPE) != POST_TYPE:
+                skipped += 1
+                continue
+            rows.append((created_at, str(post_id), row))
+        rows.sort(key=lambda item: (item[0], item[1]))
+
+        self._rows = rows
+        self._times = [created_at for created_at, _, _ in rows]
+        self._started = self.clock()
+        self._committed = self._pending = 0
+        speed = 'max' if self.speed is None else f"{self.speed:g}x"
+        self.logger.info(f"Replaying {len(rows)} proposals from {self.path} at {speed} ({skipped} rows skipped)")
+        return self
+
+    def disconnect(self, connection):
+        """Nothing to close for a file."""
+
+    def replay_position(self):
+        """
+        Get the recorded time up to which proposals are released.
+
+        Returns:
+            float: Recorded epoch seconds, or None before connect() or once every proposal was released
+        """
+        if self._committed >= len(self._rows):
+            return None
+        if self.speed is None:
+            return self._times[self._committed] + self.window
+        return self._times[0] + (self.clock() - self._started) * self.speed
+
+    @property
+    def finished(self):
+        """True once every proposal has been delivered and committed."""
+        return self._committed >= len(self._rows)
+
+    def download_proposals(self, connection, scan_mode=True):
+        """
+        Return the proposals released since the last commit.
+
+        Args:
+            connection: Provider from connect()
+            scan_mode: If False, return the history before the replay, which is empty
+
+        Returns:
+            dict: ProposalBatch of proposals keyed by protocol
+        """
+        if not scan_mode:
+            return {}
+
+        position = self.replay_position()
+        if position is None:
+            return {}
+        end = bisect.bisect_right(self._times, position, lo=self._committed)
+        self._pending = end
+
+        released_at = self.clock()
+        proposal_dict = {}
+        for created_at, post_id, row in self._rows[self._committed:end]:
+            if not self.rebase:
+                timestamp = row.get('created_at', row.get('timestamp'))
+            elif self.speed is None:
+                timestamp = released_at
+            else:
+                timestamp = self._started + (created_at - self._times[0]) / self.speed
+            protocol = row.get('protocol') or post_id.split('--')[0]
+            description = get_html_cleaner().clean(row.get('description') or '', post_id)
+            discussion_link = row.get('discussion_link', row.get('post_url_link')) or ''
+            proposal_dict.setdefault(protocol, ProposalBatch()).append(ProposalRecord(
+                protocol, post_id, timestamp, row.get('title') or '', description, discussion_link, True))
+
+        self.logger.info(f"Released {end - self._committed} proposals "
+                         f"({len(self._rows) - end} left in the replay)")
+        return proposal_dict
+
+    def commit_watermark(self):
+        """Mark the proposals of the last download as delivered; an uncommitted download is repeated."""
+        self._committed = max(self._committed, self._pending)
@@ -1,17 +1,11 @@
 import pandas as pd 
 import numpy as np
 
-import firebase_admin
-from firebase_admin import credentials
-from firebase_admin import firestore
 import json
 import os
 import sys
 import pandas as pd
-from bs4 import BeautifulSoup
-from pymongo import MongoClient
 from datetime import datetime
-from google.api_core.retry import Retry
 import logging
 
 # Add the parent directory to sys.path for direct imports
@@ -21,6 +15,12 @@ if current_dir not in sys.path:
 
 from utils import get_config
 from utils.logging_utils import get_logger
+from utils.clean_html import get_html_cleaner
+from database.watermark import Watermark
+from database.backfill import Backfill
+from database.seen_ids import get_seen_ids, seen_ids_path
+from database.proposal_record import ProposalRecord, ProposalBatch, select_new
+from database.proposal_listener import ProposalListener, ListenerUnavailable
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -32,6 +32,12 @@ class DataProvider:
     Implement this class to support different data sources.
     """
     
+    # Fields of the records returned by download_proposals, and the columns of their DataFrames
+    PROPOSAL_COLUMNS = list(ProposalRecord.FIELDS)
+    
+    # Prefix of the watermark file in the data directory
+    WATERMARK_NAME = 'provider'
+    
     def connect(self):
         """Connect to the data source. Return connection object."""
         raise NotImplementedError("Subclasses must implement connect()")
@@ -53,30 +59,135 @@ class DataProvider:
         """
         raise NotImplementedError("Subclasses must implement download_proposals()")
     
+    def stream_proposals(self, connection, scan_mode=True):
+        """
+        Yield proposals one at a time as the data source returns them.
+        
+        The default downloads everything first; providers that can read
+        their source incrementally override it so the first proposal is
+        available before the query finishes.
+        
+        Args:
+            connection: Connection object from connect()
+            scan_mode: If True, limit to recent proposals, otherwise get more
+            
+        Yields:
+            ProposalRecord: One record per proposal and protocol
+        """
+        for batch in self.download_proposals(connection, scan_mode).values():
+            yield from batch
+    
     def check_new_proposals(self, proposals_dict, existing_data_path):
         """
         Check for new proposals not in existing data.
         
         Args:
             proposals_dict: Dictionary of proposal data
-            existing_data_path: Path to file with existing data
+            existing_data_path: Path of the seen-ID store (see database.seen_ids); a missing
+                store counts every proposal as new
             
         Returns:
-            DataFrame: DataFrame of new proposals
+            ProposalBatch: New proposals, once each
+        """
+        seen_ids = get_seen_ids(existing_data_path)
+        logger.info(f"Found {len(seen_ids)} existing proposals in {existing_data_path}")
+        
+        new_proposals = select_new(proposals_dict, seen_ids)
+        logger.info(f"Found {len(new_proposals)} new proposals")
+        return new_proposals
+    
+    def listen(self, connection):
+        """
+        Open a push-based feed of new proposal documents.
+        
+        Args:
+            connection: Connection object from connect()
+            
+        Returns:
+            ProposalListener: Listener queuing new documents as they are created
+            
+        Raises:
+            ListenerUnavailable: If the provider only supports polling
+        """
+        raise ListenerUnavailable(f"{self.__class__.__name__} does not support listener mode")
+    
+    def proposals_from_documents(self, documents):
         """
-        raise NotImplementedError("Subclasses must implement check_new_proposals()")
+        Convert documents delivered by a listener into the download_proposals format.
+        
+        Args:
+            documents (list): Documents from ProposalListener.get_batch()
+            
+        Returns:
+            dict: Dictionary of proposal data
+        """
+        raise NotImplementedError("Subclasses that support listen() must implement proposals_from_documents()")
+    
+    def backfill_pages(self, connection, after=None, page_size=500):
+        """
+        Page through every proposal, oldest first, for the initial backfill.
+        
+        Args:
+            connection: Connection object from connect()
+            after (tuple, optional): (created_at, document id) cursor to resume after
+            page_size (int): Documents requested per page
+            
+        Yields:
+            tuple: (proposal_dict, cursor, document_count) for each page, where
+                `cursor` is the (created_at, document id) of the page's last document
+        """
+        raise NotImplementedError("Subclasses that support backfill must implement backfill_pages()")
+    
+    def get_watermark(self):
+        """
+        Get the provider's high-water mark, loading it from the data directory on first use.
+        
+        Returns:
+            Watermark: The persisted (created_at, document id) mark
+        """
+        watermark = getattr(self, '_watermark', None)
+        if watermark is None:
+            path = os.path.join(self.config.get('data_dir', 'data'), f"{self.WATERMARK_NAME}_watermark.json")
+            watermark = self._watermark = Watermark(path)
+        return watermark
+    
+    def commit_watermark(self):
+        """Persist the newest document seen, once the fetched proposals have been processed."""
+        watermark = getattr(self, '_watermark', None)
+        if watermark is not None and watermark.commit():
+            self.logger.debug(f"Committed {watermark}")
 
 class FirebaseDataProvider(DataProvider):
     """
     Firebase implementation of DataProvider for proposal data.
+    
+    Queries filter on `post_type` and select only the fields the bot reads,
+    on the server. Combined with the ordering on `created_at` this needs two
+    composite indexes on `ai_posts` (the `__name__` tie-break is implicit):
+    
+    - `post_type` Ascending, `created_at` Ascending: watermark scans and the listener
+    - `post_type` Ascending, `created_at` Descending: first scan and full downloads
+    
+    A missing index fails the query with FAILED_PRECONDITION and a link that creates it.
     """
     
+    WATERMARK_NAME = 'firebase'
+    
+    # Only snapshot proposals are traded
+    POST_TYPE = 'snapshot_proposal'
+    
+    # The only fields read from each proposal document
+    SELECTED_FIELDS = ('id', 'house_id', 'created_at', 'title', 'description', 'post_url_link')
+    
     def __init__(self, config):
         self.config = config
         self.logger = get_logger(f"{__name__}.FirebaseDataProvider")
     
     def connect(self):
         """Connect to Firebase and return the database client and app."""
+        import firebase_admin
+        from firebase_admin import credentials, firestore
+        
         cred = credentials.Certificate(self.config["firebase_cred"])
         app = firebase_admin.initialize_app(cred)
         db = firestore.client()
@@ -85,6 +196,8 @@ class FirebaseDataProvider(DataProvider):
     
     def disconnect(self, connection):
         """Disconnect from Firebase."""
+        import firebase_admin
+        
         _, app = connection
         try:
             firebase_admin.delete_app(app)
@@ -92,13 +205,14 @@ class FirebaseDataProvider(DataProvider):
         except Exception as e:
             self.logger.error(f"Error closing Firebase client: {e}")
     
-    def _clean_content(self, html_text):
-        """Clean HTML content by extracting only the text."""
-        soup = BeautifulSoup(html_text, 'html.parser')
-        return soup.get_text()
+    def _clean_content(self, html_text, post_id=None):
+        """Clean HTML content by extracting only the text, memoized per post."""
+        return get_html_cleaner().clean(html_text, post_id)
     
     def download_proposals(self, connection, scan_mode=True):
         """Download proposals from Firebase."""
+        from google.api_core.retry import Retry
+        
         # Handle different connection types
         if isinstance(connection, tuple):
             db, _ = connection
@@ -110,107 +224,318 @@ class FirebaseDataProvider(DataProvider):
         retry_strategy = Retry()
         collection_name = 'ai_posts'
         collection_ref = db.collection(collection_name)    
+        query = self.proposal_query(collection_ref).select(self.SELECTED_FIELDS)
         
-        if scan_mode:
-            self.logger.debug("Using scan mode: limited to 20 most recent documents")
-            docs = collection_ref.order_by('created_at', direction='DESCENDING').limit(20).stream(retry=retry_strategy)
+        watermark = self.get_watermark()
+        if scan_mode and watermark.is_set():
+            docs = self.fetch_since_watermark(query, watermark, retry_strategy)
+        elif scan_mode:
+            self.logger.debug("Using scan mode without a watermark: limited to 20 most recent documents")
+            docs = list(query.order_by('created_at', direction='DESCENDING').limit(20).stream(retry=retry_strategy))
         else:
             self.logger.debug("Using full mode: retrieving up to 1000 documents")
-            docs = collection_ref.order_by('created_at', direction='DESCENDING').limit(1000).stream(retry=retry_strategy)
-
-        protocol_list = []
-        docs_list = []
+            docs = list(query.order_by('created_at', direction='DESCENDING').limit(1000).stream(retry=retry_strategy))
+        
+        return self.proposals_from_documents(docs)
+    
+    def stream_proposals(self, connection, scan_mode=True):
+        """
+        Yield proposals as Firestore streams the documents.
+        
+        Same query as download_proposals. Protocols are the document ID
+        prefixes seen so far, so a proposal is listed under its own protocol
+        and any earlier one whose name appears in its `house_id`.
+        
+        Args:
+            connection: Firestore client, or the (db, app) tuple from connect()
+            scan_mode: If True, fetch after the watermark or the 20 most recent documents
+            
+        Yields:
+            ProposalRecord: One record per proposal and protocol
+        """
+        from google.api_core.retry import Retry
+        
+        db = connection[0] if isinstance(connection, tuple) else connection
+        retry_strategy = Retry()
+        query = self.proposal_query(db.collection('ai_posts')).select(self.SELECTED_FIELDS)
+        
+        watermark = self.get_watermark()
+        if scan_mode and watermark.is_set():
+            page_size = self.config.get('watermark_page_size', 100)
+            pages = self.iter_pages(query, (watermark.created_at, watermark.doc_id), page_size, retry_strategy)
+            docs = (doc for page in pages for doc in page)
+        else:
+            limit = 20 if scan_mode else 1000
+            docs = query.order_by('created_at', direction='DESCENDING').limit(limit).stream(retry=retry_strategy)
+        
+        protocols = []
         for doc in docs:
+            watermark.observe(doc.get('created_at'), doc.id)
             protocol = str(doc.id).split('--')[0]
-            if protocol not in protocol_list:
-                protocol_list.append(protocol)
-            docs_list.append(doc.to_dict())
+            if protocol not in protocols:
+                protocols.append(protocol)
+            
+            try:
+                data = doc.to_dict()
+                if data.get('post_type', self.POST_TYPE) != self.POST_TYPE:
+                    continue
+                records = self.document_records(data, [key for key in protocols if key in data['house_id']])
+            except Exception as e:
+                self.logger.error(f"Error processing document: {e}")
+                continue
+            yield from records
+    
+    def proposal_query(self, collection_ref):
+        """
+        Restrict a collection to snapshot proposals on the server.
         
-        self.logger.info(f"Found {len(docs_list)} documents across {len(protocol_list)} protocols")
+        Args:
+            collection_ref: Firestore collection of posts
             
-        proposal_dict = {}
-        for key in protocol_list:
-            discourse_df = pd.DataFrame(columns = ['protocol', 'post_id', 'timestamp', 'title', 'description', "discussion_link"])    
+        Returns:
+            Query: Query matching only documents whose post_type is POST_TYPE
+        """
+        from google.cloud.firestore_v1.base_query import FieldFilter
+        
+        return collection_ref.where(filter=FieldFilter('post_type', '==', self.POST_TYPE))
+    
+    def proposals_from_documents(self, documents):
+        """
+        Record documents against the watermark and group them by protocol.
+        
+        Args:
+            documents (list): Firestore document snapshots
+            
+        Returns:
+            dict: ProposalBatch of proposals keyed by protocol
+        """
+        watermark = self.get_watermark()
+        for doc in documents:
+            watermark.observe(doc.get('created_at'), doc.id)
+        
+        return self.build_proposal_dict(documents)
+    
+    def listen(self, connection):
+        """
+        Listen to snapshot proposals in ai_posts as they are created.
+        
+        Each (re)subscription starts at the committed watermark, so proposals
+        created while the stream was down are delivered when it comes back.
+        
+        Args:
+            connection: Firestore client, or the (db, app) tuple from connect()
+            
+        Returns:
+            ProposalListener: Listener queuing new document snapshots
+        """
+        from google.cloud.firestore_v1.base_query import FieldFilter
+        
+        db = connection[0] if isinstance(connection, tuple) else connection
+        collection_ref = db.collection('ai_posts')
+        watermark = self.get_watermark()
+        
+        def subscribe(on_documents):
+            query = self.proposal_query(collection_ref)
+            if watermark.is_set():
+                query = query.where(filter=FieldFilter('created_at', '>=', watermark.created_at))
+            
+            def on_snapshot(docs, changes, read_time):
+                # The >= filter also matches the documents sharing the mark's timestamp that were already processed
+                on_documents([
+                    change.document for change in changes
+                    if change.type.name == 'ADDED' and not watermark.covers(change.document.get('created_at'), change.document.id)
+                ])
+            
+            return query.on_snapshot(on_snapshot)
+        
+        return ProposalListener(
+            subscribe,
+            max_failures=self.config.get('listener_max_failures', 5),
+            name="Firestore listener"
+        )
+    
+    def fetch_since_watermark(self, collection_ref, watermark, retry_strategy=None):
+        """
+        Fetch every document created after the watermark, oldest first, one page at a time.
+        
+        Documents are ordered by created_at and then by document ID, so pages
+        never skip or repeat documents that share a timestamp.
+        
+        Args:
+            collection_ref: Firestore collection or filtered query to read
+            watermark (Watermark): Committed high-water mark
+            retry_strategy: Retry policy passed to every page request
             
-            for doc in docs_list: 
-                try:
-                    if doc['post_type'] == 'snapshot_proposal':
-                        df_row = []
-                        if key in doc['house_id']:
-                            post_id = doc['id']
-                            protocol = key
-                            timestamp = doc['created_at']
-                            title = doc['title']
-                            description = self._clean_content(doc['description'])
-                            
-                            try:
-                                discussion_link = doc['post_url_link']
-                            except Exception as e:
-                                discussion_link = ''
-                                self.logger.debug(f"No discussion link found for {post_id}")
-                            
-                            df_row = [protocol, post_id, timestamp, title, description, discussion_link]
-                            
-                            temp_df = pd.DataFrame([df_row], columns=discourse_df.columns)
-                            
-                            discourse_df = pd.concat([discourse_df, temp_df], ignore_index=True)
+        Returns:
+            list: Document snapshots newer than the watermark
+        """
+        page_size = self.config.get('watermark_page_size', 100)
+        docs = []
+        pages = 0
+        for page in self.iter_pages(collection_ref, (watermark.created_at, watermark.doc_id), page_size, retry_strategy):
+            pages += 1
+            docs.extend(page)
+        
+        self.logger.info(f"Fetched {len(docs)} documents in {pages} page(s) since {watermark}")
+        return docs
+    
+    def iter_pages(self, collection_ref, after, page_size, retry_strategy=None):
+        """
+        Yield documents in (created_at, document ID) order, one page at a time, until a short page.
+        
+        Args:
+            collection_ref: Firestore collection or filtered query to read
+            after (tuple, optional): (created_at, document id) to start after, or None for the beginning
+            page_size (int): Documents per page
+            retry_strategy: Retry policy passed to every page request
+            
+        Yields:
+            list: Non-empty page of document snapshots
+        """
+        query = collection_ref.order_by('created_at').order_by('__name__')
+        while True:
+            page_query = query if after is None else query.start_after({'created_at': after[0], '__name__': after[1]})
+            page = list(page_query.limit(page_size).stream(retry=retry_strategy))
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            after = (page[-1].get('created_at'), page[-1].id)
+    
+    def backfill_pages(self, connection, after=None, page_size=500):
+        """
+        Page through every snapshot proposal in ai_posts, oldest first.
+        
+        Args:
+            connection: Firestore client, or the (db, app) tuple from connect()
+            after (tuple, optional): (created_at, document id) cursor to resume after
+            page_size (int): Documents requested per page
+            
+        Yields:
+            tuple: (proposal_dict, cursor, document_count) for each page
+        """
+        from google.api_core.retry import Retry
+        
+        db = connection[0] if isinstance(connection, tuple) else connection
+        query = self.proposal_query(db.collection('ai_posts')).select(self.SELECTED_FIELDS)
+        for page in self.iter_pages(query, after, page_size, Retry()):
+            yield self.proposals_from_documents(page), (page[-1].get('created_at'), page[-1].id), len(page)
+    
+    def build_proposal_dict(self, docs):
+        """
+        Group Firestore documents into one ProposalBatch of snapshot proposals per protocol.
+        
+        Protocols are the prefixes of the document IDs. A proposal belongs to
+        every protocol whose name appears in its `house_id`. Documents without
+        a `post_type` come from the server-filtered query and count as proposals.
+        Records are collected in a single pass over the documents.
+        
+        Args:
+            docs (iterable): Document snapshots exposing `id` and `to_dict()`
+            
+        Returns:
+            dict: ProposalBatch of proposals keyed by protocol, in order of first appearance
+        """
+        protocol_rows = {}
+        docs_list = []
+        for doc in docs:
+            protocol_rows.setdefault(str(doc.id).split('--')[0], [])
+            docs_list.append(doc.to_dict())
+        
+        self.logger.info(f"Found {len(docs_list)} documents across {len(protocol_rows)} protocols")
+        
+        # Protocols matching each house_id; house IDs repeat, so each is only matched once
+        house_protocols = {}
+        for doc in docs_list:
+            try:
+                if doc.get('post_type', self.POST_TYPE) != self.POST_TYPE:
+                    continue
                 
-                except Exception as e:
-                    self.logger.error(f"Error processing document: {e}")
+                house_id = doc['house_id']
+                if isinstance(house_id, list):
+                    house_id = tuple(house_id)
+                protocols = house_protocols.get(house_id)
+                if protocols is None:
+                    protocols = house_protocols[house_id] = [key for key in protocol_rows if key in house_id]
+                if not protocols:
                     continue
-                    
-            proposal_dict[key] = discourse_df
-            self.logger.debug(f"Processed {len(discourse_df)} proposals for protocol {key}")
+                
+                for record in self.document_records(doc, protocols):
+                    protocol_rows[record.protocol].append(record)
+            
+            except Exception as e:
+                self.logger.error(f"Error processing document: {e}")
+                continue
+        
+        proposal_dict = {}
+        for key, rows in protocol_rows.items():
+            proposal_dict[key] = ProposalBatch(rows)
+            self.logger.debug(f"Processed {len(rows)} proposals for protocol {key}")
         
         return proposal_dict
     
-    def check_new_proposals(self, proposals_dict, existing_data_path):
-        """Check for new proposals not in existing data."""
-        try:
-            proposal_post_id = list(pd.read_csv(existing_data_path, index_col=0)['post_id'])
-            self.logger.info(f"Found {len(proposal_post_id)} existing proposals in {existing_data_path}")
-        except Exception as e:
-            self.logger.warning(f"Could not read existing proposals: {e}. Treating all as new.")
-            proposal_post_id = []
-        
-        columns = ["post_id", "coin", "description", "discussion_link", "timestamp"]
-        new_row_df = pd.DataFrame(columns=columns)
-        
-        for key, coin_df in proposals_dict.items():
-            for index, row in coin_df.iterrows():
-                post_id = row['post_id']
-                if post_id not in proposal_post_id:
-                    coin = post_id.split("--")[0]
-                    description = row['description']
-                    discussion_link = row['discussion_link']
-                    timestamp = row['timestamp']
-                    
-                    new_row = {
-                        "post_id": post_id,
-                        "coin": coin,
-                        "description": description,
-                        "discussion_link": discussion_link,
-                        "timestamp": timestamp
-                    }
-                    new_row_df = pd.concat([new_row_df, pd.DataFrame([new_row])], ignore_index=True)
-        
-        self.logger.info(f"Found {len(new_row_df)} new proposals")
-        return new_row_df
+    def document_records(self, doc, protocols):
+        """
+        Convert one proposal document into a record per protocol it belongs to.
+        
+        Args:
+            doc (dict): Document fields
+            protocols (list): Protocols the proposal is listed under
+            
+        Returns:
+            list: ProposalRecords, empty if `protocols` is
+            
+        Raises:
+            KeyError: If a required field is missing
+        """
+        if not protocols:
+            return []
+        
+        post_id = doc['id']
+        timestamp = doc['created_at']
+        title = doc['title']
+        description = self._clean_content(doc['description'], post_id)
+        
+        discussion_link = doc.get('post_url_link', '')
+        if 'post_url_link' not in doc:
+            self.logger.debug(f"No discussion link found for {post_id}")
+        
+        return [ProposalRecord(protocol, post_id, timestamp, title, description, discussion_link, True)
+                for protocol in protocols]
 
 # Factory to create appropriate data provider
 def create_data_provider(provider_type, config):
     """
     Factory function to create data provider of appropriate type.
     
+    A comma-separated list of types (e.g. 'firebase,mongodb') creates a
+    CompositeDataProvider querying all of them.
+    
     Args:
-        provider_type (str): Type of data provider ('firebase', etc.)
+        provider_type (str): Type of data provider ('firebase', 'mongodb' or 'replay')
         config (dict): Configuration for the provider
         
     Returns:
         DataProvider: DataProvider instance
     """
+    sources = [name.strip().lower() for name in provider_type.split(',') if name.strip()]
+    if len(sources) > 1:
+        # The package-level factory also knows the optional providers
+        from database import create_data_provider as create_source
+        from database.composite_provider import CompositeDataProvider
+        
+        return CompositeDataProvider({name: create_source(name, config) for name in sources}, config)
+    
     if provider_type.lower() == 'firebase':
         return FirebaseDataProvider(config)
+    elif provider_type.lower() == 'replay':
+        from database.replay_provider import ReplayDataProvider
+        
+        return ReplayDataProvider(config)
+    elif provider_type.lower() == 'mongodb':
+        from database.mongo_provider import MongoDataProvider
+        
+        return MongoDataProvider(config)
     else:
         # Default to Firebase provider for backward compatibility
         logger.warning(f"Unknown provider type '{provider_type}', using Firebase provider")
@@ -327,11 +652,10 @@ class ProposalScanner:
             proposal_dict (dict): Dictionary of proposals by protocol
             
         Returns:
-            DataFrame: DataFrame containing new proposals
+            ProposalBatch: New proposals
         """
         self.logger.info("Checking for new proposals")
-        existing_data_path = os.path.join(self.config["data_dir"], 'proposal_post_id.csv')
-        return self.data_provider.check_new_proposals(proposal_dict, existing_data_path)
+        return self.data_provider.check_new_proposals(proposal_dict, seen_ids_path(self.config["data_dir"]))
     
     def store_data(self, connection):
         """
@@ -344,8 +668,54 @@ class ProposalScanner:
             str: Timestamp when the data was stored
         """
         self.logger.info("Storing initial data into database")
+        try:
+            backfill = Backfill(self.data_provider, self.config["data_dir"], self.config.get('backfill_page_size', 500))
+            stats = backfill.run(connection)
+            self.logger.info(f"Backfilled {stats['rows']} proposal IDs at {stats['docs_per_second']:.0f} docs/s")
+            return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        except NotImplementedError:
+            self.logger.info("Data provider has no backfill, downloading the most recent proposals")
+        
         proposal_dict = self.download_and_save_proposal(connection, False)
-        return self.store_into_db(proposal_dict)
+        start_time = self.store_into_db(proposal_dict)
+        self.commit_watermark()
+        return start_time
+    
+    def listen(self, connection):
+        """
+        Open a push-based feed of new proposals from the data provider.
+        
+        Args:
+            connection: Connection object appropriate for the provider
+            
+        Returns:
+            ProposalListener: Listener queuing new documents
+            
+        Raises:
+            ListenerUnavailable: If the provider only supports polling
+        """
+        self.logger.info("Opening listener on data provider")
+        return self.data_provider.listen(connection)
+    
+    def proposals_from_documents(self, documents):
+        """
+        Convert documents delivered by a listener into proposals by protocol.
+        
+        Args:
+            documents (list): Documents from ProposalListener.get_batch()
+            
+        Returns:
+            dict: Dictionary containing proposal data by protocol
+        """
+        return self.data_provider.proposals_from_documents(documents)
+    
+    def commit_watermark(self):
+        """
+        Persist the provider's watermark once the downloaded proposals have been processed.
+        
+        The next scan only fetches documents created after it.
+        """
+        self.data_provider.commit_watermark()
     
     def store_into_db(self, proposal_dict):
         """
@@ -357,20 +727,11 @@ class ProposalScanner:
         Returns:
             str: Timestamp when the data was stored
         """
-        proposal_csv = pd.DataFrame()
-        key_list = []
-        
-        for coin in proposal_dict:
-            temp_key = proposal_dict[coin]['post_id']
-            for key in temp_key:
-                if key not in key_list:
-                    key_list.append(key)
-        
-        proposal_csv['post_id'] = key_list
+        key_list = [key for coin in proposal_dict for key in proposal_dict[coin].post_ids()]
         
-        output_path = os.path.join(self.config["data_dir"], 'proposal_post_id.csv')
-        proposal_csv.to_csv(output_path)
-        self.logger.info(f"Saved {len(key_list)} proposal IDs to {output_path}")
+        seen_ids = get_seen_ids(seen_ids_path(self.config["data_dir"]))
+        seen_ids.replace(key_list)
+        self.logger.info(f"Saved {len(seen_ids)} proposal IDs to {seen_ids.path}")
         
         start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.logger.info(f"Data stored at {start_time}")
@@ -394,18 +755,18 @@ class ProposalScanner:
             connection = self.data_provider.connect()
             self.data_provider.disconnect(connection)
 
-    def clean_content(self, html_text):
+    def clean_content(self, html_text, post_id=None):
         """
         Clean HTML content by extracting only the text.
         
         Args:
             html_text (str): HTML content to clean
+            post_id (str, optional): Post the content belongs to, used to reuse an earlier result
             
         Returns:
             str: Cleaned text content
         """
-        soup = BeautifulSoup(html_text, 'html.parser')
-        return soup.get_text()
+        return get_html_cleaner().clean(html_text, post_id)
 
     
     
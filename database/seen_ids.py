@@ -0,0 +1,182 @@
+"""
+Persistent set of proposal IDs the bot has already processed.
+
+IDs are kept in a Python set for constant-time lookups and persisted in an
+append-only text file, one ID per line. Marking a proposal processed appends
+and fsyncs a single line instead of rewriting the whole file. The first open
+imports the legacy proposal_post_id.csv once.
+"""
+
+import os
+import sys
+import threading
+
+import pandas as pd
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+SEEN_IDS_FILE = 'seen_post_ids.txt'
+LEGACY_CSV_FILE = 'proposal_post_id.csv'
+
+
+class SeenIdStore:
+    """
+    Hash set of processed proposal IDs backed by an append-only file.
+    """
+
+    def __init__(self, path):
+        """
+        Open the store, migrating the legacy CSV next to it if the file doesn't exist yet.
+
+        Args:
+            path (str): Append-only file holding one processed ID per line
+        """
+        self.path = path
+        self._ids = set()
+        self._order = []
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self._load()
+        else:
+            self._migrate(os.path.join(os.path.dirname(path), LEGACY_CSV_FILE))
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        lines = content.split('\n')
+        if lines[-1]:
+            # A write interrupted mid-line; the proposal is fetched again and re-marked
+            logger.warning(f"Dropping incomplete last line of {self.path}")
+            with open(self.path, 'r+', encoding='utf-8') as f:
+                f.truncate(len(content.encode('utf-8')) - len(lines[-1].encode('utf-8')))
+        for post_id in lines[:-1]:
+            if post_id and post_id not in self._ids:
+                self._ids.add(post_id)
+                self._order.append(post_id)
+
+    def _migrate(self, csv_path):
+        """Import the IDs of the legacy CSV into a new store file, then retire the CSV."""
+        post_ids = []
+        if os.path.exists(csv_path):
+            try:
+                post_ids = [str(post_id) for post_id in pd.read_csv(csv_path, index_col=0)['post_id'].dropna()]
+            except (pd.errors.EmptyDataError, KeyError):
+                pass
+        self._write_all(post_ids)
+        if os.path.exists(csv_path):
+            os.replace(csv_path, csv_path + '.migrated')
+            logger.info(f"Migrated {len(self._ids)} processed IDs from {csv_path} to {self.path}")
+
+    def _write_all(self, post_ids):
+        """Atomically replace the file with `post_ids`."""
+        self._ids = set()
+        self._order = []
+        for post_id in post_ids:
+            if post_id not in self._ids:
+                self._ids.add(post_id)
+                self._order.append(post_id)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{post_id}\n" for post_id in self._order)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def __contains__(self, post_id):
+        return str(post_id) in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(list(self._order))
+
+    def add(self, post_id):
+        """
+        Mark a proposal processed with one durable append.
+
+        Args:
+            post_id (str): Proposal ID
+
+        Returns:
+            bool: True if the ID was not recorded before
+        """
+        return self.add_many([post_id]) == 1
+
+    def add_many(self, post_ids):
+        """
+        Mark several proposals processed with a single append and fsync.
+
+        Args:
+            post_ids (iterable): Proposal IDs
+
+        Returns:
+            int: Number of IDs not recorded before
+        """
+        with self._lock:
+            new = list(dict.fromkeys(post_id for post_id in map(str, post_ids) if post_id not in self._ids))
+            if not new:
+                return 0
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(f"{post_id}\n" for post_id in new))
+                f.flush()
+                os.fsync(f.fileno())
+            self._ids.update(new)
+            self._order.extend(new)
+            return len(new)
+
+    def replace(self, post_ids):
+        """
+        Replace every recorded ID, e.g. when the initial load starts over.
+
+        Args:
+            post_ids (iterable): Proposal IDs
+        """
+        with self._lock:
+            self._write_all(map(str, post_ids))
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def seen_ids_path(data_dir):
+    """
+    Get the path of the seen-ID store in a data directory.
+
+    Args:
+        data_dir (str): Data directory
+
+    Returns:
+        str: Path of the store file
+    """
+    return os.path.join(data_dir, SEEN_IDS_FILE)
+
+
+def get_seen_ids(path):
+    """
+    Get the shared SeenIdStore for a file, opening it on first use.
+
+    The scanner and the trade logic share one instance, so IDs marked by one
+    are seen by the other without re-reading the file.
+
+    Args:
+        path (str): Store file, usually seen_ids_path(data_dir)
+
+    Returns:
+        SeenIdStore: The store
+    """
+    path = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = SeenIdStore(path)
+        return store
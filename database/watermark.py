@@ -0,0 +1,157 @@
+"""
+Persisted high-water mark for incremental proposal fetching.
+
+A data provider records the newest (created_at, document id) pair it has
+handed to the pipeline. The next scan only asks the data source for documents
+after that pair, so bursts larger than a page are never dropped and unchanged
+documents are not transferred again.
+"""
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.deadline import parse_timestamp
+
+
+def encode_value(value):
+    """
+    Encode a created_at value so it survives a JSON round trip with its type.
+
+    Args:
+        value: datetime, ISO string or epoch number as stored by the data source
+
+    Returns:
+        dict: Tagged JSON-serialisable value
+    """
+    if isinstance(value, datetime):
+        return {"type": "datetime", "value": value.isoformat()}
+    return {"type": "raw", "value": value}
+
+
+def decode_value(encoded):
+    """
+    Decode a value written by encode_value.
+
+    Args:
+        encoded (dict): Tagged value
+
+    Returns:
+        The original datetime, string or number
+    """
+    if encoded is None:
+        return None
+    if encoded.get("type") == "datetime":
+        return datetime.fromisoformat(encoded["value"])
+    return encoded.get("value")
+
+
+def sort_key(created_at, doc_id):
+    """
+    Order (created_at, document id) pairs, whatever type created_at is stored as.
+
+    Args:
+        created_at: Creation time of the document
+        doc_id (str): Document ID, the tie-breaker for equal timestamps
+
+    Returns:
+        tuple: Comparable key
+    """
+    seconds = parse_timestamp(created_at)
+    return (float('-inf') if seconds is None else seconds, str(doc_id))
+
+
+class Watermark:
+    """
+    High-water mark on (created_at, document id), persisted as JSON.
+
+    Documents seen during a scan are recorded with `observe`. The mark only
+    moves, and is only written to disk, on `commit`, once the scan's proposals
+    have been processed, so a crash mid-cycle re-fetches instead of skipping.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the watermark, loading it from `path` if it exists.
+
+        Args:
+            path (str): JSON file holding the committed mark
+        """
+        self.path = path
+        self.created_at = None
+        self.doc_id = None
+        self._pending = None
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the committed mark from disk."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            data = json.load(f)
+        self.created_at = decode_value(data.get("created_at"))
+        self.doc_id = data.get("doc_id")
+
+    def is_set(self):
+        """Check whether a mark has been committed."""
+        return self.doc_id is not None
+
+    def covers(self, created_at, doc_id):
+        """
+        Check whether a document is at or before the committed mark.
+
+        Args:
+            created_at: Creation time of the document
+            doc_id (str): Document ID
+
+        Returns:
+            bool: True if the document was already processed
+        """
+        return self.is_set() and sort_key(created_at, doc_id) <= sort_key(self.created_at, self.doc_id)
+
+    def observe(self, created_at, doc_id):
+        """
+        Record a fetched document as a candidate for the next mark.
+
+        Args:
+            created_at: Creation time of the document
+            doc_id (str): Document ID
+        """
+        if created_at is None or doc_id is None:
+            return
+        with self._lock:
+            if self._pending is None or sort_key(created_at, doc_id) > sort_key(*self._pending):
+                self._pending = (created_at, doc_id)
+
+    def commit(self):
+        """
+        Move the mark to the newest observed document and persist it.
+
+        Returns:
+            bool: True if the mark moved
+        """
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if pending is None:
+                return False
+            if self.is_set() and sort_key(*pending) <= sort_key(self.created_at, self.doc_id):
+                return False
+
+            self.created_at, self.doc_id = pending
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({"created_at": encode_value(self.created_at), "doc_id": self.doc_id}, f)
+            os.replace(tmp_path, self.path)
+            return True
+
+    def __repr__(self):
+        return f"Watermark(created_at={self.created_at!r}, doc_id={self.doc_id!r})"
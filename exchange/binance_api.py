@@ -1,6 +1,3 @@
-from binance.client import Client
-from binance.enums import SIDE_BUY, SIDE_SELL, ORDER_TYPE_MARKET
-from binance.enums import *
 import json
 import os
 import math
@@ -45,7 +42,8 @@ class BinanceAPI:
         with open(os.path.join(exchange_dir, 'precision.json'), 'r') as json_file:
             self.precision_dict = json.load(json_file)
         
-        # Initialize the Binance client
+        # Initialize the Binance client (imported here so importing the exchange package stays cheap)
+        from binance.client import Client
         self.client = Client(
             self.config.get('binance_api_key'), 
             self.config.get('binance_api_secret'), 
@@ -263,16 +261,20 @@ class BinanceAPI:
         return precision1
         
     
-    def create_buy_order_long(self, coin, target_price):
+    def create_buy_order_long(self, coin, target_price, deadline=None):
         """
         Create a long buy order with a stop loss and target profit.
         
         Args:
             coin (str): Coin name
             target_price (float): Target price percentage
+            deadline (Deadline, optional): Proposal deadline; no position is opened once it has passed
             
         Returns:
             tuple: Order details including prices and IDs
+            
+        Raises:
+            DeadlineExceeded: If the deadline passed before the entry order was placed
         """
         #####-----------
         # coin = 'uniswap'
@@ -280,6 +282,12 @@ class BinanceAPI:
         ####-------------
         
         
+        # Only the entry order is gated; once a position is open its exits are always placed
+        if deadline is not None:
+            deadline.check("order placement")
+        
+        from binance.enums import SIDE_BUY, ORDER_TYPE_MARKET
+        
         symbol = self.coin_dict[coin]
         quantity = self.get_quantity(symbol)   
         print("Bought Quantity", quantity)
@@ -357,22 +365,32 @@ class BinanceAPI:
         #placing a target price
         
     
-    def create_buy_order_short(self, coin, target_price):
+    def create_buy_order_short(self, coin, target_price, deadline=None):
         """
         Create a short sell order with a stop loss and target profit.
         
         Args:
             coin (str): Coin name
             target_price (float): Target price percentage
+            deadline (Deadline, optional): Proposal deadline; no position is opened once it has passed
             
         Returns:
             tuple: Order details including prices and IDs
+            
+        Raises:
+            DeadlineExceeded: If the deadline passed before the entry order was placed
         """
         #####-----------
         # coin = 'uniswap'
         # target_price = 0.02
         ####-------------
         
+        # Only the entry order is gated; once a position is open its exits are always placed
+        if deadline is not None:
+            deadline.check("order placement")
+        
+        from binance.enums import SIDE_SELL, ORDER_TYPE_MARKET
+        
         symbol = self.coin_dict[coin]
         quantity = self.get_quantity(symbol)
         print("Bought Quantity", quantity)
@@ -90,6 +90,8 @@ install_dependencies() {
 download_models() {
     print_status "Downloading trading models..."
     python3 download_models.py
+    print_status "Building the English lexicon..."
+    python3 build_lexicon.py
 }
 
 # Function to create .env file
@@ -8,7 +8,6 @@ import signal
 import importlib.util
 import logging
 from dotenv import load_dotenv
-from binance.client import Client
 from flask import Flask, request, jsonify, current_app
 
 # When running as a script directly, make sure the current directory is in the path
@@ -25,16 +24,16 @@ logger = setup_logging(level=logging.INFO)
 module_logger = get_logger(__name__)
 
 # Always use direct imports from local directories
-from database import ProposalScanner, create_firebase_client, close_firebase_client
+from database import ProposalScanner, create_firebase_client, close_firebase_client, ListenerUnavailable
+from database.backfill import Backfill
 from core import TradeLogic, LiveTradeManager
 from services import SlackBot
 from utils import save_error, get_config
-from models.sentiment import SentimentPredictor
+from utils.metrics import get_llm_metrics, get_escalation_metrics
 from models.reasoning import Reasoning
 from models.summarization import Summarization
 from api.dynamo_utils import DynamoDBClient
 from exchange import BinanceAPI, Monitor
-import pandas as pd
 
 # Flask app for API endpoints
 app = Flask(__name__)
@@ -88,6 +87,7 @@ class GovernanceTradingBot:
         self.reasoning = None
         self.dynamo = None
         self.monitor = None
+        self.listener = None
         
         self.logger.info("Governance Trading Bot initialized")
     
@@ -102,10 +102,20 @@ class GovernanceTradingBot:
             return False
     
     def check_past_data(self):
-        """Check if past data exists in the specified directory."""
-        files_data_len = len(os.listdir(self.config['data_dir']))
-        self.logger.debug(f"Found {files_data_len} files in data directory")
-        return files_data_len >= 3
+        """
+        Check if the data directory was initialized.
+        
+        The directory also holds the watermark, seen-ID, checkpoint and index
+        files, so it counts as initialized only once the backfill completed
+        and proposal_post_all.csv, written after it, exists.
+        """
+        data_dir = self.config['data_dir']
+        if Backfill.is_pending(data_dir):
+            self.logger.info("Initial backfill was interrupted, resuming it")
+            return False
+        initialized = os.path.exists(os.path.join(data_dir, 'proposal_post_all.csv'))
+        self.logger.debug(f"Data directory {data_dir} initialized: {initialized}")
+        return initialized
     
     def initialize_components(self):
         """Initialize all required components for the bot."""
@@ -130,9 +140,14 @@ class GovernanceTradingBot:
             
             # Initialize all required components
             self.logger.info("Initializing summarization model")
-            self.summary_obj = Summarization("mistral")
+            self.summary_obj = Summarization(
+                self.config.get('ollama_model', 'mistral'),
+                base_url=self.config.get('ollama_host')
+            )
             
             self.logger.info("Initializing sentiment analyzer")
+            # torch and transformers are only imported when the bot actually starts
+            from models.sentiment import SentimentPredictor
             self.sentiment_analyzer = SentimentPredictor(self.config['sentiment_dir'])
             
             self.logger.info("Initializing Binance client")
@@ -141,7 +156,13 @@ class GovernanceTradingBot:
             # Initialize reasoning module
             self.logger.info("Initializing reasoning module")
             self.reasoning = Reasoning(
-                openai_api_key=os.getenv("OPENAI_KEY")
+                openai_api_key=os.getenv("OPENAI_KEY"),
+                base_url=self.config.get('openai_base_url'),
+                fast_model=self.config.get('openai_fast_model'),
+                reasoning_model=self.config.get('openai_reasoning_model', 'o1-preview'),
+                escalation_band=self.config.get('escalation_band', 0.10),
+                bullish_threshold=self.config.get('sentiment_score_bullish', 0.80),
+                bearish_threshold=self.config.get('sentiment_score_bearish', 0.80)
             )
             
             # Initialize DynamoDB client and price monitor only if AWS credentials are present
@@ -178,6 +199,7 @@ class GovernanceTradingBot:
             "scan_count": self.counter,
             "last_run_time": self.last_run_time,
             "firebase_connected": self.db is not None,
+            "feed_mode": "listen" if self.listener is not None else "poll",
             "components_initialized": all([
                 self.summary_obj, 
                 self.sentiment_analyzer, 
@@ -189,12 +211,49 @@ class GovernanceTradingBot:
         if self.dynamo is not None:
             status["dynamodb_connected"] = True
         self.logger.debug(f"Bot status: {status}")
+        status["llm_metrics"] = self.get_metrics()
+        source_stats = getattr(self.proposal_scanner.data_provider, 'source_stats', None)
+        if source_stats is not None:
+            status["source_metrics"] = source_stats()
+        status["escalation_metrics"] = get_escalation_metrics().snapshot()
         return status
     
-    def run_scan_cycle(self):
+    def get_metrics(self):
+        """
+        Get rolling LLM call telemetry.
+        
+        Returns:
+            dict: Latency, retry, size and outcome statistics keyed by 'provider/model'
+        """
+        return get_llm_metrics().snapshot()
+    
+    def open_listener(self):
+        """
+        Open the push-based proposal feed when PROPOSAL_FEED_MODE is 'listen'.
+        
+        Returns:
+            ProposalListener: The subscribed listener, or None to poll instead
+        """
+        if self.config.get('proposal_feed_mode', 'poll') != 'listen':
+            return None
+        try:
+            listener = self.proposal_scanner.listen(self.db)
+            listener.ensure_active()
+            self.logger.info("Listening for new proposals")
+            return listener
+        except Exception as e:
+            self.logger.warning(f"Listener mode unavailable, polling instead: {e}")
+            self.slack_bot.post_error_to_slack(f"Listener mode unavailable, polling instead: {e}")
+            return None
+    
+    def run_scan_cycle(self, documents=None):
         """
         Run a single scan cycle to check for new proposals and trigger trades.
         
+        Args:
+            documents (list, optional): Documents delivered by the listener; when None
+                the cycle downloads proposals from the data provider instead
+        
         Returns:
             bool: True if scan completed successfully, False otherwise
         """
@@ -209,18 +268,25 @@ class GovernanceTradingBot:
             self.trade_manager.delete_live_trade()
             
             # Download and save proposal data #abstract
-            self.logger.info("Downloading and saving proposal data")
-            proposal_dict = self.proposal_scanner.download_and_save_proposal(self.db, True)
+            if documents is None:
+                self.logger.info("Downloading and saving proposal data")
+                proposal_dict = self.proposal_scanner.download_and_save_proposal(self.db, True)
+            else:
+                self.logger.info(f"Processing {len(documents)} documents from the listener")
+                proposal_dict = self.proposal_scanner.proposals_from_documents(documents)
             
             # Check for new posts #abstract
             self.logger.info("Checking for new posts")
-            new_row_df = self.proposal_scanner.check_new_post(proposal_dict)
+            new_proposals = self.proposal_scanner.check_new_post(proposal_dict)
             
-            self.logger.info(f"Triggering trades based on {len(new_row_df)} new proposals")
+            self.logger.info(f"Triggering trades based on {len(new_proposals)} new proposals")
             # Trigger trades based on new proposals
-            self.trade_logic.trigger_trade(new_row_df, self.summary_obj, self.sentiment_analyzer, 
+            self.trade_logic.trigger_trade(new_proposals, self.summary_obj, self.sentiment_analyzer, 
                           self.reasoning, self.dynamo, self.slack_bot)
             
+            # Later scans only fetch documents newer than the ones just processed
+            self.proposal_scanner.commit_watermark()
+            
             # Check price for existing trades
             self.logger.info("Checking prices for existing trades")
             self.monitor.check_price()
@@ -272,21 +338,39 @@ class GovernanceTradingBot:
                         continue
                     
                     self.logger.info("Bot initialization complete. Starting scan cycles...")
+                    countdown_time = int(self.config.get('countdown_time', 60))
+                    listener_opened = False
                     
                     # Main operational loop
                     while not shutdown_requested:
+                        documents = None
+                        if self.listener is not None:
+                            # Run as soon as proposals arrive, and at least once per countdown for price checks
+                            try:
+                                documents = self.listener.get_batch(timeout=countdown_time)
+                            except ListenerUnavailable as e:
+                                self.logger.error(f"Listener failed, falling back to polling: {e}")
+                                self.slack_bot.post_error_to_slack(f"Listener failed, falling back to polling: {e}")
+                                self.listener.stop()
+                                self.listener = None
+                        
                         # Run a single scan cycle
                         self.logger.info(f"Starting scan cycle #{self.counter + 1}...")
-                        scan_success = self.run_scan_cycle()
+                        scan_success = self.run_scan_cycle(documents)
                         
                         if scan_success:
                             self.logger.info(f"Scan cycle #{self.counter} completed successfully")
                         else:
                             self.logger.warning(f"Scan cycle #{self.counter} completed with errors")
                         
+                        # Subscribe after the first polled cycle has committed a watermark to start from
+                        if not listener_opened:
+                            listener_opened = True
+                            self.listener = self.open_listener()
+                        
                         # Wait for the next scan cycle
-                        countdown_time = 1 * 60  # 1 minute countdown
-                        self.countdown_timer(countdown_time)
+                        if self.listener is None:
+                            self.countdown_timer(countdown_time)
                     
                 except KeyboardInterrupt:
                     shutdown_requested = True
@@ -319,6 +403,11 @@ class GovernanceTradingBot:
         try:
             self.logger.info("Stopping the Governance Trading Bot...")
             
+            # Cancel the proposal subscription before its connection goes away
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+            
             # Close the data provider connection if it exists
             provider_type = self.config.get('data_provider_type', 'firebase').lower()
             
@@ -340,6 +429,10 @@ class GovernanceTradingBot:
                 self.app = None
                 self.db = None
             
+            # Release pooled LLM connections before dropping the reasoning module
+            if self.reasoning is not None:
+                self.reasoning.close()
+            
             # Reset components
             self.logger.info("Resetting bot components")
             self.summary_obj = None
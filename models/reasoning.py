@@ -1,6 +1,3 @@
-from langchain_community.llms import Ollama
-from openai import OpenAI, OpenAIError
-import pandas as pd
 import os
 import json
 import re
@@ -8,25 +5,74 @@ import time
 from typing import Tuple, Optional
 from dotenv import load_dotenv
 import ast
+import sys
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.metrics import get_llm_metrics, get_escalation_metrics
 
 
 load_dotenv()
 
 class Reasoning:
-    def __init__(self, openai_api_key):
+    def __init__(self, openai_api_key, base_url=None, max_connections=10, max_keepalive_connections=5, keepalive_expiry=120.0,
+                 fast_model="gpt-4o-mini", reasoning_model="o1-preview", escalation_band=0.1,
+                 bullish_threshold=0.80, bearish_threshold=0.80):
         self.max_attempts = 5
+        # Tiered scoring: the fast model scores every proposal and the reasoning model is
+        # only consulted when the blended score lands within escalation_band of the trade
+        # threshold. fast_model=None always uses the reasoning model.
+        self.fast_model = fast_model
+        self.reasoning_model = reasoning_model
+        self.escalation_band = escalation_band
+        self.bullish_threshold = bullish_threshold
+        self.bearish_threshold = bearish_threshold
         self.retry_delay = 1  # seconds between retries
-        self.client = OpenAI(api_key=openai_api_key)
+        # Stream replies and stop reading as soon as a complete JSON object has arrived
+        self.stream_responses = True
+        # Deadline headroom (seconds) needed to start a required call / the optional Deepseek call
+        self.min_llm_seconds = 10
+        self.min_optional_seconds = 60
+        # The OpenAI SDK is only imported once a client is needed
+        from openai import OpenAI, DefaultHttpxClient
+        import httpx
+        # Connection-pool limits shared by every remote LLM client, so repeated
+        # calls reuse warm keep-alive connections instead of a new TLS handshake
+        self.http_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        # base_url lets the OpenAI client target a compatible stub server; None keeps the SDK default
+        self.client = OpenAI(api_key=openai_api_key, base_url=base_url or None, http_client=DefaultHttpxClient(limits=self.http_limits))
         self.ollama_weight = 0.4
         self.openai_weight = 0.5
         self.trained_weight = 0.1
         # Check if Deepseek credentials are available
         self.has_deepseek = bool(os.getenv("AGENT_ENDPOINT") and os.getenv("AGENT_KEY"))
-        if not self.has_deepseek:
+        self.deepseek_client = None
+        if self.has_deepseek:
+            self.deepseek_client = OpenAI(
+                base_url=os.getenv("AGENT_ENDPOINT"),
+                api_key=os.getenv("AGENT_KEY"),
+                http_client=DefaultHttpxClient(limits=self.http_limits)
+            )
+        else:
             # Adjust weights when Deepseek is not available
             self.openai_weight = 0.7
             self.trained_weight = 0.3
     
+    def close(self):
+        """
+        Close the pooled HTTP connections held by the remote LLM clients.
+        """
+        self.client.close()
+        if self.deepseek_client is not None:
+            self.deepseek_client.close()
+    
     def get_sentiment_score(self, output: str) -> float:
         """
         Extract sentiment score from LLM output using regex pattern matching.
@@ -51,10 +97,85 @@ class Reasoning:
         
         raise ValueError("No valid sentiment score found in output")
 
-    def get_openai_sentiment(self, description: str) -> Tuple[Optional[str], Optional[float]]:
+    def _record_call(self, provider: str, model: str, started: float, prompt: str, call: dict) -> None:
+        """
+        Record wall time, retries, sizes and outcome of a remote sentiment call.
+        """
+        get_llm_metrics().record(
+            provider=provider,
+            model=model,
+            wall_time=time.perf_counter() - started,
+            retries=max(call["attempts"] - 1, 0),
+            prompt_chars=len(prompt),
+            output_chars=len(call["output"] or ""),
+            outcome=call["outcome"],
+            prompt_tokens=call["prompt_tokens"],
+            output_tokens=call["output_tokens"]
+        )
+    
+    def _track_usage(self, call: dict, response) -> None:
+        """
+        Copy token usage reported by an OpenAI-compatible response into the call record.
+        """
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            call["prompt_tokens"] = getattr(usage, "prompt_tokens", None)
+            call["output_tokens"] = getattr(usage, "completion_tokens", None)
+    
+    def _client_for(self, client, deadline):
+        """
+        Bound the request timeout of a client by the proposal deadline.
+        """
+        if deadline is None:
+            return client
+        return client.with_options(timeout=deadline.timeout())
+    
+    def _complete(self, client, model: str, messages: list, call: dict, deadline=None) -> list:
+        """
+        Run a chat completion and return the content of each choice.
+        
+        When streaming is enabled the reply is consumed only until the first
+        complete JSON object has arrived; the stream is then closed, which
+        cancels the rest of the generation. Token usage is requested in the
+        stream but only arrives in its last chunk, so a stream closed early
+        leaves the token counts unset.
+        """
+        client = self._client_for(client, deadline)
+        if not self.stream_responses:
+            response = client.chat.completions.create(model=model, messages=messages)
+            self._track_usage(call, response)
+            return [choice.message.content for choice in response.choices]
+        
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        content = ""
+        try:
+            for chunk in stream:
+                self._track_usage(call, chunk)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                content += delta
+                # Braces never nest in the expected reply, so a closing brace after
+                # an opening one completes the object
+                if '}' in delta and re.search(r'\{[^{}]*\}', content):
+                    break
+        finally:
+            stream.close()
+        return [content]
+    
+    def get_openai_sentiment(self, description: str, deadline=None, model: Optional[str] = None) -> Tuple[Optional[str], Optional[float]]:
         """
         Get sentiment score from OpenAI model with retry logic.
         Returns a tuple of (sentiment, score) or (None, None) if the sentiment couldn't be retrieved.
+        Retries stop once the optional deadline has passed.
+        The reasoning model is used unless another model is given.
         """
         initial_prompt = """
         You are a financial and trading expert. Based on the content of this text, evaluate its sentiment and immediate impact on market prices.
@@ -63,113 +184,139 @@ class Reasoning:
         Output only the JSON object.
         """
         description = description + initial_prompt
-   
-        for attempt in range(self.max_attempts):
-            print(f"attempt {attempt}")
-            try:
-                response = self.client.chat.completions.create(
-                    model="o1-preview",
-                    messages = [
-                         {"role": "user", "content": description}
-                     ]
-                )
-                
-                output = response.choices[0].message.content
+        model = model or self.reasoning_model
+        
+        started = time.perf_counter()
+        call = {"attempts": 0, "outcome": "error", "output": None, "prompt_tokens": None, "output_tokens": None}
+        try:
+            for attempt in range(self.max_attempts):
+                if deadline is not None and deadline.expired():
+                    call["outcome"] = "deadline"
+                    return None, None
+                print(f"attempt {attempt}")
+                call["attempts"] = attempt + 1
                 try:
-                    # Parse JSON using regex and json library
-                    json_match = re.search(r'\{[^{}]*\}', output)
-                    if json_match:
-                        json_str = json_match.group()
-                        json_str_fixed = json_str.replace("'", '"')
-                        result = json.loads(json_str_fixed)
-                        sentiment, score = next(iter(result.items()))
-                        
-                        return sentiment, float(score)
-                    else:
+                    output = self._complete(
+                        self.client,
+                        model,
+                        [{"role": "user", "content": description}],
+                        call,
+                        deadline
+                    )[0]
+                    call["output"] = output
+                    try:
+                        # Parse JSON using regex and json library
+                        json_match = re.search(r'\{[^{}]*\}', output)
+                        if json_match:
+                            json_str = json_match.group()
+                            json_str_fixed = json_str.replace("'", '"')
+                            result = json.loads(json_str_fixed)
+                            sentiment, score = next(iter(result.items()))
+                            
+                            call["outcome"] = "success"
+                            return sentiment, float(score)
+                        else:
+                            call["outcome"] = "parse_error"
+                            if attempt == self.max_attempts - 1:
+                                return None, None
+                            time.sleep(self.retry_delay)
+                            continue
+                            
+                    except (ValueError, KeyError, json.JSONDecodeError) as e:
+                        call["outcome"] = "parse_error"
                         if attempt == self.max_attempts - 1:
                             return None, None
                         time.sleep(self.retry_delay)
                         continue
                         
-                except (ValueError, KeyError, json.JSONDecodeError) as e:
+                except Exception as e:
+                    call["outcome"] = "error"
                     if attempt == self.max_attempts - 1:
                         return None, None
                     time.sleep(self.retry_delay)
                     continue
-                    
-            except Exception as e:
-                if attempt == self.max_attempts - 1:
-                    return None, None
-                time.sleep(self.retry_delay)
-                continue
+        finally:
+            self._record_call("openai", model, started, description, call)
     
-    def get_deepseek_sentiment(self, description: str) -> Tuple[Optional[str], Optional[float]]:
+    def get_deepseek_sentiment(self, description: str, deadline=None) -> Tuple[Optional[str], Optional[float]]:
         """
         Get sentiment score from Deepseek model with retry logic.
         Returns a tuple of (sentiment, score) or (None, None) if the sentiment couldn't be retrieved.
+        Retries stop once the optional deadline has passed.
         """
-        agent_endpoint = os.getenv("AGENT_ENDPOINT")
-        agent_key = os.getenv("AGENT_KEY")
-        
-        client = OpenAI(
-            base_url=agent_endpoint,
-            api_key=agent_key,
-        )
+        if self.deepseek_client is None:
+            return None, None
         
         max_retries = 5
         retry_count = 0
         
-        while retry_count < max_retries:
-            print(f"try {retry_count}")
-            try:
-                response = client.chat.completions.create(
-                    model="n/a",
-                    messages=[
-                        {"role": "system", "content": """
-                         You are a financial and trading expert. Based on the content of this text, evaluate its sentiment and immediate impact on market prices.
-                         Output your result in JSON format as {'positive': x} or {'negative': x}, where:
-                         - x represents the score that can be in between 0 to 1.
-                         Output only the JSON object.
-                         """},
-                        {"role": "user", "content": description}
-                    ]
-                )
-                
-                for choice in response.choices:
-                    content = choice.message.content
-                    # Find JSON pattern between curly braces, including the braces
-                    json_match = re.search(r'\{[^{}]*\}', content)
-                    if json_match:
-                        json_str = json_match.group()
-                        json_str_fixed = json_str.replace("'", '"')
-                        try:
-                            result = json.loads(json_str_fixed)  # Parse JSON string to dict
-                            sentiment, score = next(iter(result.items()))
-                            return sentiment, float(score)
-                        except json.JSONDecodeError:
-                            # If first attempt fails, try with ast.literal_eval
+        started = time.perf_counter()
+        call = {"attempts": 0, "outcome": "error", "output": None, "prompt_tokens": None, "output_tokens": None}
+        try:
+            while retry_count < max_retries:
+                if deadline is not None and deadline.expired():
+                    call["outcome"] = "deadline"
+                    return None, None
+                print(f"try {retry_count}")
+                call["attempts"] = retry_count + 1
+                try:
+                    contents = self._complete(
+                        self.deepseek_client,
+                        "n/a",
+                        [
+                            {"role": "system", "content": """
+                             You are a financial and trading expert. Based on the content of this text, evaluate its sentiment and immediate impact on market prices.
+                             Output your result in JSON format as {'positive': x} or {'negative': x}, where:
+                             - x represents the score that can be in between 0 to 1.
+                             Output only the JSON object.
+                             """},
+                            {"role": "user", "content": description}
+                        ],
+                        call,
+                        deadline
+                    )
+                    
+                    for content in contents:
+                        call["output"] = content
+                        # Find JSON pattern between curly braces, including the braces
+                        json_match = re.search(r'\{[^{}]*\}', content)
+                        if json_match:
+                            json_str = json_match.group()
+                            json_str_fixed = json_str.replace("'", '"')
                             try:
-                                result = ast.literal_eval(json_str)
+                                result = json.loads(json_str_fixed)  # Parse JSON string to dict
                                 sentiment, score = next(iter(result.items()))
+                                call["outcome"] = "success"
                                 return sentiment, float(score)
-                            except (ValueError, SyntaxError):
-                                # Continue to next retry if both parsing methods fail
-                                pass
-                
-                # If we didn't find JSON in the response, increment retry counter
-                retry_count += 1
-                if retry_count < max_retries:
+                            except json.JSONDecodeError:
+                                # If first attempt fails, try with ast.literal_eval
+                                try:
+                                    result = ast.literal_eval(json_str)
+                                    sentiment, score = next(iter(result.items()))
+                                    call["outcome"] = "success"
+                                    return sentiment, float(score)
+                                except (ValueError, SyntaxError):
+                                    # Continue to next retry if both parsing methods fail
+                                    pass
+                    
+                    # If we didn't find JSON in the response, increment retry counter
+                    call["outcome"] = "parse_error"
+                    retry_count += 1
+                    if retry_count < max_retries:
+                        time.sleep(1)  # Add a small delay between retries
+                        continue
+                    else:
+                        return None, None
+                        
+                except Exception as e:
+                    call["outcome"] = "error"
+                    retry_count += 1
+                    if retry_count == max_retries:
+                        return None, None
                     time.sleep(1)  # Add a small delay between retries
                     continue
-                else:
-                    return None, None
-                    
-            except Exception as e:
-                retry_count += 1
-                if retry_count == max_retries:
-                    return None, None
-                time.sleep(1)  # Add a small delay between retries
-                continue
+        finally:
+            self._record_call("deepseek", "agent", started, description, call)
 
 
     def calculate_weighted_sentiment(self, ollama_score: Optional[float], openai_score: Optional[float], trained_score: float) -> float:
@@ -199,22 +346,82 @@ class Reasoning:
         else:
             return (ollama_score * self.ollama_weight) + (openai_score * self.openai_weight) + (trained_score * self.trained_weight)
     
-    def predict_sentiment(self, description: str, trained_score: float) -> Tuple[Optional[str], float]:
+    def needs_escalation(self, sentiment: Optional[str], blended_score: Optional[float]) -> bool:
+        """
+        Check whether a fast-model verdict is too close to call.
+        A verdict needs the reasoning model when it is missing or when the blended
+        score lies within escalation_band of the threshold for its direction.
+        """
+        if sentiment is None or blended_score is None:
+            return True
+        threshold = self.bullish_threshold if sentiment == 'positive' else self.bearish_threshold
+        return abs(blended_score - threshold) <= self.escalation_band
+    
+    def get_tiered_openai_sentiment(self, description: str, deepseek_score: Optional[float], trained_score: float,
+                                    deadline=None) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Get the OpenAI sentiment, escalating from the fast model to the reasoning model
+        only when the blended score is near a trade threshold.
+        Falls back to the fast-model verdict if the reasoning model fails or the
+        deadline leaves no room for it.
+        """
+        if not self.fast_model:
+            return self.get_openai_sentiment(description, deadline)
+        
+        started = time.perf_counter()
+        fast_sentiment, fast_score = self.get_openai_sentiment(description, deadline, model=self.fast_model)
+        fast_seconds = time.perf_counter() - started
+        
+        if fast_sentiment is None:
+            reason = "fast_failed"
+        else:
+            blended_score = self.calculate_weighted_sentiment(deepseek_score, fast_score, trained_score)
+            reason = "near_threshold" if self.needs_escalation(fast_sentiment, blended_score) else "clear"
+        
+        if reason == "clear":
+            get_escalation_metrics().record(False, reason, fast_seconds)
+            return fast_sentiment, fast_score
+        if deadline is not None and not deadline.has_time_for(self.min_llm_seconds):
+            print("Not escalating to the reasoning model: proposal deadline is too close")
+            get_escalation_metrics().record(False, "deadline", fast_seconds)
+            return fast_sentiment, fast_score
+        
+        print(f"Escalating to {self.reasoning_model} ({reason})")
+        started = time.perf_counter()
+        sentiment, score = self.get_openai_sentiment(description, deadline)
+        get_escalation_metrics().record(True, reason, fast_seconds, time.perf_counter() - started)
+        if sentiment is None:
+            return fast_sentiment, fast_score
+        return sentiment, score
+    
+    def predict_sentiment(self, description: str, trained_score: float, deadline=None) -> Tuple[Optional[str], float]:
         """
         Predict market sentiment from text description using both models.
         Handles cases where either model might fail to produce a score.
+        When a deadline is given, the optional Deepseek call is skipped once
+        time runs short, and the OpenAI call is skipped when there is no time left.
+        The OpenAI score comes from the fast model unless the blended score is
+        near a trade threshold, in which case the reasoning model decides.
         """
         deepseek_sentiment = None
         deepseek_score = None
+        openai_sentiment = None
+        openai_score = None
         
-        # Only try Deepseek if credentials are available
+        # Only try Deepseek if credentials are available and the deadline leaves room for it
         if self.has_deepseek:
-            deepseek_sentiment, deepseek_score = self.get_deepseek_sentiment(description)
-            print(f"Deepseek sentiment: {deepseek_sentiment}, score: {deepseek_score}")
+            if deadline is None or deadline.has_time_for(self.min_optional_seconds):
+                deepseek_sentiment, deepseek_score = self.get_deepseek_sentiment(description, deadline)
+                print(f"Deepseek sentiment: {deepseek_sentiment}, score: {deepseek_score}")
+            else:
+                print("Skipping Deepseek sentiment: proposal deadline is too close")
                
         # Get OpenAI sentiment score
-        openai_sentiment, openai_score = self.get_openai_sentiment(description)
-        print(f"OpenAI sentiment: {openai_sentiment}, score: {openai_score}")
+        if deadline is None or deadline.has_time_for(self.min_llm_seconds):
+            openai_sentiment, openai_score = self.get_tiered_openai_sentiment(description, deepseek_score, trained_score, deadline)
+            print(f"OpenAI sentiment: {openai_sentiment}, score: {openai_score}")
+        else:
+            print("Skipping OpenAI sentiment: proposal deadline is too close")
         print(f"Trained score: {trained_score}")
     
         # Determine final sentiment
@@ -35,4 +35,20 @@ class SentimentPredictor:
                     "probability": prob.tolist()} for text, pred, prob in zip(texts, predictions, probs)]
         
         return results[0]['prediction'], max(results[0]['probability'])
+
+    def embed(self, texts, max_length=256):
+        # Mean-pool the encoder's last hidden state over the non-padding tokens
+        if isinstance(texts, str):
+            texts = [texts]
+
+        encodings = self.tokenizer(texts, truncation=True, padding=True, max_length=max_length, return_tensors='pt')
+        encodings = {key: val.to(self.device) for key, val in encodings.items()}
+
+        with torch.no_grad():
+            hidden = self.model.roberta(**encodings).last_hidden_state
+            mask = encodings['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+
+        # Return one float32 vector per text
+        return pooled.cpu().numpy().astype('float32')
     
\ No newline at end of file
@@ -1,22 +1,114 @@
-from langchain_community.llms import Ollama
-import pandas as pd
 import os
+import sys
+import time
+import json
+import requests
+
+# Add the parent directory to sys.path for direct imports
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.metrics import get_llm_metrics
 
 class Summarization:
-    def __init__(self, model):
+    def __init__(self, model, base_url=None):
         self.model = model
+        # Ollama host, e.g. a local stub server for benchmarks; None uses the Ollama default
+        self.base_url = base_url
+        # Below this many seconds before the deadline, skip the LLM and truncate instead
+        self.min_llm_seconds = 10
+        # Below this many seconds before the deadline, ask for the short summary
+        self.short_summary_seconds = 60
+        # Stream the reply and cancel generation once the word budget is reached
+        self.stream_responses = True
+    
+    def truncate_text(self, description, max_words=60):
+        """Fallback summary used when there is no time left for the LLM."""
+        return ' '.join(description.split()[:max_words])
+    
+    def stream_generate(self, prompt, max_words, timeout=None):
+        """
+        Stream a generation from Ollama, stopping once `max_words` words have arrived.
+        
+        Leaving the response context closes the connection, which makes Ollama
+        abort the rest of the generation and frees the model for the next request.
+        
+        Returns:
+            tuple: (text, streamed chunk count, final generation info or {} if stopped early)
+        """
+        url = f"{(self.base_url or 'http://localhost:11434').rstrip('/')}/api/generate"
+        payload = {"model": self.model, "prompt": prompt, "stream": True, "options": {"temperature": 0.3}}
+        text = ""
+        chunks = 0
+        generation_info = {}
+        with requests.post(url, json=payload, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("error"):
+                    raise ValueError(f"Ollama error: {data['error']}")
+                text += data.get("response", "")
+                chunks += 1
+                if data.get("done"):
+                    generation_info = data
+                    break
+                # A word past the budget has started, so the budget's words are complete
+                if len(text.split()) > max_words:
+                    text = ' '.join(text.split()[:max_words])
+                    break
+        return text, chunks, generation_info
     
-    def summarize_text(self, description):
-        llm = Ollama(model=self.model, temperature=0.3)
-        if len(description.split(' ')) >= 100:
+    def summarize_text(self, description, deadline=None):
+        if deadline is not None and not deadline.has_time_for(self.min_llm_seconds):
+            return self.truncate_text(description)
+        
+        timeout = max(int(deadline.remaining()), 1) if deadline is not None else None
+        
+        if len(description.split(' ')) >= 100 and (deadline is None or deadline.has_time_for(self.short_summary_seconds)):
             prompt = f"summarize the sentiment of following text. remove any integer value or web page link and any other noise and limit the output in between 30-60 words: {description}"
+            max_words = 60
         
-        if len(description.split(' ')) < 100:
+        else:
             prompt = f"summarize the sentiment of following text. remove any integer value or web page link and any other noise and limit the output in between 10-20 words: {description}"
+            max_words = 20
 
-        
-        output = llm.invoke(prompt)
+        started = time.perf_counter()
+        outcome = "error"
+        output = ""
+        generation_info = {}
+        output_tokens = None
+        try:
+            if self.stream_responses:
+                output, output_tokens, generation_info = self.stream_generate(prompt, max_words, timeout)
+                outcome = "success" if generation_info else "early_stop"
+            else:
+                from langchain_community.llms import Ollama
+                
+                params = {"model": self.model, "temperature": 0.3}
+                if self.base_url:
+                    params["base_url"] = self.base_url
+                if timeout is not None:
+                    params["timeout"] = timeout
+                llm = Ollama(**params)
+                result = llm.generate([prompt])
+                generation = result.generations[0][0]
+                output = generation.text
+                generation_info = generation.generation_info or {}
+                outcome = "success"
+        finally:
+            get_llm_metrics().record(
+                provider="ollama",
+                model=self.model,
+                wall_time=time.perf_counter() - started,
+                retries=0,
+                prompt_chars=len(prompt),
+                output_chars=len(output),
+                outcome=outcome,
+                prompt_tokens=generation_info.get("prompt_eval_count"),
+                output_tokens=generation_info.get("eval_count", output_tokens)
+            )
         
         return output
-    
-
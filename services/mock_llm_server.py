@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local stub server for the LLM APIs used by the Governance Trading Bot.
+
+The server speaks just enough of the OpenAI chat-completions API and the
+Ollama generate API to stand in for the remote sentiment models and the
+local summarizer during benchmarks and tests. Responses are deterministic
+for a given seed, and latency, error rate and malformed output can be
+injected to exercise the retry and fallback paths.
+
+Run it standalone with:
+    python -m services.mock_llm_server --port 11500 --latency-ms 250
+
+then point the bot at it through the environment:
+    OPENAI_BASE_URL=http://127.0.0.1:11500/v1
+    AGENT_ENDPOINT=http://127.0.0.1:11500/v1
+    OLLAMA_HOST=http://127.0.0.1:11500
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockLLMServer:
+    """
+    OpenAI- and Ollama-compatible stub server running on a background thread.
+    """
+
+    LATENCY_DISTRIBUTIONS = ('fixed', 'uniform', 'normal', 'lognormal')
+
+    def __init__(self, host='127.0.0.1', port=0, sentiment=None, score=None, summary=None,
+                 latency_ms=0.0, latency_jitter_ms=0.0, latency_distribution='fixed',
+                 error_rate=0.0, error_status=500, malformed_rate=0.0, token_latency_ms=0.0, seed=0):
+        """
+        Initialize the stub server.
+
+        Args:
+            host (str): Interface to bind to
+            port (int): Port to bind to, 0 picks a free port
+            sentiment (str, optional): Fixed sentiment label ('positive'/'negative').
+                                       Derived from the prompt when not given.
+            score (float, optional): Fixed sentiment score. Derived from the prompt when not given.
+            summary (str, optional): Fixed summary text. Derived from the prompt when not given.
+            latency_ms (float): Mean response latency in milliseconds
+            latency_jitter_ms (float): Spread of the latency distribution in milliseconds
+            latency_distribution (str): One of 'fixed', 'uniform', 'normal' or 'lognormal'
+            error_rate (float): Probability of answering with an HTTP error
+            error_status (int): HTTP status code used for injected errors
+            malformed_rate (float): Probability of answering with unparseable content
+            token_latency_ms (float): Delay between streamed chunks in milliseconds
+            seed (int): Seed for the random generator driving all injected behaviour
+        """
+        if latency_distribution not in self.LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{latency_distribution}'")
+
+        self.host = host
+        self.port = port
+        self.sentiment = sentiment
+        self.score = score
+        self.summary = summary
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.malformed_rate = malformed_rate
+        self.token_latency_ms = token_latency_ms
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+        self.stats = {"requests": 0, "errors": 0, "malformed": 0, "cancelled": 0}
+
+    @property
+    def base_url(self):
+        """Root URL of the running server, usable as OLLAMA_HOST."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def openai_base_url(self):
+        """URL usable as OPENAI_BASE_URL or AGENT_ENDPOINT."""
+        return f"{self.base_url}/v1"
+
+    def start(self):
+        """
+        Start serving on a background thread.
+
+        Returns:
+            str: Root URL of the running server
+        """
+        handler = type("BoundMockLLMHandler", (_MockLLMHandler,), {"mock": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop the server and release its socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def plan_response(self):
+        """
+        Draw the behaviour of the next response.
+
+        Returns:
+            tuple: (latency in seconds, error flag, malformed flag)
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            latency = self._draw_latency()
+            error = self._random.random() < self.error_rate
+            malformed = not error and self._random.random() < self.malformed_rate
+            if error:
+                self.stats["errors"] += 1
+            if malformed:
+                self.stats["malformed"] += 1
+        return latency, error, malformed
+
+    def _draw_latency(self):
+        """Draw a latency in seconds from the configured distribution."""
+        mean = self.latency_ms
+        spread = self.latency_jitter_ms
+        if self.latency_distribution == 'uniform':
+            value = self._random.uniform(mean - spread, mean + spread)
+        elif self.latency_distribution == 'normal':
+            value = self._random.gauss(mean, spread)
+        elif self.latency_distribution == 'lognormal' and mean > 0:
+            # Parameterise so that the median equals latency_ms
+            sigma = spread / mean if spread else 0.0
+            value = mean * self._random.lognormvariate(0.0, sigma)
+        else:
+            value = mean
+        return max(value, 0.0) / 1000.0
+
+    def sentiment_for(self, text):
+        """
+        Get the sentiment label and score returned for a prompt.
+
+        Args:
+            text (str): Prompt text
+
+        Returns:
+            tuple: (sentiment, score)
+        """
+        digest = zlib.crc32(text.encode("utf-8"))
+        sentiment = self.sentiment or ("positive" if digest % 2 == 0 else "negative")
+        score = self.score if self.score is not None else round(0.5 + (digest % 500) / 1000.0, 3)
+        return sentiment, score
+
+    def summary_for(self, text):
+        """
+        Get the summary returned for a prompt.
+
+        Args:
+            text (str): Prompt text
+
+        Returns:
+            str: Summary text
+        """
+        if self.summary is not None:
+            return self.summary
+        # Echo the tail of the prompt, which holds the text to summarize
+        words = text.split(':', 1)[-1].split()
+        return ' '.join(words[:40])
+
+
+class _MockLLMHandler(BaseHTTPRequestHandler):
+    """Request handler bound to a MockLLMServer through the `mock` class attribute."""
+
+    protocol_version = "HTTP/1.1"
+    mock = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/v1/models':
+            self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model", "owned_by": "mock"}]})
+        elif self.path.rstrip('/') == '/api/tags':
+            self._send_json(200, {"models": [{"name": "mock", "model": "mock"}]})
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "Invalid JSON body"})
+            return
+
+        path = self.path.rstrip('/')
+        if path not in ('/v1/chat/completions', '/chat/completions', '/api/generate'):
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        latency, error, malformed = self.mock.plan_response()
+        time.sleep(latency)
+
+        if error:
+            self._send_json(self.mock.error_status, {"error": {"message": "Injected error", "type": "mock_error"}})
+        elif path == '/api/generate':
+            self._handle_generate(payload, malformed)
+        else:
+            self._handle_chat_completion(payload, malformed)
+
+    def _handle_chat_completion(self, payload, malformed):
+        prompt = ' '.join(str(message.get('content', '')) for message in payload.get('messages', []))
+        if malformed:
+            content = "The sentiment of this proposal looks favourable overall"
+        else:
+            sentiment, score = self.mock.sentiment_for(prompt)
+            content = json.dumps({sentiment: score})
+
+        model = payload.get('model', 'mock')
+        prompt_tokens = len(prompt.split())
+        completion_tokens = len(content.split())
+
+        if payload.get('stream'):
+            chunks = [content[i:i + 4] for i in range(0, len(content), 4)]
+            events = []
+            for index, piece in enumerate(chunks):
+                delta = {"content": piece}
+                if index == 0:
+                    delta["role"] = "assistant"
+                events.append(self._completion_chunk(model, delta, None))
+            events.append(self._completion_chunk(model, {}, "stop"))
+            if (payload.get('stream_options') or {}).get('include_usage'):
+                # Like OpenAI, usage arrives in a last chunk without choices
+                usage_chunk = self._completion_chunk(model, {}, None)
+                usage_chunk["choices"] = []
+                usage_chunk["usage"] = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens
+                }
+                events.append(usage_chunk)
+            self._send_stream(
+                "text/event-stream",
+                [f"data: {json.dumps(event)}\n\n" for event in events] + ["data: [DONE]\n\n"]
+            )
+            return
+
+        self._send_json(200, {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+    def _completion_chunk(self, model, delta, finish_reason):
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }
+
+    def _handle_generate(self, payload, malformed):
+        prompt = payload.get('prompt', '')
+        text = "" if malformed else self.mock.summary_for(prompt)
+        model = payload.get('model', 'mock')
+        created_at = datetime.now(timezone.utc).isoformat()
+        final = {
+            "model": model,
+            "created_at": created_at,
+            "response": "",
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": len(prompt.split()),
+            "eval_count": len(text.split())
+        }
+
+        if payload.get('stream', True):
+            lines = [
+                json.dumps({"model": model, "created_at": created_at, "response": word + " ", "done": False}) + "\n"
+                for word in text.split()
+            ]
+            lines.append(json.dumps(final) + "\n")
+            self._send_stream("application/x-ndjson", lines)
+            return
+
+        final["response"] = text
+        self._send_json(200, final)
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, content_type, pieces):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for piece in pieces:
+                data = piece.encode("utf-8")
+                self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+                time.sleep(self.mock.token_latency_ms / 1000.0)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client stopped reading early and closed the connection
+            self.close_connection = True
+            with self.mock._lock:
+                self.mock.stats["cancelled"] += 1
+
+
+def main():
+    """Run the stub server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local OpenAI/Ollama stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--sentiment", choices=["positive", "negative"])
+    parser.add_argument("--score", type=float)
+    parser.add_argument("--summary")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--latency-distribution", choices=MockLLMServer.LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--token-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        host=args.host,
+        port=args.port,
+        sentiment=args.sentiment,
+        score=args.score,
+        summary=args.summary,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        latency_distribution=args.latency_distribution,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        malformed_rate=args.malformed_rate,
+        token_latency_ms=args.token_latency_ms,
+        seed=args.seed
+    )
+    server.start()
+    print(f"Mock LLM server listening on {server.base_url}")
+    print(f"  OPENAI_BASE_URL={server.openai_base_url}")
+    print(f"  AGENT_ENDPOINT={server.openai_base_url}")
+    print(f"  OLLAMA_HOST={server.base_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
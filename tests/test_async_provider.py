@@ -0,0 +1,166 @@
+"""
+Tests for the asynchronous data provider adapter.
+"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.async_provider import ThreadedDataProvider
+from database.fakes import FakeFirestoreClient
+from database.proposal_record import ProposalBatch, ProposalRecord
+from database.scan_proposal import DataProvider, FirebaseDataProvider
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class GatedProvider(DataProvider):
+    """Streams one record, then waits for the test before finishing the query."""
+
+    def __init__(self, count=3):
+        self.count = count
+        self.release = threading.Event()
+        self.closed = threading.Event()
+
+    def stream_proposals(self, connection, scan_mode=True):
+        try:
+            for i in range(self.count):
+                if i == 1:
+                    self.release.wait(5)
+                yield ProposalRecord("uni", f"uni--{i}", START)
+        finally:
+            self.closed.set()
+
+
+class FailingProvider(DataProvider):
+    def stream_proposals(self, connection, scan_mode=True):
+        yield ProposalRecord("uni", "uni--0", START)
+        raise ConnectionError("deadline exceeded")
+
+
+class BatchOnlyProvider(DataProvider):
+    """Provider implementing only download_proposals."""
+
+    def __init__(self):
+        self.threads = []
+
+    def connect(self):
+        self.threads.append(threading.current_thread())
+        return "connection"
+
+    def disconnect(self, connection):
+        self.threads.append(threading.current_thread())
+
+    def download_proposals(self, connection, scan_mode=True):
+        return {
+            "uni": ProposalBatch([ProposalRecord("uni", "uni--1", START)]),
+            "aave": ProposalBatch([ProposalRecord("aave", "aave--1", START)]),
+        }
+
+
+class TestThreadedDataProvider(unittest.IsolatedAsyncioTestCase):
+    """Test cases for ThreadedDataProvider."""
+
+    async def test_first_record_arrives_before_the_query_finishes(self):
+        """The consumer gets the first record while the backend is still reading."""
+        provider = GatedProvider()
+        stream = ThreadedDataProvider(provider).download_proposals(None)
+
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        self.assertEqual(first.post_id, "uni--0")
+        self.assertFalse(provider.closed.is_set())
+
+        provider.release.set()
+        self.assertEqual([record.post_id async for record in stream], ["uni--1", "uni--2"])
+        self.assertTrue(provider.closed.is_set())
+
+    async def test_closing_early_stops_the_worker(self):
+        """A consumer that stops reading closes the backend generator."""
+        provider = GatedProvider(count=500)
+        provider.release.set()
+        adapter = ThreadedDataProvider(provider, queue_size=2)
+        stream = adapter.download_proposals(None)
+
+        await stream.__anext__()
+        await stream.aclose()
+        self.assertTrue(provider.closed.wait(1))
+
+    async def test_backend_errors_reach_the_consumer(self):
+        """An exception in the worker thread is raised from the async generator."""
+        received = []
+        with self.assertRaises(ConnectionError):
+            async for record in ThreadedDataProvider(FailingProvider()).download_proposals(None):
+                received.append(record.post_id)
+        self.assertEqual(received, ["uni--0"])
+
+    async def test_connect_and_disconnect_run_off_the_event_loop(self):
+        """connect() and disconnect() of the wrapped provider run on a worker thread."""
+        provider = BatchOnlyProvider()
+        adapter = ThreadedDataProvider(provider)
+
+        self.assertEqual(await adapter.connect(), "connection")
+        await adapter.disconnect("connection")
+        self.assertEqual(len(provider.threads), 2)
+        self.assertNotIn(threading.current_thread(), provider.threads)
+
+    async def test_providers_without_streaming_are_adapted(self):
+        """The default stream_proposals yields the records of download_proposals."""
+        proposal_dict = await ThreadedDataProvider(BatchOnlyProvider()).collect_proposals(None)
+
+        self.assertEqual(list(proposal_dict), ["uni", "aave"])
+        self.assertEqual(proposal_dict["aave"].post_ids(), ["aave--1"])
+
+
+class TestFirebaseStreaming(unittest.IsolatedAsyncioTestCase):
+    """Test cases for FirebaseDataProvider.stream_proposals through the adapter."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client = FakeFirestoreClient()
+        collection = self.client.collection("ai_posts")
+        for i, (post_id, house_id) in enumerate([("uni--1", "uni.eth"), ("aave--1", "aave.eth"),
+                                                 ("uni--2", "uni.eth"), ("comp--1", "comp.eth")]):
+            collection.document(post_id).set({
+                "id": post_id,
+                "house_id": house_id,
+                "post_type": "discourse_post" if post_id == "comp--1" else "snapshot_proposal",
+                "created_at": START + timedelta(minutes=i),
+                "title": f"Proposal {post_id}",
+                "description": f"<p>Body of {post_id}</p>",
+            })
+
+    def provider(self):
+        return FirebaseDataProvider({"data_dir": self.temp_dir.name, "watermark_page_size": 2})
+
+    async def test_stream_matches_download(self):
+        """Collected stream records equal the batches download_proposals returns."""
+        streamed = await ThreadedDataProvider(self.provider()).collect_proposals(self.client)
+        downloaded = self.provider().download_proposals(self.client)
+
+        self.assertEqual({key: list(batch) for key, batch in streamed.items()},
+                         {key: list(batch) for key, batch in downloaded.items() if batch})
+
+    async def test_stream_pages_after_the_watermark(self):
+        """With a watermark, pages are streamed oldest first and the watermark advances."""
+        provider = self.provider()
+        provider.get_watermark().observe(START, "uni--1")
+        provider.commit_watermark()
+
+        records = [record async for record in ThreadedDataProvider(provider).download_proposals(self.client)]
+        self.assertEqual([record.post_id for record in records], ["aave--1", "uni--2"])
+        provider.commit_watermark()
+        self.assertEqual(provider.get_watermark().doc_id, "uni--2")
+
+
+if __name__ == "__main__":
+    unittest.main()
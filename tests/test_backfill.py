@@ -0,0 +1,196 @@
+"""
+Tests for the resumable proposal backfill.
+"""
+
+import itertools
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.backfill import Backfill
+from database.fakes import FakeFirestoreClient
+from database.mongo_provider import MongoDataProvider
+from database.scan_proposal import FirebaseDataProvider
+from database.seen_ids import SeenIdStore, get_seen_ids, seen_ids_path
+from database.watermark import Watermark
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def add_posts(collection, count):
+    for i in range(count):
+        collection.document(f"uni--{i:04d}").set({
+            "id": f"uni--{i:04d}",
+            "house_id": "uni.eth",
+            "post_type": "snapshot_proposal" if i % 4 else "discourse_post",
+            # Pairs of documents share a timestamp, so pages split ties
+            "created_at": START + timedelta(seconds=i // 2),
+            "title": f"Proposal {i}",
+            "description": f"Body {i}",
+        })
+
+
+class InterruptingProvider:
+    """Wraps a provider and fails after a number of pages, like a dropped connection."""
+
+    def __init__(self, provider, fail_after):
+        self.provider = provider
+        self.fail_after = fail_after
+
+    def backfill_pages(self, connection, after=None, page_size=500):
+        for count, page in enumerate(self.provider.backfill_pages(connection, after, page_size)):
+            if count == self.fail_after:
+                raise ConnectionError("deadline exceeded")
+            yield page
+
+    def commit_watermark(self):
+        self.provider.commit_watermark()
+
+
+class TestFirebaseBackfill(unittest.TestCase):
+    """Test cases for Backfill over FirebaseDataProvider."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.data_dir = self.temp_dir.name
+        self.client = FakeFirestoreClient()
+        self.collection = self.client.collection("ai_posts")
+        add_posts(self.collection, 100)
+        self.expected = [f"uni--{i:04d}" for i in range(100) if i % 4]
+
+    def provider(self):
+        return FirebaseDataProvider({"data_dir": self.data_dir})
+
+    def seen_ids(self):
+        # A fresh instance reads what was persisted, not the shared in-memory set
+        return list(SeenIdStore(seen_ids_path(self.data_dir)))
+
+    def test_pages_through_the_whole_history(self):
+        """Every proposal is written once, beyond any single-query cap, and the watermark is set."""
+        clock = itertools.count(0, 0.5)
+        stats = Backfill(self.provider(), self.data_dir, page_size=10, clock=lambda: next(clock)).run(self.client)
+
+        self.assertEqual(self.seen_ids(), self.expected)
+        self.assertEqual((stats["documents"], stats["rows"], stats["pages"]), (75, 75, 8))
+        self.assertTrue(stats["complete"])
+        self.assertGreater(stats["docs_per_second"], 0)
+        self.assertEqual(Watermark(os.path.join(self.data_dir, "firebase_watermark.json")).doc_id, "uni--0099")
+        self.assertFalse(Backfill.is_pending(self.data_dir))
+
+    def test_interrupted_backfill_resumes_from_checkpoint(self):
+        """A failure mid-way leaves a checkpoint; the next run fetches only the remaining pages."""
+        with self.assertRaises(ConnectionError):
+            Backfill(InterruptingProvider(self.provider(), fail_after=3), self.data_dir, page_size=10).run(self.client)
+        self.assertTrue(Backfill.is_pending(self.data_dir))
+        self.assertEqual(self.seen_ids(), self.expected[:30])
+
+        calls_before = self.collection.stream_calls
+        stats = Backfill(self.provider(), self.data_dir, page_size=10).run(self.client)
+
+        self.assertEqual(self.seen_ids(), self.expected)
+        self.assertEqual(self.collection.stream_calls - calls_before, 5)
+        self.assertEqual(stats["pages"], 8)
+
+    def test_ids_written_after_the_last_checkpoint_are_not_duplicated(self):
+        """IDs appended by a page whose checkpoint was never saved are written once on resume."""
+        Backfill(self.provider(), self.data_dir, page_size=10).run(self.client, max_pages=2)
+        # The third page was appended, then the process died before checkpointing it
+        get_seen_ids(seen_ids_path(self.data_dir)).add_many(self.expected[15:23])
+
+        Backfill(self.provider(), self.data_dir, page_size=10).run(self.client)
+        self.assertEqual(self.seen_ids(), self.expected)
+        with open(seen_ids_path(self.data_dir)) as f:
+            self.assertEqual(len(f.readlines()), 75)
+
+    def test_completed_backfill_starts_over(self):
+        """A finished checkpoint is not resumed; running again rebuilds the file."""
+        Backfill(self.provider(), self.data_dir, page_size=50).run(self.client)
+        stats = Backfill(self.provider(), self.data_dir, page_size=50).run(self.client)
+
+        self.assertEqual(stats["rows"], 75)
+        self.assertEqual(self.seen_ids(), self.expected)
+        with open(os.path.join(self.data_dir, "backfill_checkpoint.json")) as f:
+            self.assertTrue(json.load(f)["complete"])
+
+
+class TestCheckPastData(unittest.TestCase):
+    """Test cases for the bot's check that the data directory was initialized."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        from main import GovernanceTradingBot
+
+        self.bot = GovernanceTradingBot.__new__(GovernanceTradingBot)
+        self.bot.config = {"data_dir": self.temp_dir.name}
+        self.bot.logger = logging.getLogger(__name__)
+
+    def touch(self, name, content=""):
+        with open(os.path.join(self.temp_dir.name, name), "w") as f:
+            f.write(content)
+
+    def test_backfill_without_proposal_table_is_not_initialized(self):
+        """A crash after the backfill but before proposal_post_all.csv is written is initialized again."""
+        for name in ("watermark_firebase.json", "seen_post_ids.txt", "near_duplicate_audit.jsonl"):
+            self.touch(name)
+        self.touch("backfill_checkpoint.json", json.dumps({"complete": True}))
+        self.assertFalse(self.bot.check_past_data())
+
+        self.touch("proposal_post_all.csv")
+        self.assertTrue(self.bot.check_past_data())
+
+    def test_interrupted_backfill_is_not_initialized(self):
+        """An incomplete checkpoint resumes the backfill even if the proposal table exists."""
+        self.touch("proposal_post_all.csv")
+        self.touch("backfill_checkpoint.json", json.dumps({"complete": False}))
+        self.assertFalse(self.bot.check_past_data())
+
+
+class PagedCollection:
+    """Stub collection serving canned aggregate pages."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.pipelines = []
+
+    def aggregate(self, pipeline, **kwargs):
+        self.pipelines.append(pipeline)
+        return iter(self.pages.pop(0) if self.pages else [])
+
+    def index_information(self):
+        return {"created_at_-1": {"key": [("created_at", -1)]}}
+
+
+class TestMongoBackfill(unittest.TestCase):
+    """Test cases for MongoDataProvider.backfill_pages."""
+
+    def test_pages_oldest_first_from_the_beginning(self):
+        """The first page has no cursor and sorts ascending; later pages start after the previous one."""
+        docs = [{"post_id": f"uni--{i}", "created_at": f"2026-01-01T00:00:0{i}Z"} for i in range(3)]
+        collection = PagedCollection([[{"_id": "uni", "docs": docs[:2]}], [{"_id": "uni", "docs": docs[2:]}]])
+        provider = MongoDataProvider({})
+        pages = list(provider.backfill_pages((None, {"proposals": collection}), page_size=2))
+
+        self.assertEqual([page["uni"].post_ids() for page, _, _ in pages], [["uni--0", "uni--1"], ["uni--2"]])
+        self.assertEqual([cursor for _, cursor, _ in pages],
+                         [("2026-01-01T00:00:01Z", "uni--1"), ("2026-01-01T00:00:02Z", "uni--2")])
+        first, second = collection.pipelines
+        self.assertEqual(len(first[0]["$match"]["$and"]), 1)
+        self.assertEqual(first[1], {"$sort": {"created_at": 1, "post_id": 1}})
+        self.assertEqual(second[0]["$match"]["$and"][-1]["$or"][1],
+                         {"created_at": "2026-01-01T00:00:01Z", "post_id": {"$gt": "uni--1"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
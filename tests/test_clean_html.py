@@ -0,0 +1,81 @@
+"""
+Tests for the shared HTML-to-text component.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from bs4 import BeautifulSoup
+
+from utils import clean_html
+from utils.clean_html import HTMLCleaner, html_to_text, remove_html_tags
+
+
+class TestHTMLToText(unittest.TestCase):
+    """Test cases for html_to_text."""
+
+    CASES = [
+        "<p>Raise the <b>staking</b> rewards &amp; cut fees<br/>now</p>",
+        "<div>Unclosed <i>tags and 1 < 2 > 0",
+        "<script>var x = 1;</script><style>p {}</style><!-- note -->Visible&nbsp;text &#39;quoted&#39;",
+        "<![CDATA[raw]]><template>hidden</template><textarea>shown</textarea>",
+        "<!DOCTYPE html><html><head><title>T</title></head><body>&copy;2024 &hellip;</body></html>",
+        "Plain text without markup",
+        "",
+    ]
+
+    def test_matches_beautifulsoup(self):
+        """Output is identical to BeautifulSoup's html.parser get_text()."""
+        for html_text in self.CASES:
+            with self.subTest(html_text=html_text):
+                self.assertEqual(html_to_text(html_text), BeautifulSoup(html_text, "html.parser").get_text())
+
+    def test_plain_text_skips_parser(self):
+        """Text without markup or entities is returned without parsing."""
+        with mock.patch.object(clean_html, "_TextExtractor") as extractor:
+            self.assertEqual(html_to_text("No markup here"), "No markup here")
+        extractor.assert_not_called()
+
+    def test_remove_html_tags_paragraphs(self):
+        """remove_html_tags still splits the text into paragraphs."""
+        self.assertEqual(remove_html_tags("<p>One</p>\n\n<p>Two &amp; three</p>"), ["One", "Two & three"])
+
+
+class TestHTMLCleaner(unittest.TestCase):
+    """Test cases for the memoizing HTMLCleaner."""
+
+    def test_memoized_per_post(self):
+        """Content of the same post is parsed once."""
+        cleaner = HTMLCleaner()
+        with mock.patch.object(clean_html, "html_to_text", wraps=html_to_text) as convert:
+            self.assertEqual(cleaner.clean("<p>Vote</p>", "uni--1"), "Vote")
+            self.assertEqual(cleaner.clean("<p>Vote</p>", "uni--1"), "Vote")
+        convert.assert_called_once()
+        self.assertEqual(cleaner.stats, {"hits": 1, "misses": 1})
+
+    def test_edited_post_is_cleaned_again(self):
+        """A post whose content changed is not served from the cache."""
+        cleaner = HTMLCleaner()
+        cleaner.clean("<p>Draft</p>", "uni--1")
+        self.assertEqual(cleaner.clean("<p>Final</p>", "uni--1"), "Final")
+        self.assertEqual(cleaner.stats["misses"], 2)
+
+    def test_cache_is_bounded(self):
+        """The least recently used posts are evicted."""
+        cleaner = HTMLCleaner(max_entries=2)
+        cleaner.clean("<p>a</p>", "a")
+        cleaner.clean("<p>b</p>", "b")
+        cleaner.clean("<p>a</p>", "a")
+        cleaner.clean("<p>c</p>", "c")
+        self.assertEqual(list(cleaner._cache), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
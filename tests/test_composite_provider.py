@@ -0,0 +1,140 @@
+"""
+Tests for the multi-source composite data provider.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.composite_provider import CompositeDataProvider
+from database.proposal_record import ProposalBatch, ProposalRecord
+from database.scan_proposal import DataProvider, create_data_provider
+from database.seen_ids import seen_ids_path
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class StubSource(DataProvider):
+    """Serves fixed proposals, optionally after another source has finished."""
+
+    def __init__(self, listings, wait_for=None, error=None):
+        self.listings = listings
+        self.wait_for = wait_for
+        self.error = error
+        self.done = threading.Event()
+        self.commits = 0
+
+    def connect(self):
+        return object()
+
+    def disconnect(self, connection):
+        pass
+
+    def download_proposals(self, connection, scan_mode=True):
+        try:
+            if self.wait_for is not None:
+                self.wait_for.wait(5)
+                # Let the other source's future complete first
+                time.sleep(0.05)
+            if self.error is not None:
+                raise self.error
+            return {protocol: ProposalBatch([ProposalRecord(protocol, post_id, START) for post_id in post_ids])
+                    for protocol, post_ids in self.listings.items()}
+        finally:
+            self.done.set()
+
+    def commit_watermark(self):
+        self.commits += 1
+
+
+class TestCompositeDataProvider(unittest.TestCase):
+    """Test cases for CompositeDataProvider."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config = {"data_dir": self.temp_dir.name, "source_timeout": 5}
+
+    def composite(self, **sources):
+        provider = CompositeDataProvider(sources, self.config)
+        return provider, provider.connect()
+
+    def test_first_source_to_deliver_wins_and_tags_records(self):
+        """A post_id delivered by both sources keeps the faster source's records."""
+        fast = StubSource({"uni": ["uni--1", "uni--2"]})
+        slow = StubSource({"uni": ["uni--2", "uni--3"], "aave": ["aave--1"]}, wait_for=fast.done)
+        provider, connection = self.composite(slow=slow, fast=fast)
+
+        merged = provider.download_proposals(connection)
+
+        self.assertEqual(merged["uni"].post_ids(), ["uni--1", "uni--2", "uni--3"])
+        self.assertEqual([record.source for record in merged["uni"]], ["fast", "fast", "slow"])
+        self.assertEqual(merged["aave"][0].source, "slow")
+
+        stats = provider.source_stats()
+        self.assertEqual((stats["fast"]["delivered"], stats["fast"]["first"]), (2, 2))
+        self.assertEqual((stats["slow"]["delivered"], stats["slow"]["first"]), (3, 2))
+        self.assertEqual(stats["slow"]["latency_ms"]["count"], 1)
+
+    def test_failed_source_is_skipped_and_keeps_its_watermark(self):
+        """One source failing still returns the others; only merged sources commit."""
+        healthy = StubSource({"uni": ["uni--1"]})
+        broken = StubSource({}, error=ConnectionError("unavailable"))
+        provider, connection = self.composite(healthy=healthy, broken=broken)
+
+        with self.assertLogs(provider.logger, level="ERROR"):
+            merged = provider.download_proposals(connection)
+        provider.commit_watermark()
+
+        self.assertEqual(merged["uni"].post_ids(), ["uni--1"])
+        self.assertEqual((healthy.commits, broken.commits), (1, 0))
+        self.assertEqual(provider.source_stats()["broken"]["errors"], 1)
+
+    def test_every_source_failing_raises(self):
+        """With no source answering, the scan fails like a single provider would."""
+        provider, connection = self.composite(a=StubSource({}, error=ConnectionError("a")),
+                                              b=StubSource({}, error=ConnectionError("b")))
+        with self.assertLogs(provider.logger, level="ERROR"), self.assertRaises(ConnectionError):
+            provider.download_proposals(connection)
+
+    def test_slow_source_times_out(self):
+        """A source still running at the timeout is skipped for the scan."""
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        self.config["source_timeout"] = 0.1
+        provider, connection = self.composite(quick=StubSource({"uni": ["uni--1"]}),
+                                              stuck=StubSource({"uni": ["uni--2"]}, wait_for=gate))
+
+        with self.assertLogs(provider.logger, level="ERROR"):
+            merged = provider.download_proposals(connection)
+        self.assertEqual(merged["uni"].post_ids(), ["uni--1"])
+        self.assertEqual(provider.source_stats()["stuck"]["errors"], 1)
+
+    def test_new_proposals_are_checked_once(self):
+        """check_new_proposals returns each merged proposal once."""
+        provider, connection = self.composite(a=StubSource({"uni": ["uni--1"]}), b=StubSource({"uni": ["uni--1"]}))
+        merged = provider.download_proposals(connection)
+
+        new = provider.check_new_proposals(merged, seen_ids_path(self.temp_dir.name))
+        self.assertEqual(new.post_ids(), ["uni--1"])
+
+    def test_factory_builds_a_composite_from_a_list(self):
+        """A comma-separated provider type creates one source per entry."""
+        provider = create_data_provider("firebase, mongodb", self.config)
+
+        self.assertIsInstance(provider, CompositeDataProvider)
+        self.assertEqual(list(provider.providers), ["firebase", "mongodb"])
+        self.assertEqual(type(provider.providers["mongodb"]).__name__, "MongoDataProvider")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for per-proposal deadline propagation.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.proposal_record import ProposalBatch
+from utils.deadline import Deadline, DeadlineExceeded, parse_timestamp
+from models.reasoning import Reasoning
+from models.summarization import Summarization
+
+
+class TestDeadline(unittest.TestCase):
+    """Test cases for the Deadline helper and the stages that honour it."""
+
+    def test_parse_timestamp_formats(self):
+        """Datetimes, epoch seconds/milliseconds and ISO strings are understood."""
+        expected = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+        self.assertEqual(parse_timestamp(datetime(2024, 5, 1, 12, 0)), expected)
+        self.assertEqual(parse_timestamp(expected), expected)
+        self.assertEqual(parse_timestamp(expected * 1000), expected)
+        self.assertEqual(parse_timestamp("2024-05-01T12:00:00Z"), expected)
+        self.assertEqual(parse_timestamp(str(expected)), expected)
+        self.assertIsNone(parse_timestamp("not a date"))
+        self.assertIsNone(parse_timestamp(float("nan")))
+        self.assertIsNone(parse_timestamp("nan"))
+        self.assertIsNone(parse_timestamp(pd.NaT))
+
+    def test_deadline_from_timestamp(self):
+        """The deadline is the timestamp plus the budget."""
+        now = [1000.0]
+        deadline = Deadline.from_timestamp(900, 300, clock=lambda: now[0])
+        self.assertEqual(deadline.remaining(), 200)
+        self.assertTrue(deadline.has_time_for(200))
+        self.assertEqual(deadline.timeout(default=60), 60)
+        now[0] = 1200.0
+        self.assertTrue(deadline.expired())
+        with self.assertRaises(DeadlineExceeded):
+            deadline.check("order placement")
+
+    def test_unparseable_timestamp_starts_budget_now(self):
+        """A missing timestamp gives the full budget from now."""
+        deadline = Deadline.from_timestamp(None, 300, clock=lambda: 1000.0)
+        self.assertEqual(deadline.expires_at, 1300.0)
+
+    def test_nan_timestamp_starts_budget_now(self):
+        """An empty timestamp cell of a DataFrame counts as missing rather than giving a NaN deadline."""
+        frame = pd.DataFrame([{"coin": "uni", "post_id": "uni--1", "timestamp": 1000.0, "description": "text"},
+                              {"coin": "uni", "post_id": "uni--2", "timestamp": float("nan"), "description": "text"}])
+        record = ProposalBatch.from_frame(frame)[1]
+        for timestamp in (record.timestamp, float("nan"), pd.NaT):
+            deadline = Deadline.from_timestamp(timestamp, 300, clock=lambda: 1000.0)
+            self.assertEqual(deadline.expires_at, 1300.0)
+            self.assertFalse(deadline.expired())
+            self.assertTrue(deadline.has_time_for(60))
+
+    def test_summarization_skips_llm_near_deadline(self):
+        """Summarization truncates instead of calling Ollama when time is short."""
+        summarizer = Summarization("mock", base_url="http://127.0.0.1:9")
+        deadline = Deadline(expires_at=1005.0, clock=lambda: 1000.0)
+        text = " ".join(f"word{i}" for i in range(200))
+        summary = summarizer.summarize_text(text, deadline=deadline)
+        self.assertEqual(summary.split(), text.split()[:60])
+
+    def test_reasoning_skips_remote_calls_near_deadline(self):
+        """Remote sentiment calls are skipped and the trained score is kept."""
+        with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": "http://127.0.0.1:9/v1", "AGENT_KEY": "mock"}):
+            reasoning = Reasoning(openai_api_key="mock", base_url="http://127.0.0.1:9/v1")
+        try:
+            deadline = Deadline(expires_at=1005.0, clock=lambda: 1000.0)
+            with mock.patch.object(reasoning, "get_openai_sentiment") as openai_call, \
+                    mock.patch.object(reasoning, "get_deepseek_sentiment") as deepseek_call:
+                sentiment, score = reasoning.predict_sentiment("summary", 0.85, deadline=deadline)
+            openai_call.assert_not_called()
+            deepseek_call.assert_not_called()
+            self.assertIsNone(sentiment)
+            self.assertEqual(score, 0.85)
+        finally:
+            reasoning.close()
+
+    def test_reasoning_skips_only_optional_call(self):
+        """With moderate headroom only the optional Deepseek call is dropped."""
+        with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": "http://127.0.0.1:9/v1", "AGENT_KEY": "mock"}):
+            reasoning = Reasoning(openai_api_key="mock", base_url="http://127.0.0.1:9/v1", fast_model=None)
+        try:
+            deadline = Deadline(expires_at=1030.0, clock=lambda: 1000.0)
+            with mock.patch.object(reasoning, "get_openai_sentiment", return_value=("positive", 0.9)) as openai_call, \
+                    mock.patch.object(reasoning, "get_deepseek_sentiment") as deepseek_call:
+                sentiment, _ = reasoning.predict_sentiment("summary", 0.85, deadline=deadline)
+            openai_call.assert_called_once_with("summary", deadline)
+            deepseek_call.assert_not_called()
+            self.assertEqual(sentiment, "positive")
+        finally:
+            reasoning.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
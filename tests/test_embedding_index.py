@@ -0,0 +1,111 @@
+"""
+Tests for the proposal embedding index.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from utils.embedding_index import EmbeddingIndex, normalize
+
+
+def make_vectors(n, dim=32, topics=20, seed=0):
+    rng = np.random.RandomState(seed)
+    centers = rng.randn(topics, dim)
+    return normalize(centers[rng.randint(topics, size=n)] + 0.3 * rng.randn(n, dim))
+
+
+class TestEmbeddingIndex(unittest.TestCase):
+    """Test cases for EmbeddingIndex."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "embedding_index")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_search_returns_nearest_with_metadata(self):
+        """An exact scan returns the closest proposals, most similar first."""
+        vectors = make_vectors(50)
+        index = EmbeddingIndex(self.path, dim=32)
+        for i, vector in enumerate(vectors):
+            self.assertTrue(index.add(f"p{i}", vector, coin="uni", sentiment_score=i / 50))
+
+        results = index.search(vectors[7], k=3)
+        self.assertEqual(results[0][0], "p7")
+        self.assertAlmostEqual(results[0][1], 1.0, places=5)
+        self.assertEqual(results[0][2], {"coin": "uni", "sentiment_score": 7 / 50})
+        self.assertEqual(len(results), 3)
+        self.assertGreaterEqual(results[1][1], results[2][1])
+
+        excluded = index.search(vectors[7], k=3, exclude="p7")
+        self.assertNotIn("p7", [post_id for post_id, _, _ in excluded])
+        self.assertEqual(len(excluded), 3)
+
+    def test_duplicates_are_ignored(self):
+        """A proposal already in the index is not added twice."""
+        index = EmbeddingIndex(self.path, dim=32)
+        vector = make_vectors(1)[0]
+        self.assertTrue(index.add("p1", vector))
+        self.assertFalse(index.add("p1", vector))
+        self.assertEqual(index.add_batch(["p1", "p2", "p2"], [vector] * 3), 1)
+        self.assertEqual(len(index), 2)
+
+    def test_persists_across_restarts(self):
+        """Vectors and metadata are reloaded from disk, including after the file grows."""
+        vectors = make_vectors(40)
+        index = EmbeddingIndex(self.path, dim=32, initial_capacity=16)
+        index.add_batch([f"p{i}" for i in range(40)], vectors, [{"coin": "aave"}] * 40)
+        index.close()
+
+        reopened = EmbeddingIndex(self.path)
+        self.assertEqual(len(reopened), 40)
+        self.assertEqual(reopened.dim, 32)
+        self.assertIn("p39", reopened)
+        self.assertEqual(reopened.search(vectors[39], k=1)[0][:1], ("p39",))
+        self.assertEqual(reopened.search(vectors[39], k=1)[0][2], {"coin": "aave"})
+
+        # Incremental updates continue where the previous process stopped
+        reopened.add("p40", vectors[0])
+        reopened.close()
+        self.assertEqual(EmbeddingIndex(self.path).ids[-1], "p40")
+
+    def test_ivf_search_matches_exact_scan(self):
+        """Once trained, the IVF lookup finds the exact nearest neighbours of clustered data."""
+        vectors = make_vectors(600)
+        index = EmbeddingIndex(self.path, dim=32, ivf_min_size=200, nprobe=4)
+        for start in range(0, 500, 50):
+            index.add_batch([f"p{i}" for i in range(start, start + 50)], vectors[start:start + 50])
+        self.assertIsNotNone(index._centroids)
+
+        hits = 0
+        for probe in vectors[500:]:
+            exact = {f"p{i}" for i in np.argsort(-(vectors[:500] @ probe))[:5]}
+            hits += len(exact & {post_id for post_id, _, _ in index.search(probe, k=5)})
+        self.assertGreaterEqual(hits / 500, 0.9)
+
+        # Centroids are persisted and vectors reassigned on reopen
+        index.close()
+        reopened = EmbeddingIndex(self.path, ivf_min_size=200)
+        self.assertIsNotNone(reopened._centroids)
+        self.assertEqual(sum(len(cluster) for cluster in reopened._lists), 500)
+
+    def test_rejects_wrong_dimension(self):
+        """Vectors of the wrong size raise ValueError."""
+        index = EmbeddingIndex(self.path, dim=32)
+        with self.assertRaises(ValueError):
+            index.add("p1", np.ones(16))
+
+
+if __name__ == "__main__":
+    unittest.main()
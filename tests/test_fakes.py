@@ -0,0 +1,156 @@
+"""
+Tests for the in-memory Firestore and MongoDB stand-ins and the synthetic proposals.
+"""
+
+import sys
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.fakes import (FakeFirestoreClient, FakeMongoClient, load_firestore, load_mongo,
+                            synthetic_proposals)
+from database.mongo_provider import MongoDataProvider
+from database.proposal_listener import ListenerUnavailable
+from database.scan_proposal import FirebaseDataProvider
+
+
+def ids(proposal_dict):
+    return {protocol: batch.post_ids() for protocol, batch in proposal_dict.items() if batch}
+
+
+class TestFakeMongoCollection(unittest.TestCase):
+    """Test cases for FakeMongoClient running MongoDataProvider's pipelines."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.proposals = synthetic_proposals(300, n_protocols=7, seed=3)
+        self.client = FakeMongoClient()
+        load_mongo(self.client, self.proposals[:200])
+        self.collection = self.client["governance_data"]["proposals"]
+        self.provider = MongoDataProvider({"data_dir": self.temp_dir.name, "watermark_page_size": 25})
+
+    def plain_scan(self, pipeline):
+        # A leading empty $match turns off the index scan
+        return list(self.collection.aggregate([{"$match": {}}] + pipeline))
+
+    def test_index_scan_matches_a_plain_scan(self):
+        """Paging pipelines return the same groups with and without the index scan, also after inserts."""
+        middle = self.proposals[120]
+        pipelines = [
+            self.provider.build_pipeline(25, after=(middle["created_at"], middle["post_id"])),
+            self.provider.build_pipeline(25, after=(middle["created_at"], "")),
+            self.provider.build_pipeline(25, oldest_first=True),
+            self.provider.build_pipeline(20, since=middle["created_at"]),
+        ]
+        for pipeline in pipelines:
+            self.assertEqual(list(self.collection.aggregate(pipeline)), self.plain_scan(pipeline))
+
+        load_mongo(self.client, self.proposals[200:])
+        for pipeline in pipelines:
+            self.assertEqual(list(self.collection.aggregate(pipeline)), self.plain_scan(pipeline))
+
+    def test_groups_are_projected_and_ordered_by_newest(self):
+        """Groups carry the pushed fields and come newest protocol first."""
+        groups = list(self.collection.aggregate(self.provider.build_pipeline(20, since=self.proposals[0]["created_at"])))
+
+        newest = self.proposals[199]
+        self.assertEqual(groups[0]["_id"], newest["protocol"])
+        self.assertEqual(groups[0]["latest"], newest["created_at"])
+        self.assertEqual(set(groups[0]["docs"][0]) - {"discussion_link"},
+                         {"post_id", "created_at", "title", "description"})
+        self.assertEqual([group["latest"] for group in groups],
+                         sorted((group["latest"] for group in groups), reverse=True))
+
+    def test_provider_catches_up_from_the_watermark(self):
+        """A watermark scan pages through every snapshot proposal once, then finds nothing."""
+        watermark = self.provider.get_watermark()
+        watermark.observe(self.proposals[0]["created_at"] - timedelta(seconds=1), "")
+        self.provider.commit_watermark()
+
+        proposal_dict = self.provider.download_proposals(self.client)
+        self.provider.commit_watermark()
+
+        expected = {p["post_id"] for p in self.proposals[:200] if p["post_type"] == "snapshot_proposal"}
+        self.assertEqual({post_id for post_ids in ids(proposal_dict).values() for post_id in post_ids}, expected)
+        self.assertEqual(ids(self.provider.download_proposals(self.client)), {})
+        self.assertIn("created_at_-1", self.collection.index_information())
+
+    def test_change_streams_are_unavailable(self):
+        """Like a standalone server, the fake makes the provider fall back to polling."""
+        listener = self.provider.listen(self.client)
+        with self.assertRaises(ListenerUnavailable):
+            listener.ensure_active()
+
+
+class TestFakeFirestoreIndex(unittest.TestCase):
+    """Test cases for the ordered results FakeFirestoreClient keeps between queries."""
+
+    def setUp(self):
+        self.client = FakeFirestoreClient()
+        self.collection = self.client.collection("ai_posts")
+        self.proposals = synthetic_proposals(40, n_protocols=3, seed=5)
+        load_firestore(self.client, self.proposals[::2])
+
+    def page(self, after):
+        query = self.collection.order_by("created_at").order_by("__name__")
+        if after is not None:
+            query = query.start_after({"created_at": after["created_at"], "__name__": after["post_id"]})
+        return [snapshot.id for snapshot in query.limit(5).stream()]
+
+    def test_writes_reach_cached_orderings(self):
+        """Inserts, updates and deletes after a query show up in the next page."""
+        cursor = self.proposals[10]
+        self.assertEqual(self.page(cursor), [p["post_id"] for p in self.proposals[12:22:2]])
+
+        load_firestore(self.client, self.proposals[11:14])
+        self.collection.document(self.proposals[14]["post_id"]).delete()
+        self.assertEqual(self.page(cursor), [p["post_id"] for p in self.proposals[11:14] + self.proposals[16:19:2]])
+
+        moved = dict(self.collection.document(self.proposals[16]["post_id"]).get().to_dict())
+        moved["created_at"] = self.proposals[39]["created_at"]
+        self.collection.document(moved["id"]).set(moved)
+        self.assertNotIn(moved["id"], self.page(cursor))
+
+
+class TestSyntheticProposals(unittest.TestCase):
+    """Test cases for synthetic_proposals and the loaders."""
+
+    def test_generation_is_deterministic(self):
+        """The same seed gives the same documents, oldest first."""
+        proposals = synthetic_proposals(50, n_protocols=12, seed=9)
+
+        self.assertEqual(proposals, synthetic_proposals(50, n_protocols=12, seed=9))
+        self.assertEqual([p["created_at"] for p in proposals], sorted(p["created_at"] for p in proposals))
+        protocols = {p["protocol"] for p in proposals}
+        self.assertFalse(any(a != b and a in b for a in protocols for b in protocols))
+
+    def test_both_backends_serve_the_same_proposals(self):
+        """Firestore and MongoDB loaded with the same documents return the same proposals."""
+        proposals = synthetic_proposals(120, n_protocols=15, seed=1)
+        firestore, mongo = FakeFirestoreClient(), FakeMongoClient()
+        load_firestore(firestore, proposals)
+        load_mongo(mongo, proposals)
+
+        results = []
+        for provider_class, client in ((FirebaseDataProvider, firestore), (MongoDataProvider, mongo)):
+            with tempfile.TemporaryDirectory() as data_dir:
+                provider = provider_class({"data_dir": data_dir, "watermark_page_size": 50})
+                provider.get_watermark().observe(proposals[0]["created_at"] - timedelta(seconds=1), "")
+                provider.commit_watermark()
+                results.append({protocol: sorted(post_ids)
+                                for protocol, post_ids in ids(provider.download_proposals(client)).items()})
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(sum(map(len, results[0].values())),
+                         sum(p["post_type"] == "snapshot_proposal" for p in proposals))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for grouping Firestore documents in FirebaseDataProvider.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.fakes import FakeFirestoreClient
+from database.scan_proposal import FirebaseDataProvider
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+def snapshot(post_id, house_id, post_type="snapshot_proposal", **extra):
+    data = {
+        "id": post_id,
+        "house_id": house_id,
+        "post_type": post_type,
+        "created_at": "2026-01-01T00:00:00Z",
+        "title": f"Title {post_id}",
+        "description": f"<p>Body of {post_id}</p>",
+        "post_url_link": f"https://forum.example.org/{post_id}",
+    }
+    data.update(extra)
+    return FakeSnapshot(post_id, data)
+
+
+class TestBuildProposalDict(unittest.TestCase):
+    """Test cases for FirebaseDataProvider.build_proposal_dict."""
+
+    def setUp(self):
+        self.provider = FirebaseDataProvider({})
+
+    def test_groups_snapshot_proposals_by_protocol(self):
+        """Each protocol gets its snapshot proposals in document order, with cleaned descriptions."""
+        docs = [
+            snapshot("uniswap--1", "uniswap.eth"),
+            snapshot("aave--1", "aave.eth"),
+            snapshot("uniswap--2", "uniswap.eth"),
+            snapshot("aave--2", "aave.eth", post_type="discourse_post"),
+        ]
+        result = self.provider.build_proposal_dict(docs)
+
+        self.assertEqual(list(result), ["uniswap", "aave"])
+        self.assertEqual(result["uniswap"].post_ids(), ["uniswap--1", "uniswap--2"])
+        self.assertEqual(result["aave"].post_ids(), ["aave--1"])
+        self.assertEqual(list(result["uniswap"].to_frame().columns), FirebaseDataProvider.PROPOSAL_COLUMNS)
+
+        record = result["aave"][0]
+        self.assertEqual(record.protocol, "aave")
+        self.assertEqual(record.coin, "aave")
+        self.assertEqual(record.description, "Body of aave--1")
+        self.assertEqual(record.discussion_link, "https://forum.example.org/aave--1")
+        self.assertIs(record.content_cleaned, True)
+
+    def test_proposal_matches_every_protocol_in_house_id(self):
+        """A proposal is listed under every protocol whose name appears in its house_id."""
+        docs = [
+            snapshot("uni--1", "uni.eth"),
+            snapshot("unicorn--1", "unicorn.eth"),
+        ]
+        result = self.provider.build_proposal_dict(docs)
+
+        self.assertEqual(result["uni"].post_ids(), ["uni--1", "unicorn--1"])
+        self.assertEqual(result["unicorn"].post_ids(), ["unicorn--1"])
+        self.assertEqual([record.protocol for record in result["uni"]], ["uni", "uni"])
+
+    def test_protocol_without_proposals_gets_empty_batch(self):
+        """Protocols whose documents are all non-proposals still get an empty batch."""
+        result = self.provider.build_proposal_dict([snapshot("comp--1", "comp.eth", post_type="discourse_post")])
+
+        self.assertEqual(list(result), ["comp"])
+        self.assertTrue(result["comp"].empty)
+        self.assertEqual(list(result["comp"].to_frame().columns), FirebaseDataProvider.PROPOSAL_COLUMNS)
+
+    def test_missing_fields(self):
+        """A missing link defaults to '' and malformed documents are skipped."""
+        no_link = snapshot("ens--1", "ens.eth")
+        del no_link._data["post_url_link"]
+        no_title = snapshot("ens--2", "ens.eth")
+        del no_title._data["title"]
+
+        with self.assertLogs(self.provider.logger, level="ERROR"):
+            result = self.provider.build_proposal_dict([no_link, no_title, snapshot("ens--3", "ens.eth")])
+
+        self.assertEqual(result["ens"].post_ids(), ["ens--1", "ens--3"])
+        self.assertEqual(result["ens"][0].discussion_link, "")
+
+
+class TestDownloadProposals(unittest.TestCase):
+    """Test cases for the Firestore query built by FirebaseDataProvider.download_proposals."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.provider = FirebaseDataProvider({"data_dir": self.temp_dir.name})
+        self.client = FakeFirestoreClient()
+        collection = self.client.collection("ai_posts")
+        for i in range(30):
+            post_type = "snapshot_proposal" if i % 3 == 0 else "discourse_post"
+            doc = snapshot(f"uni--{i:02d}", "uni.eth", post_type=post_type,
+                           created_at=f"2026-01-01T00:00:{i:02d}Z", comments=["x"] * 50)
+            collection.document(doc.id).set(doc.to_dict())
+
+    def test_filters_post_type_on_the_server(self):
+        """The recent-20 scan returns 10 proposals, not the 20 newest posts of any type."""
+        result = self.provider.download_proposals(self.client, scan_mode=True)
+        self.assertEqual(sorted(result["uni"].post_ids()), [f"uni--{i:02d}" for i in range(0, 30, 3)])
+
+    def test_selects_only_the_fields_read(self):
+        """Documents arrive with the six selected fields only."""
+        query = self.provider.proposal_query(self.client.collection("ai_posts")).select(FirebaseDataProvider.SELECTED_FIELDS)
+        fields = {field for doc in query.stream() for field in doc.to_dict()}
+        self.assertEqual(fields, set(FirebaseDataProvider.SELECTED_FIELDS))
+
+
+if __name__ == "__main__":
+    unittest.main()
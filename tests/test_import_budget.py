@@ -0,0 +1,61 @@
+"""
+Tests for lazy heavy imports and the import-time budget tool.
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from benchmarks.import_budget import parse_importtime
+
+
+class TestParseImporttime(unittest.TestCase):
+    """Test cases for parsing `-X importtime` output."""
+
+    def test_parse(self):
+        """Self time, cumulative time and nesting depth are extracted."""
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   _io",
+            "import time:       300 |        300 |     numpy.core",
+            "import time:       500 |        800 |   numpy",
+            "import time:      1000 |       1800 | pandas",
+            "some other warning line",
+        ])
+        self.assertEqual(parse_importtime(output), [
+            ("_io", 120, 120, 1),
+            ("numpy.core", 300, 300, 2),
+            ("numpy", 500, 800, 1),
+            ("pandas", 1000, 1800, 0),
+        ])
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for keeping heavy dependencies out of package imports."""
+
+    HEAVY = ["torch", "transformers", "firebase_admin", "pymongo", "boto3",
+             "langchain_community", "openai", "binance", "google.api_core", "nltk"]
+
+    def test_packages_do_not_import_heavy_dependencies(self):
+        """Importing the bot's packages leaves heavy dependencies unloaded."""
+        code = (
+            "import sys\n"
+            "import core, database, exchange, api, services, models.reasoning, models.summarization\n"
+            "import utils.text_verification, utils.clean_html\n"
+            f"print('loaded:' + ','.join(m for m in {self.HEAVY!r} if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=project_dir, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        # Modules may print configuration warnings, so pick out the marked line
+        loaded = [line for line in result.stdout.splitlines() if line.startswith("loaded:")]
+        self.assertEqual(loaded, ["loaded:"])
+
+
+if __name__ == "__main__":
+    unittest.main()
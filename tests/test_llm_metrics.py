@@ -0,0 +1,74 @@
+"""
+Tests for the LLM call telemetry.
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from utils.metrics import LLMMetrics, RollingWindow, get_llm_metrics
+from services.mock_llm_server import MockLLMServer
+from models.reasoning import Reasoning
+from models.summarization import Summarization
+
+
+class TestLLMMetrics(unittest.TestCase):
+    """Test cases for rolling LLM telemetry."""
+
+    def setUp(self):
+        get_llm_metrics().reset()
+
+    def test_rolling_percentiles(self):
+        """Percentiles are computed over the most recent samples only."""
+        window = RollingWindow(size=100)
+        for value in range(1000):
+            window.add(value)
+        summary = window.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["p50"], 949.5)
+        self.assertAlmostEqual(summary["p99"], 998.01)
+
+    def test_aggregation_per_provider_and_model(self):
+        """Calls are grouped by provider and model with outcome counts."""
+        metrics = LLMMetrics()
+        metrics.record("openai", "o1-preview", 1.5, 0, 100, 20, "success", 30, 8)
+        metrics.record("openai", "o1-preview", 2.5, 2, 100, 0, "error")
+        metrics.record("ollama", "mistral", 0.5, 0, 400, 120, "success")
+        snapshot = metrics.snapshot()
+        self.assertEqual(set(snapshot), {"openai/o1-preview", "ollama/mistral"})
+        openai_stats = snapshot["openai/o1-preview"]
+        self.assertEqual(openai_stats["calls"], 2)
+        self.assertEqual(openai_stats["outcomes"], {"success": 1, "error": 1})
+        self.assertAlmostEqual(openai_stats["latency_ms"]["p50"], 2000.0)
+        self.assertEqual(openai_stats["prompt_tokens"]["count"], 1)
+
+    def test_instrumented_calls(self):
+        """Reasoning and Summarization record every call they make."""
+        with MockLLMServer(sentiment="negative", score=0.7, summary="Fees rise sharply") as server:
+            with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": "", "AGENT_KEY": ""}):
+                reasoning = Reasoning(openai_api_key="mock", base_url=server.openai_base_url)
+            # Token usage is only reported when the reply is read to the end
+            reasoning.stream_responses = False
+            try:
+                reasoning.get_openai_sentiment("Raise protocol fees")
+            finally:
+                reasoning.close()
+            Summarization("mock", base_url=server.base_url).summarize_text("Raise protocol fees")
+
+        snapshot = get_llm_metrics().snapshot()
+        self.assertEqual(snapshot["openai/o1-preview"]["outcomes"], {"success": 1})
+        self.assertEqual(snapshot["openai/o1-preview"]["retries"]["p50"], 0)
+        self.assertIsNotNone(snapshot["openai/o1-preview"]["output_tokens"]["p50"])
+        self.assertEqual(snapshot["ollama/mock"]["outcomes"], {"success": 1})
+        self.assertEqual(snapshot["ollama/mock"]["output_tokens"]["p50"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for streamed LLM responses with early termination.
+"""
+
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from services.mock_llm_server import MockLLMServer
+from models.reasoning import Reasoning
+from models.summarization import Summarization
+
+
+class TestLLMStreaming(unittest.TestCase):
+    """Test cases for early-terminated streaming."""
+
+    def _wait_for_cancel(self, server):
+        for _ in range(50):
+            if server.stats["cancelled"]:
+                return
+            time.sleep(0.02)
+
+    def test_summary_stops_at_word_budget(self):
+        """Consumption stops at the word budget and the generation is cancelled."""
+        summary = " ".join(f"word{i}" for i in range(200))
+        with MockLLMServer(summary=summary, token_latency_ms=5) as server:
+            summarizer = Summarization("mock", base_url=server.base_url)
+            output = summarizer.summarize_text("Short proposal text")
+            self._wait_for_cancel(server)
+            self.assertEqual(output.split(), summary.split()[:20])
+            self.assertEqual(server.stats["cancelled"], 1)
+
+    def test_short_summary_completes(self):
+        """Replies under the budget are read to completion."""
+        with MockLLMServer(summary="Holders welcome the new staking rewards") as server:
+            summarizer = Summarization("mock", base_url=server.base_url)
+            self.assertEqual(summarizer.summarize_text("Staking rewards").strip(),
+                             "Holders welcome the new staking rewards")
+            self.assertEqual(server.stats["cancelled"], 0)
+
+    def test_sentiment_stream_stops_after_json(self):
+        """The sentiment stream is closed once the JSON object is complete."""
+        with MockLLMServer(sentiment="positive", score=0.875, token_latency_ms=5) as server:
+            with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": server.openai_base_url, "AGENT_KEY": "mock"}):
+                reasoning = Reasoning(openai_api_key="mock", base_url=server.openai_base_url)
+            try:
+                self.assertEqual(reasoning.get_openai_sentiment("Fee switch"), ("positive", 0.875))
+                self.assertEqual(reasoning.get_deepseek_sentiment("Fee switch"), ("positive", 0.875))
+            finally:
+                reasoning.close()
+            self._wait_for_cancel(server)
+            # The stream is abandoned before the finish chunk and [DONE] marker are sent
+            self.assertGreaterEqual(server.stats["cancelled"], 1)
+
+    def test_stream_token_usage(self):
+        """Streamed calls record the usage of the final chunk, or nothing if the stream was closed early."""
+        for malformed_rate, expected in ((1.0, (9, 8)), (0.0, (None, None))):
+            with MockLLMServer(sentiment="positive", score=0.5, malformed_rate=malformed_rate) as server:
+                with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": "", "AGENT_KEY": ""}):
+                    reasoning = Reasoning(openai_api_key="mock", base_url=server.openai_base_url)
+                call = {"prompt_tokens": None, "output_tokens": None}
+                try:
+                    reasoning._complete(reasoning.client, "mock",
+                                        [{"role": "user", "content": "Fee switch on nine mainnet pools for treasury grants"}],
+                                        call)
+                finally:
+                    reasoning.close()
+                self.assertEqual((call["prompt_tokens"], call["output_tokens"]), expected)
+
+    def test_non_streaming_fallback(self):
+        """Streaming can be switched off per instance."""
+        with MockLLMServer(sentiment="negative", score=0.6, summary="Fees rise") as server:
+            with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": "", "AGENT_KEY": ""}):
+                reasoning = Reasoning(openai_api_key="mock", base_url=server.openai_base_url)
+            reasoning.stream_responses = False
+            try:
+                self.assertEqual(reasoning.get_openai_sentiment("Fee switch"), ("negative", 0.6))
+            finally:
+                reasoning.close()
+            summarizer = Summarization("mock", base_url=server.base_url)
+            summarizer.stream_responses = False
+            self.assertEqual(summarizer.summarize_text("Fee switch").strip(), "Fees rise")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for the local OpenAI/Ollama stub server.
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from services.mock_llm_server import MockLLMServer
+from models.reasoning import Reasoning
+from models.summarization import Summarization
+
+
+class TestMockLLMServer(unittest.TestCase):
+    """Test cases for pointing Reasoning and Summarization at the stub server."""
+
+    def test_reasoning_against_stub(self):
+        """Both remote sentiment clients receive the configured JSON."""
+        with MockLLMServer(sentiment="positive", score=0.9) as server:
+            env = {"AGENT_ENDPOINT": server.openai_base_url, "AGENT_KEY": "mock"}
+            with mock.patch.dict(os.environ, env):
+                reasoning = Reasoning(openai_api_key="mock", base_url=server.openai_base_url)
+            try:
+                self.assertEqual(reasoning.get_openai_sentiment("Raise the fee switch"), ("positive", 0.9))
+                self.assertEqual(reasoning.get_deepseek_sentiment("Raise the fee switch"), ("positive", 0.9))
+            finally:
+                reasoning.close()
+
+    def test_summarization_against_stub(self):
+        """The Ollama generate endpoint streams the configured summary."""
+        summary = "Community strongly supports the treasury diversification plan"
+        with MockLLMServer(summary=summary) as server:
+            summarizer = Summarization("mock", base_url=server.base_url)
+            self.assertEqual(summarizer.summarize_text("Treasury diversification plan").strip(), summary)
+
+    def test_deterministic_sentiment(self):
+        """Derived sentiment depends only on the prompt."""
+        first = MockLLMServer().sentiment_for("Proposal text")
+        second = MockLLMServer().sentiment_for("Proposal text")
+        self.assertEqual(first, second)
+        self.assertIn(first[0], ("positive", "negative"))
+        self.assertTrue(0.5 <= first[1] < 1.0)
+
+    def test_malformed_output_exhausts_retries(self):
+        """Unparseable content makes the OpenAI path give up with (None, None)."""
+        with MockLLMServer(malformed_rate=1.0) as server:
+            with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": "", "AGENT_KEY": ""}):
+                reasoning = Reasoning(openai_api_key="mock", base_url=server.openai_base_url)
+            reasoning.retry_delay = 0
+            try:
+                self.assertEqual(reasoning.get_openai_sentiment("Raise the fee switch"), (None, None))
+            finally:
+                reasoning.close()
+            self.assertEqual(server.stats["malformed"], reasoning.max_attempts)
+
+    def test_error_injection(self):
+        """Injected errors use the configured status code."""
+        with MockLLMServer(error_rate=1.0, error_status=503) as server:
+            response = requests.post(f"{server.base_url}/api/generate", json={"prompt": "x", "stream": False})
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(server.stats["errors"], 1)
+
+    def test_latency_injection(self):
+        """Latency draws follow the configured distribution and never go negative."""
+        server = MockLLMServer(latency_ms=100, latency_jitter_ms=50, latency_distribution='uniform', seed=7)
+        draws = [server.plan_response()[0] for _ in range(200)]
+        self.assertTrue(all(0.05 <= value <= 0.15 for value in draws))
+        replay = MockLLMServer(latency_ms=100, latency_jitter_ms=50, latency_distribution='uniform', seed=7)
+        self.assertEqual(draws, [replay.plan_response()[0] for _ in range(200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,396 @@
+"""
+Tests for the MongoDB data provider.
+"""
+
+import os
+import queue
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from pymongo.errors import OperationFailure
+
+from database import scan_proposal
+from database.fakes import FakeMongoClient, load_mongo, synthetic_proposals
+from database.mongo_provider import MongoDataProvider
+from database.proposal_listener import ListenerUnavailable
+from database.watermark import Watermark
+from utils.config_loader import ConfigLoader
+
+
+class StubCollection:
+    """Records aggregation calls and returns canned protocol groups."""
+
+    def __init__(self, groups, indexes=None):
+        self.groups = groups
+        self.indexes = indexes if indexes is not None else {'_id_': {'key': [('_id', 1)]}}
+        self.aggregate_calls = []
+        self.created_indexes = []
+
+    def aggregate(self, pipeline, **kwargs):
+        self.aggregate_calls.append((pipeline, kwargs))
+        return iter(self.groups)
+
+    def index_information(self):
+        return self.indexes
+
+    def create_index(self, keys, name=None):
+        self.created_indexes.append(keys)
+        self.indexes[name] = {'key': keys}
+
+
+class TestMongoDataProvider(unittest.TestCase):
+    """Test cases for MongoDataProvider.download_proposals."""
+
+    def setUp(self):
+        self.groups = [
+            {'_id': 'uni', 'docs': [
+                {'post_id': 'uni--2', 'created_at': '2026-01-02', 'title': 'Two',
+                 'description': '<p>Fee <b>switch</b></p>', 'discussion_link': 'https://forum/2'},
+                {'post_id': 'uni--1', 'created_at': '2026-01-01', 'description': 'Plain'},
+            ]},
+            {'_id': 'aave', 'docs': [{'post_id': 'aave--1', 'created_at': '2026-01-01', 'title': 'A'}]},
+        ]
+        self.collection = StubCollection(self.groups)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.provider = MongoDataProvider({'mongo_batch_size': 50, 'mongo_scan_window_hours': 24,
+                                           'data_dir': self.temp_dir.name})
+
+    def download(self, scan_mode=True):
+        return self.provider.download_proposals((None, {'proposals': self.collection}), scan_mode)
+
+    def test_builds_one_frame_per_group(self):
+        """Each server-side group becomes one batch with cleaned descriptions and defaults."""
+        result = self.download()
+
+        self.assertEqual(list(result), ['uni', 'aave'])
+        self.assertEqual(list(result['uni'].to_frame().columns), MongoDataProvider.PROPOSAL_COLUMNS)
+        self.assertEqual(result['uni'].post_ids(), ['uni--2', 'uni--1'])
+        self.assertEqual(result['uni'][0].description, 'Fee switch')
+        self.assertEqual(result['uni'][1].title, '')
+        self.assertEqual(result['aave'][0].description, '')
+        self.assertEqual(result['aave'][0].discussion_link, '')
+        self.assertIs(result['aave'][0].content_cleaned, True)
+
+    def test_stream_yields_each_group_as_the_cursor_returns_it(self):
+        """The first group's records are yielded before the next group is read from the cursor."""
+        groups = iter(self.groups)
+        self.collection.aggregate = lambda pipeline, **kwargs: groups
+        stream = self.provider.stream_proposals((None, {'proposals': self.collection}))
+
+        self.assertEqual([next(stream).post_id for _ in range(2)], ['uni--2', 'uni--1'])
+        self.assertEqual([group['_id'] for group in groups], ['aave'])
+        self.assertEqual(list(stream), [])
+
+    def test_pipeline_filters_projects_and_groups_on_server(self):
+        """The pipeline matches type and window, sorts on created_at, projects six fields and groups by protocol."""
+        self.download()
+        pipeline, kwargs = self.collection.aggregate_calls[0]
+
+        self.assertEqual(kwargs, {'batchSize': 50})
+        self.assertEqual([next(iter(stage)) for stage in pipeline],
+                         ['$match', '$sort', '$limit', '$project', '$group', '$sort'])
+
+        match = pipeline[0]['$match']
+        self.assertIn({'post_type': 'snapshot_proposal'}, match['$and'][0]['$or'])
+        since = match['$and'][1]['$or'][0]['created_at']['$gte']
+        self.assertAlmostEqual((datetime.now(timezone.utc) - since).total_seconds(), 24 * 3600, delta=60)
+        self.assertEqual(match['$and'][1]['$or'][1]['created_at']['$gte'], since.isoformat())
+
+        self.assertEqual(pipeline[1], {'$sort': {'created_at': -1}})
+        self.assertEqual(pipeline[2], {'$limit': 20})
+        self.assertEqual(sorted(pipeline[3]['$project']),
+                         sorted(['post_id', 'protocol', 'created_at', 'title', 'description', 'discussion_link']))
+
+    def test_full_mode_has_no_time_window(self):
+        """Full mode fetches up to 1000 proposals regardless of age."""
+        self.download(scan_mode=False)
+        pipeline, _ = self.collection.aggregate_calls[0]
+
+        self.assertEqual(len(pipeline[0]['$match']['$and']), 1)
+        self.assertEqual(pipeline[2], {'$limit': 1000})
+
+    def test_created_at_index_is_created_once_if_missing(self):
+        """The created_at index is created when missing and not checked again."""
+        self.download()
+        self.download()
+        self.assertEqual(self.collection.created_indexes, [[('created_at', -1)]])
+
+        existing = StubCollection([], indexes={'ts': {'key': [('created_at', 1)]}})
+        MongoDataProvider({'data_dir': self.temp_dir.name}).download_proposals((None, {'proposals': existing}))
+        self.assertEqual(existing.created_indexes, [])
+
+
+class StubChangeStream:
+    """Serves change events pushed onto a queue, like a tailing change stream."""
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.alive = True
+
+    def try_next(self):
+        try:
+            event = self.events.get(timeout=0.05)
+        except queue.Empty:
+            return None
+        if isinstance(event, Exception):
+            self.alive = False
+            raise event
+        return event
+
+    def close(self):
+        self.alive = False
+
+
+class WatchableCollection:
+    """Stub collection whose watch() opens StubChangeStreams or raises canned errors.
+
+    Nothing was inserted before a stream opens, so catch-up fetches find nothing.
+    """
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.watch_calls = []
+        self.streams = []
+
+    def watch(self, pipeline, **kwargs):
+        self.watch_calls.append((pipeline, kwargs))
+        if self.errors:
+            raise self.errors.pop(0)
+        self.streams.append(StubChangeStream())
+        return self.streams[-1]
+
+    def aggregate(self, pipeline, **kwargs):
+        return iter([])
+
+    def insert(self, i, protocol='uni'):
+        self.streams[-1].events.put({
+            '_id': {'_data': f'token-{i}'},
+            'operationType': 'insert',
+            'fullDocument': {'post_id': f'{protocol}--{i}', 'created_at': f'2026-01-01T00:00:0{i}Z',
+                             'title': f'Proposal {i}', 'description': 'Body'}
+        })
+
+
+class TestMongoChangeStream(unittest.TestCase):
+    """Test cases for MongoDataProvider.listen."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config = {'data_dir': self.temp_dir.name, 'listener_max_failures': 3}
+
+    def listen(self, collection, provider=None):
+        provider = provider or MongoDataProvider(self.config)
+        listener = provider.listen((None, {'proposals': collection}))
+        listener.sleep = lambda seconds: None
+        self.addCleanup(listener.stop)
+        return provider, listener
+
+    def test_inserts_are_delivered_within_a_second(self):
+        """An insert reaches get_batch as soon as the stream returns it."""
+        collection = WatchableCollection()
+        provider, listener = self.listen(collection)
+        listener.ensure_active()
+
+        started = time.monotonic()
+        collection.insert(1)
+        batch = listener.get_batch(timeout=5)
+        self.assertEqual([event.id for event in batch], ['uni--1'])
+        self.assertLess(time.monotonic() - started, 1)
+
+        pipeline, kwargs = collection.watch_calls[0]
+        self.assertEqual(pipeline[0]['$match']['operationType'], 'insert')
+        self.assertIsNone(kwargs['resume_after'])
+
+    def test_batch_converts_to_proposals_by_protocol(self):
+        """Delivered inserts group by protocol, newest protocol and proposal first."""
+        collection = WatchableCollection()
+        provider, listener = self.listen(collection)
+        listener.ensure_active()
+        collection.insert(1, 'uni')
+        collection.insert(2, 'aave')
+        collection.insert(3, 'uni')
+
+        batch = []
+        while len(batch) < 3:
+            batch += listener.get_batch(timeout=5)
+        result = provider.proposals_from_documents(batch)
+
+        self.assertEqual(list(result), ['uni', 'aave'])
+        self.assertEqual(result['uni'].post_ids(), ['uni--3', 'uni--1'])
+        self.assertEqual(result['uni'][0].protocol, 'uni')
+
+    def test_restart_resumes_after_committed_token(self):
+        """The token is persisted on commit and a new provider resumes after it."""
+        collection = WatchableCollection()
+        provider, listener = self.listen(collection)
+        listener.ensure_active()
+        collection.insert(1)
+        provider.proposals_from_documents(listener.get_batch(timeout=5))
+        self.assertFalse(os.path.exists(provider.get_resume_token().path))
+
+        provider.commit_watermark()
+        listener.stop()
+
+        restarted, listener = self.listen(collection)
+        listener.ensure_active()
+        self.assertEqual(collection.watch_calls[-1][1]['resume_after'], {'_data': 'token-1'})
+
+    def test_reconnect_resumes_after_last_delivered_event(self):
+        """A dropped stream reopens after the newest event delivered, so nothing is lost or repeated."""
+        collection = WatchableCollection()
+        provider, listener = self.listen(collection)
+        listener.ensure_active()
+        collection.insert(1)
+        listener.get_batch(timeout=5)
+
+        collection.streams[-1].events.put(ConnectionError('connection reset'))
+        deadline = time.monotonic() + 5
+        while listener._handle.is_active and time.monotonic() < deadline:
+            time.sleep(0.01)
+        listener.ensure_active()
+
+        self.assertEqual(collection.watch_calls[-1][1]['resume_after'], {'_data': 'token-1'})
+        self.assertEqual(listener.subscriptions, 2)
+
+    def test_inserts_behind_the_watermark_are_skipped(self):
+        """Inserts the watermark poll already fetched are not queued again."""
+        watermark = Watermark(os.path.join(self.temp_dir.name, 'mongo_watermark.json'))
+        watermark.observe('2026-01-01T00:00:01Z', 'uni--1')
+        watermark.commit()
+
+        collection = WatchableCollection()
+        provider, listener = self.listen(collection)
+        listener.ensure_active()
+        collection.insert(1)
+        collection.insert(2)
+        self.assertEqual([event.id for event in listener.get_batch(timeout=5)], ['uni--2'])
+
+    def test_standalone_server_falls_back_to_polling(self):
+        """Without a replica set, listening raises ListenerUnavailable straight away."""
+        unsupported = OperationFailure('The $changeStream stage is only supported on replica sets', code=40573)
+        provider, listener = self.listen(WatchableCollection(errors=[unsupported]))
+        with self.assertRaises(ListenerUnavailable):
+            listener.ensure_active()
+
+    def test_expired_resume_token_starts_a_new_stream(self):
+        """A token no longer in the oplog is dropped and the stream restarts from now."""
+        provider = MongoDataProvider(self.config)
+        token = provider.get_resume_token()
+        token.observe({'_data': 'old'})
+        token.commit()
+
+        lost = OperationFailure('resume point may no longer be in the oplog', code=286)
+        collection = WatchableCollection(errors=[lost])
+        provider, listener = self.listen(collection, provider)
+        listener.ensure_active()
+
+        self.assertEqual([kwargs['resume_after'] for _, kwargs in collection.watch_calls], [{'_data': 'old'}, None])
+        self.assertFalse(os.path.exists(token.path))
+
+
+class TestMongoChangeStreamCatchUp(unittest.TestCase):
+    """Test cases for the inserts a new change stream would miss, on a replica-set FakeMongoClient."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.provider = MongoDataProvider({'data_dir': self.temp_dir.name, 'watermark_page_size': 4})
+        self.client = FakeMongoClient(replica_set=True)
+        self.proposals = synthetic_proposals(20, n_protocols=3, snapshot_share=1.0, seed=4)
+
+        # The poll cycle that runs before the bot starts listening
+        load_mongo(self.client, self.proposals[:10])
+        self.provider.get_watermark().observe(self.proposals[0]['created_at'] - timedelta(seconds=1), '')
+        self.provider.commit_watermark()
+        self.provider.download_proposals(self.client)
+        self.provider.commit_watermark()
+
+    def listen(self):
+        listener = self.provider.listen(self.client)
+        listener.sleep = lambda seconds: None
+        self.addCleanup(listener.stop)
+        listener.ensure_active()
+        return listener
+
+    def receive(self, listener, count):
+        batch = []
+        deadline = time.monotonic() + 5
+        while len(batch) < count and time.monotonic() < deadline:
+            batch += listener.get_batch(timeout=1)
+        return [event.id for event in batch]
+
+    def test_inserts_between_poll_and_subscribe_are_delivered(self):
+        """Proposals inserted after the poll but before the stream opened are fetched once, in order."""
+        load_mongo(self.client, self.proposals[10:15])
+        listener = self.listen()
+        load_mongo(self.client, self.proposals[15:])
+
+        expected = [p['post_id'] for p in self.proposals[10:]]
+        self.assertEqual(self.receive(listener, len(expected)), expected)
+        self.assertEqual(listener.get_batch(timeout=0.2), [])
+
+    def test_lost_history_catches_up_from_the_watermark(self):
+        """After the resume token fell off the oplog, proposals since the watermark are still delivered."""
+        token = self.provider.get_resume_token()
+        token.observe({'_data': 'expired'})
+        token.commit()
+        load_mongo(self.client, self.proposals[10:12])
+
+        listener = self.listen()
+        load_mongo(self.client, self.proposals[12:13])
+
+        self.assertEqual(self.receive(listener, 3), [p['post_id'] for p in self.proposals[10:13]])
+        self.assertEqual(listener.subscriptions, 1)
+
+    def test_committed_token_resumes_without_catch_up(self):
+        """A restart with a committed token resumes the stream and fetches nothing else."""
+        listener = self.listen()
+        load_mongo(self.client, self.proposals[10:11])
+        proposal_dict = self.provider.proposals_from_documents(listener.get_batch(timeout=5))
+        self.assertEqual(proposal_dict[self.proposals[10]['protocol']].post_ids(), [self.proposals[10]['post_id']])
+        self.provider.commit_watermark()
+        listener.stop()
+
+        load_mongo(self.client, self.proposals[11:12])
+        collection = self.client['governance_data']['proposals']
+        aggregate_calls = collection.aggregate_calls
+        restarted = MongoDataProvider(self.provider.config)
+        listener = restarted.listen(self.client)
+        self.addCleanup(listener.stop)
+        listener.ensure_active()
+
+        self.assertEqual([event.id for event in listener.get_batch(timeout=5)], [self.proposals[11]['post_id']])
+        self.assertEqual(collection.aggregate_calls, aggregate_calls)
+
+
+class TestProviderSelection(unittest.TestCase):
+    """Test cases for picking the MongoDB provider from the environment."""
+
+    def test_scanner_uses_mongodb_provider_from_env(self):
+        """DATA_PROVIDER_TYPE=mongodb gives ProposalScanner a MongoDataProvider rather than Firebase."""
+        with tempfile.TemporaryDirectory() as data_dir:
+            env = {'DATA_PROVIDER_TYPE': 'mongodb', 'DATA_DIR': data_dir,
+                   'BINANCE_API_KEY': 'key', 'BINANCE_API_SECRET': 'secret'}
+            with mock.patch.dict(os.environ, env):
+                config = ConfigLoader()
+            with mock.patch.object(scan_proposal, 'get_config', return_value=config):
+                scanner = scan_proposal.ProposalScanner()
+
+            self.assertIsInstance(scanner.data_provider, MongoDataProvider)
+            self.assertIsInstance(scan_proposal.create_data_provider('MongoDB', config.config), MongoDataProvider)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for MinHash/LSH near-duplicate detection.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from utils.near_duplicate import NearDuplicateIndex, NearDuplicateAuditLog
+
+PROPOSAL = (
+    "This proposal activates the protocol fee switch on the Ethereum mainnet pools. Ten percent of swap fees "
+    "will be routed to the treasury and used to fund grants, audits and liquidity mining programs over the next "
+    "twelve months. Token holders will be able to vote on the allocation every quarter, and the fee can be turned "
+    "off again by a simple majority vote if liquidity providers leave the protocol."
+)
+
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    """Test cases for NearDuplicateIndex."""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.index = NearDuplicateIndex(threshold=0.8, window_seconds=100, clock=lambda: self.now)
+        self.index.add("uni--1", PROPOSAL, {"summary": "fee switch", "sentiment": "positive", "sentiment_score": 0.9})
+
+    def test_cross_post_matches(self):
+        """A copy with formatting differences and a small edit is matched."""
+        copy = "[Snapshot] " + PROPOSAL.upper().replace("Ten percent", "10 percent")
+        match = self.index.query(copy)
+        self.assertIsNotNone(match)
+        post_id, similarity, result = match
+        self.assertEqual(post_id, "uni--1")
+        self.assertGreaterEqual(similarity, 0.8)
+        self.assertEqual(result["sentiment_score"], 0.9)
+
+    def test_different_proposal_does_not_match(self):
+        """An unrelated proposal is not matched."""
+        other = ("Deploy the protocol on Base and allocate two million tokens to bootstrap liquidity for the "
+                 "first six months, with a review by the community after three months.")
+        self.assertIsNone(self.index.query(other))
+
+    def test_exclude_self(self):
+        """A proposal is not reported as a duplicate of itself."""
+        self.assertIsNone(self.index.query(PROPOSAL, exclude="uni--1"))
+
+    def test_window_expiry(self):
+        """Entries older than the window are evicted."""
+        self.now += 101
+        self.assertIsNone(self.index.query(PROPOSAL))
+        self.assertEqual(len(self.index), 0)
+
+    def test_max_entries_and_replacement(self):
+        """The oldest entries are evicted and re-adding a post replaces it."""
+        index = NearDuplicateIndex(max_entries=2)
+        index.add("a", "first proposal text here", {})
+        index.add("b", "second proposal text here", {})
+        index.add("a", "first proposal text here again", {})
+        index.add("c", "third proposal text here", {})
+        self.assertNotIn("b", index)
+        self.assertEqual(len(index), 2)
+        self.assertTrue(all(post_ids <= {"a", "c"} for bucket in index._buckets for post_ids in bucket.values()))
+
+    def test_signature_is_deterministic(self):
+        """Signatures do not depend on the process hash seed."""
+        self.assertTrue((NearDuplicateIndex().signature(PROPOSAL) == NearDuplicateIndex().signature(PROPOSAL)).all())
+        self.assertIsNone(self.index.signature("  ...  "))
+
+
+class TestNearDuplicateAuditLog(unittest.TestCase):
+    """Test cases for the audit log."""
+
+    def test_records_are_appended(self):
+        """Each decision is written as one JSON line."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log = NearDuplicateAuditLog(os.path.join(temp_dir, "audit", "near_duplicate_audit.jsonl"))
+            log.record("uni--2", "uni--1", 0.91234, "reuse", "reused", sentiment_score=0.9)
+            log.record("uni--3", "uni--1", 0.88, "skip", "skipped")
+            with open(log.path) as f:
+                entries = [json.loads(line) for line in f]
+        self.assertEqual([entry["action"] for entry in entries], ["reused", "skipped"])
+        self.assertEqual(entries[0]["similarity"], 0.9123)
+        self.assertEqual(entries[0]["sentiment_score"], 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
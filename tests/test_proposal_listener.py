@@ -0,0 +1,138 @@
+"""
+Tests for the push-based proposal listener.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.fakes import FakeFirestoreClient
+from database.proposal_listener import ListenerUnavailable, ProposalListener
+from database.scan_proposal import DataProvider, FirebaseDataProvider
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def add_post(collection, i, post_type="snapshot_proposal"):
+    collection.document(f"uni--{i:04d}").set({
+        "id": f"uni--{i:04d}",
+        "house_id": "uni.eth",
+        "post_type": post_type,
+        "created_at": START + timedelta(seconds=i),
+        "title": f"Proposal {i}",
+        "description": f"Body {i}",
+    })
+
+
+def ids(documents):
+    return [document.id for document in documents]
+
+
+class TestFirestoreListener(unittest.TestCase):
+    """Test cases for FirebaseDataProvider.listen."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client = FakeFirestoreClient()
+        self.collection = self.client.collection("ai_posts")
+        self.provider = FirebaseDataProvider({"data_dir": self.temp_dir.name, "listener_max_failures": 3})
+
+        # A first polled cycle commits the watermark the listener starts from
+        add_post(self.collection, 0)
+        self.provider.download_proposals(self.client, scan_mode=True)
+        self.provider.commit_watermark()
+
+        self.listener = self.provider.listen(self.client)
+        self.listener.sleep = lambda seconds: None
+        self.addCleanup(self.listener.stop)
+
+    def test_new_proposal_is_delivered_within_a_second(self):
+        """A proposal written on another thread wakes get_batch well before its timeout."""
+        self.assertEqual(self.listener.get_batch(timeout=0), [])
+
+        writer = threading.Timer(0.05, add_post, (self.collection, 1))
+        started = time.monotonic()
+        writer.start()
+        batch = self.listener.get_batch(timeout=5)
+        writer.join()
+
+        self.assertEqual(ids(batch), ["uni--0001"])
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_only_new_snapshot_proposals_are_delivered_once(self):
+        """Other post types, edits and documents already processed are not queued."""
+        add_post(self.collection, 1)
+        add_post(self.collection, 2, post_type="forum_post")
+        add_post(self.collection, 1)
+
+        self.assertEqual(ids(self.listener.get_batch(timeout=1)), ["uni--0001"])
+        self.assertEqual(self.listener.get_batch(timeout=0), [])
+
+    def test_batch_converts_to_proposals_and_moves_the_watermark(self):
+        """Delivered documents group by protocol and are recorded against the watermark."""
+        add_post(self.collection, 1)
+        add_post(self.collection, 2)
+        proposals = self.provider.proposals_from_documents(self.listener.get_batch(timeout=1))
+
+        self.assertEqual(proposals["uni"].post_ids(), ["uni--0001", "uni--0002"])
+        self.provider.commit_watermark()
+        self.assertEqual(self.provider.get_watermark().doc_id, "uni--0002")
+
+    def test_resubscribes_from_watermark_after_disconnect(self):
+        """Proposals written while the stream was down arrive after it reconnects."""
+        add_post(self.collection, 1)
+        self.provider.proposals_from_documents(self.listener.get_batch(timeout=1))
+        self.provider.commit_watermark()
+
+        self.collection.disconnect_listeners()
+        add_post(self.collection, 2)
+        add_post(self.collection, 3)
+
+        self.assertEqual(ids(self.listener.get_batch(timeout=1)), ["uni--0002", "uni--0003"])
+        self.assertEqual(self.listener.subscriptions, 2)
+
+    def test_repeated_drops_make_the_listener_unavailable(self):
+        """After max_failures drops in a row the caller is told to fall back to polling."""
+        self.listener.ensure_active()
+        for _ in range(2):
+            self.collection.disconnect_listeners()
+            self.listener.ensure_active()
+
+        self.collection.disconnect_listeners()
+        with self.assertRaises(ListenerUnavailable):
+            self.listener.ensure_active()
+
+
+class TestProposalListener(unittest.TestCase):
+    """Test cases for ProposalListener subscription handling."""
+
+    def test_failed_subscriptions_back_off_then_give_up(self):
+        """Subscribe errors are retried with exponential backoff up to max_failures."""
+        delays = []
+
+        def subscribe(on_documents):
+            raise ConnectionError("stream refused")
+
+        listener = ProposalListener(subscribe, max_failures=4, backoff_seconds=1, sleep=delays.append)
+        with self.assertRaises(ListenerUnavailable):
+            listener.ensure_active()
+        self.assertEqual(delays, [1, 2, 4])
+
+    def test_polling_only_provider_is_unavailable(self):
+        """Providers without a push feed raise ListenerUnavailable so the bot polls."""
+        with self.assertRaises(ListenerUnavailable):
+            DataProvider().listen(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for the slotted proposal records and batches.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.proposal_record import ProposalBatch, ProposalRecord, select_new
+
+
+def record(protocol, post_id, **fields):
+    return ProposalRecord(protocol, post_id, "2026-01-01T00:00:00Z", **fields)
+
+
+class TestProposalRecord(unittest.TestCase):
+    """Test cases for ProposalRecord."""
+
+    def test_record_has_no_instance_dict(self):
+        """Records are slotted, so no per-instance __dict__ is allocated."""
+        proposal = record("uni", "uni--1")
+        self.assertFalse(hasattr(proposal, "__dict__"))
+        with self.assertRaises(AttributeError):
+            proposal.summary = "not a field"
+
+    def test_coin_comes_from_the_post_id(self):
+        """A proposal listed under another protocol still trades the coin in its ID."""
+        self.assertEqual(record("uni", "unicorn--1").coin, "unicorn")
+
+
+class TestProposalBatch(unittest.TestCase):
+    """Test cases for ProposalBatch conversions."""
+
+    def test_frame_round_trip(self):
+        """to_frame keeps field order and values; from_frame restores equal records."""
+        batch = ProposalBatch([record("uni", "uni--1", title="Fee switch", content_cleaned=True),
+                               record("uni", "uni--2", description="Body")])
+        frame = batch.to_frame()
+
+        self.assertEqual(list(frame.columns), list(ProposalRecord.FIELDS))
+        self.assertEqual(list(frame["post_id"]), ["uni--1", "uni--2"])
+        self.assertEqual(list(ProposalBatch.from_frame(frame)), list(batch))
+
+    def test_empty_batch_frame_has_columns(self):
+        """An empty batch still converts to a frame with every column."""
+        frame = ProposalBatch().to_frame(ProposalRecord.FIELDS + ("coin",))
+        self.assertTrue(frame.empty)
+        self.assertEqual(list(frame.columns)[-1], "coin")
+
+    def test_legacy_frame_is_accepted(self):
+        """Frames with a coin column and no protocol or title convert to records."""
+        frame = pd.DataFrame([{"post_id": "aave--1", "coin": "aave", "description": "Body",
+                               "discussion_link": "", "timestamp": 1.0, "content_cleaned": True}])
+        proposal = ProposalBatch.from_frame(frame)[0]
+
+        self.assertEqual((proposal.protocol, proposal.title, proposal.timestamp), ("aave", "", 1.0))
+        self.assertIs(proposal.content_cleaned, True)
+
+
+class TestSelectNew(unittest.TestCase):
+    """Test cases for select_new."""
+
+    def test_unseen_proposals_are_returned_once_in_scan_order(self):
+        """Seen IDs are skipped and a proposal under several protocols is returned once."""
+        proposal_dict = {
+            "uni": ProposalBatch([record("uni", "uni--1"), record("uni", "unicorn--1"), record("uni", "uni--2")]),
+            "unicorn": ProposalBatch([record("unicorn", "unicorn--1")]),
+        }
+        new = select_new(proposal_dict, {"uni--2"})
+
+        self.assertEqual(new.post_ids(), ["uni--1", "unicorn--1"])
+        self.assertEqual(new[1].protocol, "uni")
+
+
+if __name__ == "__main__":
+    unittest.main()
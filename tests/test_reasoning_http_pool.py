@@ -0,0 +1,94 @@
+"""
+Tests for connection reuse of the pooled Deepseek client in Reasoning.
+"""
+
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from models.reasoning import Reasoning
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Minimal chat-completions endpoint that records the client socket of each request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.server.client_ports.append(self.client_address[1])
+
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "n/a",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "{'positive': 0.9}"},
+                "finish_reason": "stop"
+            }]
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDeepseekConnectionPool(unittest.TestCase):
+    """Test cases for the reused Deepseek HTTP client."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+        self.server.client_ports = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        endpoint = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": endpoint, "AGENT_KEY": "test-key"}):
+            self.reasoning = Reasoning(openai_api_key="test-key")
+        # The stub answers with plain JSON rather than an event stream
+        self.reasoning.stream_responses = False
+
+    def tearDown(self):
+        self.reasoning.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_deepseek_client_created_once(self):
+        """The Deepseek client is built at construction time and reused."""
+        client = self.reasoning.deepseek_client
+        self.assertIsNotNone(client)
+        self.reasoning.get_deepseek_sentiment("Proposal to increase staking rewards")
+        self.assertIs(self.reasoning.deepseek_client, client)
+
+    def test_connections_are_reused(self):
+        """Sequential calls share a single keep-alive connection."""
+        for _ in range(5):
+            sentiment, score = self.reasoning.get_deepseek_sentiment("Proposal to increase staking rewards")
+            self.assertEqual(sentiment, "positive")
+            self.assertAlmostEqual(score, 0.9)
+
+        requests_served = len(self.server.client_ports)
+        connections_opened = len(set(self.server.client_ports))
+        print(f"{requests_served} requests served over {connections_opened} connection(s)")
+        self.assertEqual(requests_served, 5)
+        self.assertEqual(connections_opened, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for the offline replay data provider.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.replay_provider import ReplayDataProvider, VirtualClock, parse_speed, write_replay_rows
+from database.scan_proposal import create_data_provider
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Seconds after START: a burst of three, a lone proposal, then a burst of two
+OFFSETS = [0, 5, 20, 600, 3600, 3610]
+
+
+def ids(proposal_dict):
+    # Grouped by protocol, in order of each protocol's first proposal
+    return [post_id for batch in proposal_dict.values() for post_id in batch.post_ids()]
+
+
+class TestReplayDataProvider(unittest.TestCase):
+    """Test cases for ReplayDataProvider."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "dump.jsonl")
+        rows = [{"post_id": f"uni--{i}", "created_at": START + timedelta(seconds=offset),
+                 "title": f"Proposal {i}", "description": f"<p>Body {i}</p>"}
+                for i, offset in enumerate(OFFSETS)]
+        rows.append({"id": "aave--1", "protocol": "aave", "created_at": (START + timedelta(seconds=5)).timestamp(),
+                     "post_url_link": "https://forum/aave"})
+        rows.append({"post_id": "uni--x", "created_at": START.isoformat(), "post_type": "discourse_post"})
+        # Written out of order; the replay sorts by (created_at, post_id)
+        write_replay_rows(rows[::-1], self.path)
+        self.clock = VirtualClock(1_000_000)
+
+    def provider(self, speed, **config):
+        provider = ReplayDataProvider({"replay_path": self.path, "replay_speed": speed, **config}, clock=self.clock)
+        return provider, provider.connect()
+
+    def cycle(self, provider, connection):
+        proposal_dict = provider.download_proposals(connection)
+        provider.commit_watermark()
+        return ids(proposal_dict)
+
+    def test_scaled_speed_releases_proposals_at_their_recorded_times(self):
+        """At 100x, a minute of clock time releases 100 recorded minutes."""
+        provider, connection = self.provider("100x")
+
+        self.assertEqual(self.cycle(provider, connection), ["uni--0"])
+        self.clock.advance(0.2)
+        self.assertEqual(self.cycle(provider, connection), ["aave--1", "uni--1", "uni--2"])
+        self.clock.advance(6)
+        self.assertEqual(self.cycle(provider, connection), ["uni--3"])
+        self.clock.advance(30)
+        self.assertEqual(self.cycle(provider, connection), ["uni--4", "uni--5"])
+        self.assertTrue(provider.finished)
+
+    def test_max_speed_replays_one_burst_per_scan(self):
+        """At max speed each scan returns the next burst without waiting."""
+        provider, connection = self.provider("max", replay_window_seconds=60)
+
+        batches = [self.cycle(provider, connection) for _ in range(4)]
+        self.assertEqual(batches, [["uni--0", "uni--1", "uni--2", "aave--1"], ["uni--3"], ["uni--4", "uni--5"], []])
+
+    def test_replay_is_deterministic(self):
+        """Two replays on the same clock schedule produce identical batches and timestamps."""
+        def run():
+            self.clock = VirtualClock(1_000_000)
+            provider, connection = self.provider(10)
+            batches = []
+            while not provider.finished:
+                proposal_dict = provider.download_proposals(connection)
+                provider.commit_watermark()
+                batches.append([(record.post_id, record.timestamp) for batch in proposal_dict.values()
+                                for record in batch])
+                self.clock.advance(60)
+            return batches
+
+        self.assertEqual(run(), run())
+
+    def test_records_are_cleaned_and_rebased(self):
+        """Descriptions are plain text and timestamps move to the release time."""
+        provider, connection = self.provider(2)
+        self.clock.advance(10)
+        proposal_dict = provider.download_proposals(connection)
+
+        record = proposal_dict["uni"][1]
+        self.assertEqual((record.post_id, record.description, record.content_cleaned), ("uni--1", "Body 1", True))
+        self.assertEqual(record.timestamp, 1_000_000 + 2.5)
+        self.assertEqual(proposal_dict["aave"][0].discussion_link, "https://forum/aave")
+
+    def test_uncommitted_scan_is_repeated(self):
+        """Proposals of a cycle that failed before committing are returned again."""
+        provider, connection = self.provider("max")
+        first = ids(provider.download_proposals(connection))
+        self.assertEqual(ids(provider.download_proposals(connection)), first)
+
+    def test_factory_and_speed_parsing(self):
+        """DATA_PROVIDER_TYPE=replay builds the provider; invalid speeds are rejected."""
+        self.assertIsInstance(create_data_provider("replay", {"replay_path": self.path}), ReplayDataProvider)
+        self.assertEqual((parse_speed("100x"), parse_speed(" MAX "), parse_speed(1)), (100.0, None, 1.0))
+        with self.assertRaises(ValueError):
+            parse_speed("0")
+
+
+if __name__ == "__main__":
+    unittest.main()
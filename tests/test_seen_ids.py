@@ -0,0 +1,93 @@
+"""
+Tests for the persistent seen-ID store.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.async_provider import AsyncDataProvider
+from database.composite_provider import CompositeDataProvider
+from database.mongo_provider import MongoDataProvider
+from database.proposal_record import ProposalBatch, ProposalRecord
+from database.replay_provider import ReplayDataProvider
+from database.scan_proposal import DataProvider, FirebaseDataProvider
+from database.seen_ids import SeenIdStore, get_seen_ids, seen_ids_path
+
+
+class TestSeenIdStore(unittest.TestCase):
+    """Test cases for SeenIdStore."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.data_dir = self.temp_dir.name
+        self.path = seen_ids_path(self.data_dir)
+
+    def test_adds_are_appended_and_survive_reopening(self):
+        """Each new ID is one appended line; repeats are ignored."""
+        store = SeenIdStore(self.path)
+        self.assertTrue(store.add("uni--1"))
+        self.assertFalse(store.add("uni--1"))
+        self.assertEqual(store.add_many(["aave--1", "uni--1", "aave--1", "comp--1"]), 2)
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "uni--1\naave--1\ncomp--1\n")
+        reopened = SeenIdStore(self.path)
+        self.assertIn("aave--1", reopened)
+        self.assertNotIn("aave--2", reopened)
+        self.assertEqual(list(reopened), ["uni--1", "aave--1", "comp--1"])
+
+    def test_migrates_legacy_csv_once(self):
+        """The first open imports proposal_post_id.csv and retires it."""
+        csv_path = os.path.join(self.data_dir, "proposal_post_id.csv")
+        pd.DataFrame({"post_id": ["uni--1", "uni--2", "uni--1"]}).to_csv(csv_path)
+
+        store = SeenIdStore(self.path)
+        self.assertEqual(list(store), ["uni--1", "uni--2"])
+        self.assertFalse(os.path.exists(csv_path))
+        self.assertTrue(os.path.exists(csv_path + ".migrated"))
+
+        store.add("uni--3")
+        self.assertEqual(len(SeenIdStore(self.path)), 3)
+
+    def test_torn_last_line_is_dropped(self):
+        """A line cut short by a crash is discarded so the next append starts cleanly."""
+        with open(self.path, "w") as f:
+            f.write("uni--1\nuni--2\nuni-")
+        store = SeenIdStore(self.path)
+        self.assertEqual(list(store), ["uni--1", "uni--2"])
+        store.add("uni--3")
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "uni--1\nuni--2\nuni--3\n")
+
+    def test_check_new_proposals_uses_the_shared_store(self):
+        """IDs marked through the shared store are skipped by the next scan."""
+        batch = ProposalBatch([ProposalRecord("uni", f"uni--{i}", "2026-01-01", "", "Body", "", True)
+                               for i in range(3)])
+        provider = FirebaseDataProvider({})
+
+        get_seen_ids(self.path).add("uni--1")
+        new = provider.check_new_proposals({"uni": batch}, self.path)
+        self.assertEqual(new.post_ids(), ["uni--0", "uni--2"])
+        self.assertEqual(AsyncDataProvider().check_new_proposals({"uni": batch}, self.path).post_ids(),
+                         ["uni--0", "uni--2"])
+
+    def test_providers_share_one_check(self):
+        """Every provider uses the base class's seen-ID check."""
+        for provider_class in (FirebaseDataProvider, MongoDataProvider, ReplayDataProvider, CompositeDataProvider):
+            with self.subTest(provider=provider_class.__name__):
+                self.assertIs(provider_class.check_new_proposals, DataProvider.check_new_proposals)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for the offline lexicon used by text verification.
+"""
+
+import importlib
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+import nltk
+from utils import text_verification
+
+
+class TestLexicon(unittest.TestCase):
+    """Test cases for building and lazily loading the lexicon artifact."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "lexicon", "english_words.pkl")
+        text_verification._english_words = None
+
+    def tearDown(self):
+        text_verification._english_words = None
+        self.temp_dir.cleanup()
+
+    def test_import_does_not_download(self):
+        """Importing the module performs no NLTK downloads and loads no lexicon."""
+        with mock.patch.object(nltk, "download", side_effect=AssertionError("download at import")) as download:
+            module = importlib.reload(text_verification)
+        download.assert_not_called()
+        self.assertIsNone(module._english_words)
+
+    def test_build_and_load_roundtrip(self):
+        """The artifact is a pickled frozenset of the given words."""
+        lexicon = text_verification.build_lexicon(self.path, words=["proposal", "vote", "Vote"])
+        self.assertEqual(lexicon, frozenset({"proposal", "vote", "Vote"}))
+        self.assertEqual(text_verification.load_lexicon(self.path), lexicon)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_load_rejects_other_objects(self):
+        """Artifacts that do not hold a frozenset are refused."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            pickle.dump(["vote"], f)
+        with self.assertRaises(ValueError):
+            text_verification.load_lexicon(self.path)
+
+    def test_lexicon_loaded_lazily_once(self):
+        """The artifact is read on first use and cached afterwards."""
+        text_verification.build_lexicon(self.path, words=["vote"])
+        with mock.patch.dict(os.environ, {"LEXICON_PATH": self.path}):
+            with mock.patch.object(text_verification, "load_lexicon", wraps=text_verification.load_lexicon) as load:
+                self.assertIn("vote", text_verification.get_english_words())
+                text_verification.get_english_words()
+        load.assert_called_once_with(self.path)
+
+    def test_missing_lexicon_raises_without_download(self):
+        """Without an artifact or local corpus a LookupError is raised instead of downloading."""
+        corpus = mock.Mock()
+        corpus.words.side_effect = LookupError("words not installed")
+        with mock.patch.dict(os.environ, {"LEXICON_PATH": self.path}), \
+                mock.patch("nltk.corpus.words", corpus), \
+                mock.patch.object(nltk, "download") as download:
+            with self.assertRaises(LookupError):
+                text_verification.get_english_words()
+        download.assert_not_called()
+
+
+class TestBatchClassifier(unittest.TestCase):
+    """Test cases for the batched regex classifier."""
+
+    TEXTS = [
+        "This proposal aims to increase the staking rewards from 5% to 7.5%. It doesn't change the fee "
+        "switch, and we'll vote on Monday.",
+        'The DAO\'s treasury ("Treasury") will fund a well-known auditor -- see '
+        'https://forum.example.org/t/123 for details...',
+        "We propose to: (1) reduce the quorum; (2) extend the voting period to 7 days; (3) burn 10,000,000 tokens.",
+        "asdkj qwe zxcmn 12313 lkjsd, poiu!!! ###",
+        "",
+    ]
+
+    def setUp(self):
+        lexicon = "this proposal aims to increase the staking rewards from it does change fee switch and we vote on " \
+                  "monday dao treasury will fund a auditor see for details propose reduce quorum extend voting " \
+                  "period days burn tokens"
+        text_verification._english_words = frozenset(lexicon.split())
+
+    def tearDown(self):
+        text_verification._english_words = None
+
+    def test_tokenize(self):
+        """Contractions are split and single punctuation characters are dropped."""
+        self.assertEqual(text_verification.tokenize("It doesn't cost 10,000 UNI, e.g. at 10:30!"),
+                         ["it", "does", "n't", "cost", "10,000", "uni", "e.g", "at", "10:30"])
+        self.assertEqual(text_verification.tokenize('"Quoted" -- and/or...'),
+                         ["''", "quoted", "''", "--", "and/or", "..."])
+
+    def test_batch_matches_single(self):
+        """Batch scores equal per-text scores and classifications."""
+        scores = text_verification.text_validity_scores(self.TEXTS)
+        self.assertEqual(scores, [text_verification.text_validity_check(text) for text in self.TEXTS])
+        self.assertEqual(text_verification.classify_texts(self.TEXTS),
+                         [text_verification.classify_text(text) for text in self.TEXTS])
+        self.assertEqual(scores[-1], 0)
+
+    def test_scores_match_nltk_reference(self):
+        """Scores agree with the word_tokenize implementation."""
+        from nltk.tokenize.punkt import PunktSentenceTokenizer
+
+        # Untrained sentence splitter, so the reference runs without punkt data
+        splitter = PunktSentenceTokenizer()
+        with mock.patch("nltk.tokenize.sent_tokenize", lambda text, language="english": splitter.tokenize(text)):
+            reference = [text_verification.nltk_text_validity_check(text) for text in self.TEXTS]
+        for score, expected in zip(text_verification.text_validity_scores(self.TEXTS), reference):
+            self.assertAlmostEqual(score, expected, delta=0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for tiered fast/reasoning model escalation in Reasoning.
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from models.reasoning import Reasoning
+from utils.metrics import get_escalation_metrics
+
+
+class TestTieredSentiment(unittest.TestCase):
+    """Test cases for escalation from the fast model to the reasoning model."""
+
+    def setUp(self):
+        with mock.patch.dict(os.environ, {"AGENT_ENDPOINT": "", "AGENT_KEY": ""}):
+            self.reasoning = Reasoning(openai_api_key="test-key", fast_model="fast", reasoning_model="slow",
+                                       escalation_band=0.1, bullish_threshold=0.8, bearish_threshold=0.7)
+        self.calls = []
+        get_escalation_metrics().reset()
+
+    def tearDown(self):
+        self.reasoning.close()
+        get_escalation_metrics().reset()
+
+    def _answers(self, fast, slow):
+        def fake(description, deadline=None, model=None):
+            model = model or self.reasoning.reasoning_model
+            self.calls.append(model)
+            return fast if model == "fast" else slow
+        return mock.patch.object(self.reasoning, "get_openai_sentiment", side_effect=fake)
+
+    def test_clear_verdict_stays_on_fast_model(self):
+        """A blended score far from the threshold is not escalated."""
+        with self._answers(("positive", 0.99), ("positive", 0.5)):
+            sentiment, score = self.reasoning.predict_sentiment("text", 0.99)
+        self.assertEqual(self.calls, ["fast"])
+        self.assertEqual(sentiment, "positive")
+        self.assertAlmostEqual(score, self.reasoning.calculate_weighted_sentiment(None, 0.99, 0.99))
+        self.assertEqual(get_escalation_metrics().snapshot()["reasons"], {"clear": 1})
+
+    def test_near_threshold_escalates(self):
+        """A blended score inside the band is decided by the reasoning model."""
+        # Blends to 0.794 with the trained score, inside the 0.8 +/- 0.1 band
+        with self._answers(("positive", 0.6), ("negative", 0.9)):
+            sentiment, score = self.reasoning.predict_sentiment("text", 0.5)
+        self.assertEqual(self.calls, ["fast", "slow"])
+        self.assertEqual(sentiment, "negative")
+        self.assertAlmostEqual(score, self.reasoning.calculate_weighted_sentiment(None, 0.9, 0.5))
+        snapshot = get_escalation_metrics().snapshot()
+        self.assertEqual(snapshot["escalation_rate"], 1.0)
+        self.assertEqual(snapshot["reasons"], {"near_threshold": 1})
+
+    def test_bearish_threshold_used_for_negative_verdicts(self):
+        """Negative verdicts are compared against the bearish threshold."""
+        self.assertTrue(self.reasoning.needs_escalation("negative", 0.65))
+        self.assertFalse(self.reasoning.needs_escalation("positive", 0.65))
+        self.assertTrue(self.reasoning.needs_escalation(None, None))
+
+    def test_fast_failure_escalates_and_falls_back(self):
+        """A failed fast call escalates; a failed escalation keeps the fast verdict."""
+        with self._answers((None, None), ("positive", 0.85)):
+            self.assertEqual(self.reasoning.get_tiered_openai_sentiment("text", None, 0.5), ("positive", 0.85))
+        with self._answers(("positive", 0.6), (None, None)):
+            self.assertEqual(self.reasoning.get_tiered_openai_sentiment("text", None, 0.5), ("positive", 0.6))
+        self.assertEqual(get_escalation_metrics().snapshot()["escalations"], 2)
+
+    def test_latency_saved_estimate(self):
+        """Latency saved counts the mean reasoning latency for every fast-only decision."""
+        metrics = get_escalation_metrics()
+        metrics.record(True, "near_threshold", 0.5, 10.0)
+        metrics.record(False, "clear", 0.5)
+        metrics.record(False, "clear", 0.5)
+        snapshot = metrics.snapshot()
+        self.assertAlmostEqual(snapshot["escalation_rate"], 1 / 3)
+        self.assertAlmostEqual(snapshot["latency_saved_seconds"], 2 * 10.0 - 1.5)
+
+    def test_tiering_disabled(self):
+        """Without a fast model every call goes to the reasoning model."""
+        self.reasoning.fast_model = None
+        with self._answers(("positive", 0.99), ("positive", 0.5)):
+            self.reasoning.predict_sentiment("text", 0.99)
+        self.assertEqual(self.calls, ["slow"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Tests for near-duplicate handling in TradeLogic.trigger_trade.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+import core.trade_logic as trade_logic
+from database.proposal_record import ProposalBatch, ProposalRecord
+from database.seen_ids import SeenIdStore, seen_ids_path
+
+TEXT = ("This proposal activates the protocol fee switch on mainnet pools and routes ten percent of swap fees "
+        "to the treasury for grants and audits over twelve months.")
+
+
+class TestTriggerTradeDuplicates(unittest.TestCase):
+    """Test cases for reusing or skipping near-duplicate proposals."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        data_dir = self.temp_dir.name
+        pd.DataFrame(columns=["timestamp", "post_id", "coin", "description", "summary", "sentiment",
+                              "sentiment_score", "text_verify"]).to_csv(os.path.join(data_dir, "proposal_post_all.csv"))
+        pd.DataFrame(columns=["post_id"]).to_csv(os.path.join(data_dir, "proposal_post_id.csv"))
+        with open(os.path.join(data_dir, "proposal_post_live.json"), "w") as f:
+            json.dump({}, f)
+        self.config = {"data_dir": data_dir}
+
+        self.summary_obj = mock.Mock()
+        self.summary_obj.summarize_text.return_value = "fee switch summary"
+        self.sentiment_analyzer = mock.Mock()
+        self.sentiment_analyzer.predict.return_value = ("positive", 0.5)
+        self.sentiment_analyzer.embed.side_effect = lambda texts: np.ones((len(texts), 768))
+        self.reasoning = mock.Mock()
+        # Below the trade thresholds, so no order path is exercised
+        self.reasoning.predict_sentiment.return_value = ("negative", 0.3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, policy, post_ids=("uni--1", "uni--2"), age_seconds=0):
+        # Each run builds a new TradeLogic, like a restart, which seeds from proposal_post_all.csv
+        self.config["near_duplicate_policy"] = policy
+        timestamp = time.time() - age_seconds
+        new_rows = ProposalBatch([
+            ProposalRecord("uni", post_id, timestamp, description=TEXT if i == 0 else "[Forum copy] " + TEXT,
+                           content_cleaned=True)
+            for i, post_id in enumerate(post_ids)
+        ])
+        with mock.patch.object(trade_logic, "get_config", return_value=mock.Mock(config=self.config)), \
+                mock.patch.object(trade_logic, "ProposalScanner"), \
+                mock.patch.object(trade_logic, "SlackBot"), \
+                mock.patch.object(trade_logic, "BinanceAPI"), \
+                mock.patch.object(trade_logic, "classify_texts", lambda texts: ["genuine"] * len(texts)):
+            self.logic = trade_logic.TradeLogic()
+            self.logic.trigger_trade(new_rows, self.summary_obj, self.sentiment_analyzer, self.reasoning, None)
+        audit_path = os.path.join(self.config["data_dir"], "near_duplicate_audit.jsonl")
+        if not os.path.exists(audit_path):
+            return []
+        with open(audit_path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_reuse_policy(self):
+        """The copy reuses the original's scores and is audited."""
+        audit = self._run("reuse")
+        self.assertEqual(self.summary_obj.summarize_text.call_count, 1)
+        self.assertEqual(self.reasoning.predict_sentiment.call_count, 1)
+        self.assertEqual([(e["post_id"], e["matched_post_id"], e["action"]) for e in audit],
+                         [("uni--2", "uni--1", "reused")])
+        stored = pd.read_csv(os.path.join(self.config["data_dir"], "proposal_post_all.csv"), index_col=0)
+        self.assertEqual(list(stored["sentiment_score"]), [0.3, 0.3])
+        # Both copies are embedded in one batch after the trade decisions
+        self.sentiment_analyzer.embed.assert_called_once()
+        self.assertEqual(self.logic.embedding_index.ids, ["uni--1", "uni--2"])
+        self.assertEqual(self.logic.embedding_index.metadata[1]["sentiment_score"], 0.3)
+
+    def test_skip_policy(self):
+        """The copy is marked processed without being analysed."""
+        audit = self._run("skip")
+        self.assertEqual(self.summary_obj.summarize_text.call_count, 1)
+        self.assertEqual(audit[0]["action"], "skipped")
+        self.assertEqual(list(SeenIdStore(seen_ids_path(self.config["data_dir"]))), ["uni--1", "uni--2"])
+
+    def test_analysed_proposals_are_indexed_when_a_later_one_fails(self):
+        """Proposals analysed before an error still reach the embedding index."""
+        self.reasoning.predict_sentiment.side_effect = [("negative", 0.3), RuntimeError("model unavailable")]
+        with self.assertRaises(RuntimeError):
+            self._run("off")
+        self.assertEqual(self.logic.embedding_index.ids, ["uni--1"])
+
+    def _seed(self, age_seconds):
+        # An earlier run analyses uni--0 and writes it to proposal_post_all.csv
+        self.config["proposal_time_budget"] = 30 * 24 * 3600
+        self._run("reuse", post_ids=("uni--0",), age_seconds=age_seconds)
+        self.summary_obj.summarize_text.reset_mock()
+
+    def test_seeded_proposals_outside_the_window_do_not_match(self):
+        """A proposal from before the 72h window is not reused after a restart."""
+        self._seed(age_seconds=10 * 24 * 3600)
+        audit = self._run("reuse")
+        self.assertEqual(self.summary_obj.summarize_text.call_count, 1)
+        self.assertEqual([e["matched_post_id"] for e in audit], ["uni--1"])
+
+    def test_recent_seeded_proposals_match(self):
+        """A proposal analysed within the window is reused after a restart."""
+        self._seed(age_seconds=3600)
+        stored = pd.read_csv(os.path.join(self.config["data_dir"], "proposal_post_all.csv"), index_col=0)
+        self.assertFalse(stored["timestamp"].isna().any())
+
+        audit = self._run("reuse")
+        self.assertEqual(self.summary_obj.summarize_text.call_count, 0)
+        self.assertEqual((len(audit), audit[0]["matched_post_id"]), (2, "uni--0"))
+
+    def test_audit_policy(self):
+        """'audit' analyses both copies but still logs the match."""
+        audit = self._run("audit")
+        self.assertEqual(self.summary_obj.summarize_text.call_count, 2)
+        self.assertEqual(audit[0]["action"], "logged")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Tests for watermark-based incremental fetching.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project root to the Python path
+project_dir = str(Path(__file__).resolve().parent.parent)
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from database.fakes import FakeFirestoreClient
+from database.mongo_provider import MongoDataProvider
+from database.scan_proposal import FirebaseDataProvider
+from database.watermark import Watermark
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestWatermark(unittest.TestCase):
+    """Test cases for Watermark."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "watermark.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_commit_persists_newest_observed(self):
+        """Only commit moves the mark, to the newest (created_at, id) pair observed."""
+        watermark = Watermark(self.path)
+        watermark.observe(START + timedelta(minutes=1), "b")
+        watermark.observe(START + timedelta(minutes=1), "a")
+        watermark.observe(START, "z")
+        self.assertFalse(watermark.is_set())
+        self.assertFalse(os.path.exists(self.path))
+
+        self.assertTrue(watermark.commit())
+        reloaded = Watermark(self.path)
+        self.assertEqual((reloaded.created_at, reloaded.doc_id), (START + timedelta(minutes=1), "b"))
+
+    def test_never_moves_backwards(self):
+        """Observing older documents after a commit leaves the mark unchanged."""
+        watermark = Watermark(self.path)
+        watermark.observe("2026-01-02T00:00:00Z", "x")
+        watermark.commit()
+        watermark.observe("2026-01-01T00:00:00Z", "y")
+        self.assertFalse(watermark.commit())
+        self.assertEqual(Watermark(self.path).created_at, "2026-01-02T00:00:00Z")
+
+
+def add_posts(collection, start, count, protocol="uni", same_timestamp=False):
+    for i in range(start, start + count):
+        created_at = START if same_timestamp else START + timedelta(seconds=i)
+        collection.document(f"{protocol}--{i:04d}").set({
+            "id": f"{protocol}--{i:04d}",
+            "house_id": f"{protocol}.eth",
+            "post_type": "snapshot_proposal",
+            "created_at": created_at,
+            "title": f"Proposal {i}",
+            "description": f"Body {i}",
+        })
+
+
+class TestFirebaseIncrementalFetch(unittest.TestCase):
+    """Test cases for FirebaseDataProvider scans driven by the watermark."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config = {"data_dir": self.temp_dir.name, "watermark_page_size": 10}
+        self.client = FakeFirestoreClient()
+        self.collection = self.client.collection("ai_posts")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def scan(self):
+        provider = FirebaseDataProvider(self.config)
+        result = provider.download_proposals(self.client, scan_mode=True)
+        provider.commit_watermark()
+        return [post_id for batch in result.values() for post_id in batch.post_ids()]
+
+    def test_burst_larger_than_a_page_is_fetched_completely(self):
+        """After the first scan, every newer document is fetched across several pages, once."""
+        add_posts(self.collection, 0, 30)
+        self.assertEqual(len(self.scan()), 20)
+
+        add_posts(self.collection, 30, 35)
+        calls_before = self.collection.stream_calls
+        fetched = self.scan()
+        self.assertEqual(fetched, [f"uni--{i:04d}" for i in range(30, 65)])
+        self.assertEqual(self.collection.stream_calls - calls_before, 4)
+
+        self.assertEqual(self.scan(), [])
+
+    def test_documents_sharing_a_timestamp_are_not_skipped(self):
+        """The document ID breaks ties, so pages split inside one timestamp lose nothing."""
+        add_posts(self.collection, 0, 1)
+        self.scan()
+        add_posts(self.collection, 1, 25, same_timestamp=True)
+        self.assertEqual(sorted(self.scan()), [f"uni--{i:04d}" for i in range(1, 26)])
+
+    def test_uncommitted_scan_is_fetched_again(self):
+        """A cycle that fails before committing re-fetches the same documents."""
+        add_posts(self.collection, 0, 5)
+        self.scan()
+        add_posts(self.collection, 5, 3)
+
+        FirebaseDataProvider(self.config).download_proposals(self.client, scan_mode=True)
+        self.assertEqual(self.scan(), ["uni--0005", "uni--0006", "uni--0007"])
+
+
+class PagedCollection:
+    """Stub collection that serves one canned page per aggregate call."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.pipelines = []
+
+    def aggregate(self, pipeline, **kwargs):
+        self.pipelines.append(pipeline)
+        return iter(self.pages.pop(0) if self.pages else [])
+
+    def index_information(self):
+        return {"created_at_-1": {"key": [("created_at", -1)]}}
+
+
+class TestMongoIncrementalFetch(unittest.TestCase):
+    """Test cases for MongoDataProvider scans driven by the watermark."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config = {"data_dir": self.temp_dir.name, "watermark_page_size": 2}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_pages_from_watermark_until_caught_up(self):
+        """Pages start after the watermark and continue after the last document of each full page."""
+        watermark = Watermark(os.path.join(self.temp_dir.name, "mongo_watermark.json"))
+        watermark.observe("2026-01-01T00:00:00Z", "uni--1")
+        watermark.commit()
+
+        docs = [{"post_id": f"uni--{i}", "created_at": f"2026-01-01T00:00:0{i}Z"} for i in range(2, 5)]
+        collection = PagedCollection([[{"_id": "uni", "docs": docs[:2]}], [{"_id": "uni", "docs": docs[2:]}]])
+        provider = MongoDataProvider(self.config)
+        result = provider.download_proposals((None, {"proposals": collection}), scan_mode=True)
+
+        self.assertEqual(result["uni"].post_ids(), ["uni--2", "uni--3", "uni--4"])
+        self.assertEqual(len(collection.pipelines), 2)
+        first, second = [pipeline[0]["$match"]["$and"][-1]["$or"] for pipeline in collection.pipelines]
+        self.assertEqual(first[1], {"created_at": "2026-01-01T00:00:00Z", "post_id": {"$gt": "uni--1"}})
+        self.assertEqual(second[1], {"created_at": "2026-01-01T00:00:03Z", "post_id": {"$gt": "uni--3"}})
+        self.assertEqual(collection.pipelines[0][1], {"$sort": {"created_at": 1, "post_id": 1}})
+
+        provider.commit_watermark()
+        self.assertEqual(Watermark(watermark.path).doc_id, "uni--4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,142 @@
-import re
+"""
+HTML-to-text conversion for proposal descriptions.
+
+Descriptions are cleaned once, when a provider ingests them, by a shared
+HTMLCleaner that memoizes the result per post. The stripper streams the
+markup through the standard library HTMLParser, the same tokenizer that
+BeautifulSoup's 'html.parser' backend uses, without building a tree.
+"""
+
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+
+
+class _TextExtractor(HTMLParser):
+    """Streaming parser that keeps only the text BeautifulSoup's get_text() returns."""
+
+    # Elements whose content is not page text
+    SKIPPED_TAGS = frozenset(('script', 'style', 'template'))
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    def unknown_decl(self, data):
+        # CDATA sections are text; other declarations are dropped
+        if data.startswith('CDATA['):
+            self.parts.append(data[6:])
+
+
+def html_to_text(html_text):
+    """
+    Extract the text content of an HTML fragment.
+
+    Args:
+        html_text (str): HTML content
+
+    Returns:
+        str: Text content with tags removed and entities decoded
+    """
+    if not html_text:
+        return ''
+    html_text = str(html_text)
+    if '<' not in html_text and '&' not in html_text:
+        return html_text
+    parser = _TextExtractor()
+    parser.feed(html_text)
+    parser.close()
+    return ''.join(parser.parts)
+
+
+class HTMLCleaner:
+    """
+    Memoizing HTML-to-text converter shared by the data providers and the trade logic.
+    """
+
+    def __init__(self, max_entries=10000):
+        """
+        Initialize the cleaner.
+
+        Args:
+            max_entries (int): Number of cleaned posts kept in the cache
+        """
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def clean(self, html_text, post_id=None):
+        """
+        Convert a description to text, reusing the previous result for the same post.
+
+        Args:
+            html_text (str): HTML content
+            post_id (str, optional): Post the content belongs to; without it nothing is cached
+
+        Returns:
+            str: Text content
+        """
+        if post_id is None:
+            return html_to_text(html_text)
+
+        with self._lock:
+            cached = self._cache.get(post_id)
+            # An edited post arrives with new content and is cleaned again
+            if cached is not None and cached[0] == html_text:
+                self._cache.move_to_end(post_id)
+                self.stats["hits"] += 1
+                return cached[1]
+
+        text = html_to_text(html_text)
+        with self._lock:
+            self.stats["misses"] += 1
+            self._cache[post_id] = (html_text, text)
+            self._cache.move_to_end(post_id)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return text
+
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+            self.stats = {"hits": 0, "misses": 0}
+
 
 def remove_html_tags(text):
     """
     Remove all HTML tags from the text and return clean paragraphs.
     """
-    # Remove HTML tags using regex
-    clean_text = re.sub(r'<[^>]+>', '', text)
+    clean_text = html_to_text(text)
     
     # Split the text into paragraphs based on double newlines
     paragraphs = [p.strip() for p in clean_text.split('\n\n') if p.strip()]
     
-    return paragraphs
\ No newline at end of file
+    return paragraphs
+
+
+# Create a singleton instance that can be imported
+html_cleaner = HTMLCleaner()
+
+def get_html_cleaner():
+    """
+    Get the global HTMLCleaner instance.
+
+    Returns:
+        HTMLCleaner: The singleton HTMLCleaner instance
+    """
+    return html_cleaner
@@ -66,6 +66,63 @@ class ConfigLoader:
         # Slack integration
         self.config['slack_webhook_url'] = os.getenv('SLACK_WEBHOOK_URL')
         
+        # Data provider
+        self.config['data_provider_type'] = os.getenv('DATA_PROVIDER_TYPE')
+        self.config['mongo_connection_string'] = os.getenv('MONGO_CONNECTION_STRING')
+        self.config['mongo_db_name'] = os.getenv('MONGO_DB_NAME')
+        if os.getenv('MONGO_BATCH_SIZE'):
+            self.config['mongo_batch_size'] = int(os.getenv('MONGO_BATCH_SIZE'))
+        else:
+            self.config['mongo_batch_size'] = 200
+        # Documents per page when catching up from the persisted watermark
+        if os.getenv('WATERMARK_PAGE_SIZE'):
+            self.config['watermark_page_size'] = int(os.getenv('WATERMARK_PAGE_SIZE'))
+        else:
+            self.config['watermark_page_size'] = 100
+        # Documents per page of the initial, resumable backfill
+        if os.getenv('BACKFILL_PAGE_SIZE'):
+            self.config['backfill_page_size'] = int(os.getenv('BACKFILL_PAGE_SIZE'))
+        else:
+            self.config['backfill_page_size'] = 500
+        # Seconds a scan waits for each source when DATA_PROVIDER_TYPE lists several (0 waits indefinitely)
+        if os.getenv('SOURCE_TIMEOUT'):
+            self.config['source_timeout'] = float(os.getenv('SOURCE_TIMEOUT'))
+        else:
+            self.config['source_timeout'] = 30.0
+        # Recorded proposal dump replayed by DATA_PROVIDER_TYPE=replay
+        self.config['replay_path'] = os.getenv('REPLAY_PATH')
+        self.config['replay_speed'] = os.getenv('REPLAY_SPEED', '1')
+        if os.getenv('REPLAY_WINDOW_SECONDS'):
+            self.config['replay_window_seconds'] = float(os.getenv('REPLAY_WINDOW_SECONDS'))
+        else:
+            self.config['replay_window_seconds'] = 60.0
+        # 'listen' subscribes to new proposals instead of polling every cycle
+        self.config['proposal_feed_mode'] = os.getenv('PROPOSAL_FEED_MODE', 'poll').lower()
+        # Consecutive listener failures before falling back to polling
+        if os.getenv('LISTENER_MAX_FAILURES'):
+            self.config['listener_max_failures'] = int(os.getenv('LISTENER_MAX_FAILURES'))
+        else:
+            self.config['listener_max_failures'] = 5
+        # Only proposals created within this many hours are fetched in scan mode (0 disables the window)
+        if os.getenv('MONGO_SCAN_WINDOW_HOURS'):
+            self.config['mongo_scan_window_hours'] = float(os.getenv('MONGO_SCAN_WINDOW_HOURS'))
+        else:
+            self.config['mongo_scan_window_hours'] = 168.0
+        
+        # LLM endpoints (point these at services/mock_llm_server.py for offline runs)
+        self.config['openai_base_url'] = os.getenv('OPENAI_BASE_URL')
+        self.config['ollama_host'] = os.getenv('OLLAMA_HOST')
+        self.config['ollama_model'] = os.getenv('OLLAMA_MODEL', 'mistral')
+        
+        # Tiered sentiment: the fast model scores first, the reasoning model is only
+        # consulted when the blended score is within ESCALATION_BAND of a threshold
+        self.config['openai_fast_model'] = os.getenv('OPENAI_FAST_MODEL', 'gpt-4o-mini')
+        self.config['openai_reasoning_model'] = os.getenv('OPENAI_REASONING_MODEL', 'o1-preview')
+        if os.getenv('ESCALATION_BAND'):
+            self.config['escalation_band'] = float(os.getenv('ESCALATION_BAND'))
+        else:
+            self.config['escalation_band'] = 0.10
+        
         # Trading parameters
         if os.getenv('COUNTDOWN_TIME'):
             self.config['countdown_time'] = int(os.getenv('COUNTDOWN_TIME'))
@@ -97,6 +154,26 @@ class ConfigLoader:
         else:
             self.config['stop_loss_percent'] = 2.0
             
+        # Seconds after a proposal's timestamp within which it must be fully processed
+        if os.getenv('PROPOSAL_TIME_BUDGET'):
+            self.config['proposal_time_budget'] = float(os.getenv('PROPOSAL_TIME_BUDGET'))
+        else:
+            self.config['proposal_time_budget'] = 3600.0
+            
+        # Near-duplicate proposals: off, audit (log only), reuse (reuse earlier scores) or skip (no trade)
+        self.config['near_duplicate_policy'] = os.getenv('NEAR_DUPLICATE_POLICY', 'reuse').lower()
+        if os.getenv('NEAR_DUPLICATE_THRESHOLD'):
+            self.config['near_duplicate_threshold'] = float(os.getenv('NEAR_DUPLICATE_THRESHOLD'))
+        else:
+            self.config['near_duplicate_threshold'] = 0.85
+        if os.getenv('NEAR_DUPLICATE_WINDOW_HOURS'):
+            self.config['near_duplicate_window_hours'] = float(os.getenv('NEAR_DUPLICATE_WINDOW_HOURS'))
+        else:
+            self.config['near_duplicate_window_hours'] = 72.0
+            
+        # Embedding index of analysed proposals for similar-case lookup
+        self.config['embedding_index_enabled'] = os.getenv('EMBEDDING_INDEX_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+            
         if os.getenv('MAX_TRADES'):
             self.config['max_trades'] = int(os.getenv('MAX_TRADES'))
         else:
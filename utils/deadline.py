@@ -0,0 +1,138 @@
+"""
+Deadline utilities for the Governance Trading Bot.
+
+A proposal is only worth trading while its information is fresh. This module
+provides a Deadline object, derived from the proposal timestamp plus a time
+budget, that pipeline stages consult to shorten or skip optional work.
+"""
+
+import time
+from datetime import datetime, timezone
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a pipeline stage is entered after the proposal deadline."""
+
+
+def parse_timestamp(value):
+    """
+    Convert a proposal timestamp into seconds since the epoch.
+
+    Accepts datetime objects (naive values are treated as UTC), epoch numbers
+    in seconds or milliseconds, and ISO-8601 or numeric strings.
+
+    Args:
+        value: Timestamp as stored by the data provider
+
+    Returns:
+        float: Seconds since the epoch, or None if the value can't be parsed
+    """
+    # NaN and NaT, e.g. from an empty DataFrame cell, are the only values not equal to themselves
+    if value is None or value != value:
+        return None
+
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    if isinstance(value, (int, float)):
+        # Values past year 33658 in seconds are almost certainly milliseconds
+        return value / 1000.0 if value > 1e12 else float(value)
+
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        try:
+            return parse_timestamp(float(text))
+        except ValueError:
+            pass
+        try:
+            return parse_timestamp(datetime.fromisoformat(text.replace('Z', '+00:00')))
+        except ValueError:
+            return None
+
+    return None
+
+
+class Deadline:
+    """
+    Absolute point in time by which a proposal must be fully processed.
+    """
+
+    def __init__(self, expires_at, clock=time.time):
+        """
+        Initialize the deadline.
+
+        Args:
+            expires_at (float): Expiry time in seconds since the epoch
+            clock (callable): Function returning the current epoch time
+        """
+        self.expires_at = expires_at
+        self.clock = clock
+
+    @classmethod
+    def from_timestamp(cls, timestamp, budget_seconds, clock=time.time):
+        """
+        Build a deadline from a proposal timestamp plus a processing budget.
+
+        If the timestamp is missing (None, NaN or NaT) or can't be parsed,
+        the budget starts now.
+
+        Args:
+            timestamp: Proposal creation timestamp
+            budget_seconds (float): Time budget after creation
+            clock (callable): Function returning the current epoch time
+
+        Returns:
+            Deadline: The proposal deadline
+        """
+        created_at = parse_timestamp(timestamp)
+        if created_at is None:
+            created_at = clock()
+        return cls(created_at + budget_seconds, clock)
+
+    def remaining(self):
+        """Seconds left before the deadline, negative once it has passed."""
+        return self.expires_at - self.clock()
+
+    def expired(self):
+        """Check whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def has_time_for(self, seconds):
+        """
+        Check whether at least `seconds` remain before the deadline.
+
+        Args:
+            seconds (float): Time needed by the next step
+
+        Returns:
+            bool: True if the step fits in the remaining budget
+        """
+        return self.remaining() >= seconds
+
+    def timeout(self, default=None, minimum=1.0):
+        """
+        Get a request timeout bounded by the deadline.
+
+        Args:
+            default (float, optional): Upper bound for the timeout
+            minimum (float): Lower bound so requests are never issued with zero time
+
+        Returns:
+            float: Timeout in seconds
+        """
+        remaining = max(self.remaining(), minimum)
+        return remaining if default is None else min(default, remaining)
+
+    def check(self, stage):
+        """
+        Raise DeadlineExceeded if the deadline has passed.
+
+        Args:
+            stage (str): Name of the stage about to start, used in the error message
+        """
+        if self.expired():
+            raise DeadlineExceeded(f"Deadline passed {-self.remaining():.1f}s before {stage}")
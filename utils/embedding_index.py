@@ -0,0 +1,286 @@
+"""
+Vector index of historical proposals for similar-case lookup.
+
+Every analysed proposal is stored as a normalized embedding in a NumPy
+matrix that lives on disk and is opened with mmap, so the index survives
+restarts without being loaded into memory up front. Once the index is large
+enough, an inverted-file (IVF) layer of spherical k-means centroids limits a
+lookup to the few clusters closest to the query.
+"""
+
+import json
+import os
+import threading
+
+import numpy as np
+
+VECTORS_FILE = 'vectors.npy'
+ENTRIES_FILE = 'entries.jsonl'
+CENTROIDS_FILE = 'centroids.npy'
+
+
+def normalize(vectors):
+    """
+    L2-normalize vectors so inner products are cosine similarities.
+
+    Args:
+        vectors (array-like): A vector or a matrix with one vector per row
+
+    Returns:
+        np.ndarray: float32 copy with unit-length rows
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class EmbeddingIndex:
+    """
+    Persistent approximate nearest-neighbour index over proposal embeddings.
+    """
+
+    def __init__(self, path, dim=768, ivf_min_size=2048, nprobe=8, train_sample=20000,
+                 initial_capacity=1024, seed=1):
+        """
+        Initialize the index, loading it from `path` if it exists.
+
+        Args:
+            path (str): Directory holding the index files
+            dim (int): Embedding dimension, ignored when an index already exists
+            ivf_min_size (int): Below this many entries lookups scan every vector exactly
+            nprobe (int): Number of IVF clusters scanned per lookup
+            train_sample (int): Maximum number of vectors used to train the centroids
+            initial_capacity (int): Rows preallocated in a new vector file
+            seed (int): Seed for centroid initialisation
+        """
+        self.path = path
+        self.dim = dim
+        self.ivf_min_size = ivf_min_size
+        self.nprobe = nprobe
+        self.train_sample = train_sample
+        self.initial_capacity = initial_capacity
+        self.seed = seed
+        self._lock = threading.Lock()
+
+        self._vectors = None
+        self.ids = []
+        self.metadata = []
+        self._positions = {}
+        self._centroids = None
+        self._lists = []
+        self._list_arrays = {}
+        self._trained_size = 0
+
+        self._load()
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _load(self):
+        """Open the vector file with mmap and read the entry log."""
+        if not os.path.exists(self._file(VECTORS_FILE)):
+            return
+
+        self._vectors = np.load(self._file(VECTORS_FILE), mmap_mode='r+')
+        self.dim = self._vectors.shape[1]
+
+        if os.path.exists(self._file(ENTRIES_FILE)):
+            with open(self._file(ENTRIES_FILE), 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    # A crash between writing a vector and its entry leaves the vector unreferenced
+                    if len(self.ids) >= self._vectors.shape[0]:
+                        break
+                    entry = json.loads(line)
+                    self._positions[entry['post_id']] = len(self.ids)
+                    self.ids.append(entry.pop('post_id'))
+                    self.metadata.append(entry)
+
+        if os.path.exists(self._file(CENTROIDS_FILE)) and len(self.ids) >= self.ivf_min_size:
+            self._set_centroids(np.load(self._file(CENTROIDS_FILE)))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, post_id):
+        return post_id in self._positions
+
+    def _ensure_capacity(self, rows):
+        """Grow the vector file, doubling its capacity, so it can hold `rows` vectors."""
+        if self._vectors is not None and self._vectors.shape[0] >= rows:
+            return
+
+        os.makedirs(self.path, exist_ok=True)
+        capacity = max(self.initial_capacity, rows)
+        if self._vectors is not None:
+            capacity = max(capacity, 2 * self._vectors.shape[0])
+
+        tmp_path = self._file(VECTORS_FILE + '.tmp')
+        grown = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32, shape=(capacity, self.dim))
+        if self._vectors is not None:
+            grown[:len(self.ids)] = self._vectors[:len(self.ids)]
+        grown.flush()
+        del grown
+        self._vectors = None
+        os.replace(tmp_path, self._file(VECTORS_FILE))
+        self._vectors = np.load(self._file(VECTORS_FILE), mmap_mode='r+')
+
+    def add(self, post_id, vector, **metadata):
+        """
+        Add a proposal embedding and persist it.
+
+        Args:
+            post_id (str): Proposal ID; proposals already in the index are ignored
+            vector (array-like): Embedding of the proposal
+            **metadata: JSON-serialisable details returned with search results
+
+        Returns:
+            bool: True if the proposal was added
+        """
+        return self.add_batch([post_id], [vector], [metadata]) == 1
+
+    def add_batch(self, post_ids, vectors, metadata=None):
+        """
+        Add several proposal embeddings and persist them with a single flush.
+
+        Vectors are written to the memory-mapped file before their entries are
+        appended to the log, so a crash never leaves an entry without a vector.
+
+        Args:
+            post_ids (list): Proposal IDs; proposals already in the index are ignored
+            vectors (array-like): One embedding per proposal
+            metadata (list, optional): One dict of JSON-serialisable details per proposal
+
+        Returns:
+            int: Number of proposals added
+        """
+        vectors = normalize(vectors).reshape(len(post_ids), -1)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+        metadata = metadata or [{} for _ in post_ids]
+
+        with self._lock:
+            seen = set()
+            keep = []
+            for i, post_id in enumerate(post_ids):
+                if post_id not in self._positions and post_id not in seen:
+                    seen.add(post_id)
+                    keep.append(i)
+            if not keep:
+                return 0
+
+            start = len(self.ids)
+            self._ensure_capacity(start + len(keep))
+            self._vectors[start:start + len(keep)] = vectors[keep]
+            self._vectors.flush()
+
+            with open(self._file(ENTRIES_FILE), 'a') as f:
+                for i in keep:
+                    f.write(json.dumps(dict(metadata[i], post_id=post_ids[i]), default=str) + '\n')
+
+            for position, i in enumerate(keep, start):
+                self._positions[post_ids[i]] = position
+                self.ids.append(post_ids[i])
+                self.metadata.append(metadata[i])
+
+            if self._centroids is not None:
+                clusters = np.argmax(vectors[keep] @ self._centroids.T, axis=1)
+                for position, cluster in enumerate(clusters, start):
+                    self._lists[cluster].append(position)
+                    self._list_arrays.pop(cluster, None)
+
+            # Retrain once the index has doubled since the centroids were computed
+            if len(self.ids) >= self.ivf_min_size and len(self.ids) >= 2 * self._trained_size:
+                self._train()
+            return len(keep)
+
+    def _set_centroids(self, centroids):
+        """Install centroids and assign every stored vector to its nearest one."""
+        self._centroids = centroids.astype(np.float32)
+        self._lists = [[] for _ in range(len(centroids))]
+        self._list_arrays = {}
+        count = len(self.ids)
+        for start in range(0, count, 8192):
+            block = np.asarray(self._vectors[start:min(start + 8192, count)])
+            for offset, cluster in enumerate(np.argmax(block @ self._centroids.T, axis=1)):
+                self._lists[cluster].append(start + offset)
+        self._trained_size = count
+
+    def _train(self, iterations=10):
+        """Train IVF centroids with spherical k-means on a sample of the stored vectors."""
+        count = len(self.ids)
+        rng = np.random.RandomState(self.seed)
+        sample_rows = np.sort(rng.choice(count, size=min(count, self.train_sample), replace=False))
+        sample = np.asarray(self._vectors[sample_rows])
+
+        # About 4 * sqrt(n) lists keeps the vectors scanned per lookup well under a thousand up to 100k entries
+        num_lists = max(16, int(4 * np.sqrt(count)))
+        centroids = sample[rng.choice(len(sample), size=num_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assignment, kind='stable')
+            clusters, starts = np.unique(assignment[order], return_index=True)
+            sums = np.zeros_like(centroids)
+            sums[clusters] = np.add.reduceat(sample[order], starts, axis=0)
+            empty = ~sums.any(axis=1)
+            # Re-seed empty clusters with random sample vectors
+            sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+            centroids = normalize(sums)
+
+        np.save(self._file(CENTROIDS_FILE), centroids)
+        self._set_centroids(centroids)
+
+    def _list_array(self, cluster):
+        array = self._list_arrays.get(cluster)
+        if array is None:
+            array = self._list_arrays[cluster] = np.array(self._lists[cluster], dtype=np.int64)
+        return array
+
+    def search(self, vector, k=5, exclude=None):
+        """
+        Find the stored proposals most similar to a vector.
+
+        Args:
+            vector (array-like): Query embedding
+            k (int): Number of results
+            exclude (str, optional): Proposal ID left out of the results
+
+        Returns:
+            list: (post_id, cosine similarity, metadata) tuples, most similar first
+        """
+        query = normalize(vector).reshape(-1)
+        with self._lock:
+            count = len(self.ids)
+            if count == 0:
+                return []
+
+            if self._centroids is None:
+                candidates = None
+                scores = self._vectors[:count] @ query
+            else:
+                probe = min(self.nprobe, len(self._centroids))
+                clusters = np.argpartition(-(self._centroids @ query), probe - 1)[:probe]
+                candidates = np.concatenate([self._list_array(c) for c in clusters])
+                scores = self._vectors[candidates] @ query
+
+            wanted = min(k + (exclude is not None), len(scores))
+            if wanted == 0:
+                return []
+            top = np.argpartition(-scores, wanted - 1)[:wanted]
+            top = top[np.argsort(-scores[top])]
+
+            results = []
+            for i in top:
+                position = int(i if candidates is None else candidates[i])
+                if self.ids[position] == exclude:
+                    continue
+                results.append((self.ids[position], float(scores[i]), self.metadata[position]))
+            return results[:k]
+
+    def close(self):
+        """Flush and release the memory-mapped vector file."""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._vectors = None
@@ -0,0 +1,254 @@
+"""
+Telemetry utilities for the Governance Trading Bot.
+
+This module keeps rolling windows of recent measurements and summarises
+them as percentiles, so the bot can report latency and size statistics
+without unbounded memory growth.
+"""
+
+import threading
+from collections import deque, Counter
+
+
+def percentile(sorted_values, pct):
+    """
+    Compute a percentile with linear interpolation.
+
+    Args:
+        sorted_values (list): Values sorted in ascending order
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The interpolated percentile, or None for an empty list
+    """
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+class RollingWindow:
+    """
+    Fixed-size window of the most recent samples.
+    """
+
+    def __init__(self, size=500):
+        """
+        Initialize the window.
+
+        Args:
+            size (int): Maximum number of samples retained
+        """
+        self.samples = deque(maxlen=size)
+
+    def add(self, value):
+        """Add a sample, evicting the oldest one when the window is full."""
+        self.samples.append(value)
+
+    def __len__(self):
+        return len(self.samples)
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """
+        Summarise the window.
+
+        Args:
+            percentiles (tuple): Percentiles to report
+
+        Returns:
+            dict: Count, mean and the requested percentiles
+        """
+        values = sorted(self.samples)
+        result = {"count": len(values), "mean": sum(values) / len(values) if values else None}
+        for pct in percentiles:
+            result[f"p{pct}"] = percentile(values, pct)
+        return result
+
+
+class LLMMetrics:
+    """
+    Per-call telemetry for LLM requests, aggregated per provider and model.
+    """
+
+    def __init__(self, window_size=500):
+        """
+        Initialize the metrics store.
+
+        Args:
+            window_size (int): Number of recent calls kept per provider/model
+        """
+        self.window_size = window_size
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def _get_series(self, provider, model):
+        key = f"{provider}/{model}"
+        if key not in self._series:
+            self._series[key] = {
+                "calls": 0,
+                "outcomes": Counter(),
+                "latency_ms": RollingWindow(self.window_size),
+                "retries": RollingWindow(self.window_size),
+                "prompt_chars": RollingWindow(self.window_size),
+                "output_chars": RollingWindow(self.window_size),
+                "prompt_tokens": RollingWindow(self.window_size),
+                "output_tokens": RollingWindow(self.window_size)
+            }
+        return self._series[key]
+
+    def record(self, provider, model, wall_time, retries, prompt_chars, output_chars, outcome,
+               prompt_tokens=None, output_tokens=None):
+        """
+        Record a single LLM call.
+
+        Args:
+            provider (str): Provider name (e.g. 'ollama', 'openai', 'deepseek')
+            model (str): Model name
+            wall_time (float): Wall-clock duration in seconds, including retries
+            retries (int): Number of attempts beyond the first
+            prompt_chars (int): Prompt size in characters
+            output_chars (int): Output size in characters
+            outcome (str): Outcome label (e.g. 'success', 'parse_error', 'error')
+            prompt_tokens (int, optional): Prompt tokens reported by the provider
+            output_tokens (int, optional): Output tokens reported by the provider
+        """
+        with self._lock:
+            series = self._get_series(provider, model)
+            series["calls"] += 1
+            series["outcomes"][outcome] += 1
+            series["latency_ms"].add(wall_time * 1000.0)
+            series["retries"].add(retries)
+            series["prompt_chars"].add(prompt_chars)
+            series["output_chars"].add(output_chars)
+            if prompt_tokens is not None:
+                series["prompt_tokens"].add(prompt_tokens)
+            if output_tokens is not None:
+                series["output_tokens"].add(output_tokens)
+
+    def snapshot(self):
+        """
+        Get aggregated statistics for every provider/model pair.
+
+        Returns:
+            dict: Statistics keyed by 'provider/model'
+        """
+        with self._lock:
+            result = {}
+            for key, series in self._series.items():
+                result[key] = {
+                    "calls": series["calls"],
+                    "outcomes": dict(series["outcomes"]),
+                    "latency_ms": series["latency_ms"].summary(),
+                    "retries": series["retries"].summary(),
+                    "prompt_chars": series["prompt_chars"].summary(),
+                    "output_chars": series["output_chars"].summary(),
+                    "prompt_tokens": series["prompt_tokens"].summary(),
+                    "output_tokens": series["output_tokens"].summary()
+                }
+            return result
+
+    def reset(self):
+        """Drop all recorded calls."""
+        with self._lock:
+            self._series = {}
+
+
+class EscalationMetrics:
+    """
+    Telemetry for tiered sentiment scoring: how often the fast model's verdict
+    was escalated to the reasoning model and how much latency was saved.
+    """
+
+    def __init__(self, window_size=500):
+        """
+        Initialize the metrics store.
+
+        Args:
+            window_size (int): Number of recent latencies kept per tier
+        """
+        self.window_size = window_size
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, escalated, reason, fast_seconds, reasoning_seconds=None):
+        """
+        Record one tiering decision.
+
+        Args:
+            escalated (bool): Whether the reasoning model was called
+            reason (str): Why the decision was taken (e.g. 'near_threshold', 'clear', 'fast_failed')
+            fast_seconds (float): Wall time of the fast-model call
+            reasoning_seconds (float, optional): Wall time of the reasoning-model call
+        """
+        with self._lock:
+            self._decisions += 1
+            self._reasons[reason] += 1
+            self._fast_seconds_total += fast_seconds
+            self._fast_latency.add(fast_seconds * 1000.0)
+            if escalated:
+                self._escalations += 1
+                if reasoning_seconds is not None:
+                    self._reasoning_latency.add(reasoning_seconds * 1000.0)
+
+    def snapshot(self):
+        """
+        Get the escalation rate and the estimated latency saved.
+
+        The saving is measured against always calling the reasoning model: every
+        decision that stayed on the fast tier saves the mean reasoning latency,
+        and every fast call is paid for.
+
+        Returns:
+            dict: Decision counts, escalation rate, per-tier latency and latency saved
+        """
+        with self._lock:
+            reasoning = self._reasoning_latency.summary()
+            saved = None
+            if reasoning["mean"] is not None:
+                kept = self._decisions - self._escalations
+                saved = kept * reasoning["mean"] / 1000.0 - self._fast_seconds_total
+            return {
+                "decisions": self._decisions,
+                "escalations": self._escalations,
+                "escalation_rate": self._escalations / self._decisions if self._decisions else None,
+                "reasons": dict(self._reasons),
+                "fast_latency_ms": self._fast_latency.summary(),
+                "reasoning_latency_ms": reasoning,
+                "latency_saved_seconds": saved
+            }
+
+    def reset(self):
+        """Drop all recorded decisions."""
+        with self._lock:
+            self._decisions = 0
+            self._escalations = 0
+            self._reasons = Counter()
+            self._fast_seconds_total = 0.0
+            self._fast_latency = RollingWindow(self.window_size)
+            self._reasoning_latency = RollingWindow(self.window_size)
+
+
+# Create singleton instances that can be imported
+llm_metrics = LLMMetrics()
+escalation_metrics = EscalationMetrics()
+
+def get_llm_metrics():
+    """
+    Get the global LLMMetrics instance.
+
+    Returns:
+        LLMMetrics: The singleton LLMMetrics instance
+    """
+    return llm_metrics
+
+def get_escalation_metrics():
+    """
+    Get the global EscalationMetrics instance.
+
+    Returns:
+        EscalationMetrics: The singleton EscalationMetrics instance
+    """
+    return escalation_metrics
@@ -0,0 +1,217 @@
+"""
+Near-duplicate detection for proposal descriptions.
+
+Governance posts are often cross-posted (Snapshot and forum copies) or
+re-submitted with minor edits. NearDuplicateIndex keeps MinHash signatures
+of recently processed descriptions in an LSH table, so a new proposal can be
+matched against them in constant time and reuse the earlier analysis.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Mersenne prime for the universal hash family; products with 32-bit hashes fit in uint64
+_PRIME = (1 << 31) - 1
+_WORD_PATTERN = re.compile(r"\w+")
+
+POLICIES = ('off', 'audit', 'reuse', 'skip')
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index over recently processed proposal descriptions.
+    """
+
+    def __init__(self, threshold=0.85, num_perm=128, rows_per_band=8, shingle_size=3,
+                 window_seconds=72 * 3600, max_entries=5000, seed=1, clock=time.time):
+        """
+        Initialize the index.
+
+        Args:
+            threshold (float): Minimum estimated Jaccard similarity for a match
+            num_perm (int): Number of hash permutations in a signature
+            rows_per_band (int): Signature rows per LSH band; num_perm must be a multiple of it
+            shingle_size (int): Number of words per shingle
+            window_seconds (float): Entries older than this are no longer matched
+            max_entries (int): Maximum number of entries kept
+            seed (int): Seed of the hash permutations
+            clock (callable): Function returning the current epoch time
+        """
+        if num_perm % rows_per_band:
+            raise ValueError("num_perm must be a multiple of rows_per_band")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.rows_per_band = rows_per_band
+        self.bands = num_perm // rows_per_band
+        self.shingle_size = shingle_size
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        # post_id -> (signature, added_at, result), oldest first
+        self._entries = OrderedDict()
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, post_id):
+        return post_id in self._entries
+
+    def signature(self, text):
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text (str): Cleaned description
+
+        Returns:
+            numpy.ndarray: Signature of num_perm values, or None for texts without words
+        """
+        words = _WORD_PATTERN.findall(str(text).lower())
+        if not words:
+            return None
+        size = min(self.shingle_size, len(words))
+        shingles = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        # crc32 is stable across processes, unlike hash()
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+        return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+
+    def _band_keys(self, signature):
+        rows = self.rows_per_band
+        return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+
+    def add(self, post_id, text, result, signature=None, added_at=None):
+        """
+        Add a processed proposal.
+
+        Args:
+            post_id (str): Proposal ID
+            text (str): Cleaned description
+            result (dict): Analysis to reuse for near-duplicates (summary, sentiment, ...)
+            signature (numpy.ndarray, optional): Precomputed signature of text
+            added_at (float, optional): When the proposal was processed, in epoch seconds; defaults to now.
+                Proposals already outside the window are not added.
+        """
+        if added_at is None:
+            added_at = self.clock()
+        elif added_at < self.clock() - self.window_seconds:
+            return
+        if signature is None:
+            signature = self.signature(text)
+        if signature is None:
+            return
+
+        with self._lock:
+            self._remove(post_id)
+            self._entries[post_id] = (signature, added_at, result)
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(key, set()).add(post_id)
+            self._evict()
+
+    def _remove(self, post_id):
+        entry = self._entries.pop(post_id, None)
+        if entry is None:
+            return
+        for band, key in enumerate(self._band_keys(entry[0])):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(post_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def _evict(self):
+        cutoff = self.clock() - self.window_seconds
+        while self._entries:
+            post_id, (_, added_at, _) = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_entries and added_at >= cutoff:
+                break
+            self._remove(post_id)
+
+    def query(self, text, signature=None, exclude=None):
+        """
+        Find the most similar recent proposal above the threshold.
+
+        Args:
+            text (str): Cleaned description
+            signature (numpy.ndarray, optional): Precomputed signature of text
+            exclude (str, optional): Proposal ID to ignore, e.g. the proposal itself
+
+        Returns:
+            tuple: (post_id, similarity, result) of the best match, or None
+        """
+        if signature is None:
+            signature = self.signature(text)
+        if signature is None:
+            return None
+
+        with self._lock:
+            self._evict()
+            candidates = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(key, ()))
+            candidates.discard(exclude)
+
+            best = None
+            for post_id in candidates:
+                entry_signature, _, result = self._entries[post_id]
+                similarity = float(np.mean(entry_signature == signature))
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (post_id, similarity, result)
+            return best
+
+
+class NearDuplicateAuditLog:
+    """
+    Append-only JSON Lines log of every near-duplicate decision.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the audit log.
+
+        Args:
+            path (str): Path of the JSON Lines file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, post_id, matched_post_id, similarity, policy, action, **details):
+        """
+        Append a decision to the log.
+
+        Args:
+            post_id (str): New proposal
+            matched_post_id (str): Earlier proposal it matched
+            similarity (float): Estimated Jaccard similarity
+            policy (str): Policy in force
+            action (str): What was done ('logged', 'reused' or 'skipped')
+            **details: Extra fields, e.g. the reused scores
+        """
+        entry = {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "post_id": post_id,
+            "matched_post_id": matched_post_id,
+            "similarity": round(similarity, 4),
+            "policy": policy,
+            "action": action
+        }
+        entry.update(details)
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(entry, default=str) + '\n')
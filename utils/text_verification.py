@@ -1,16 +1,192 @@
-import nltk
-nltk.download('punkt')
-nltk.download('words')
+"""
+Text verification utilities for the Governance Trading Bot.
 
+A proposal is treated as genuine when most of its tokens are English words.
+The English lexicon is read from a pre-built pickled frozenset (see
+build_lexicon.py) on first use, so importing this module never touches the
+network or the NLTK data directory.
+"""
 
-from nltk.corpus import words
-from nltk.tokenize import word_tokenize
+import os
+import pickle
+import re
 import string
+import threading
 
-# Load set of English words
-english_words = set(words.words())
+# Default location of the lexicon artifact, next to the downloaded trading models
+DEFAULT_LEXICON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'trained_model', 'english_words.pkl'
+)
 
-def text_validity_check(text):
+_english_words = None
+_english_words_lock = threading.Lock()
+
+# Approximates NLTK's word_tokenize on lowercased text, but never emits the
+# single ASCII punctuation tokens that the validity check discards anyway:
+# contractions are split ("do", "n't", "'s"), hyphenated, dotted and slashed
+# words stay whole, as do numbers like 10,000 and 10:30, and multi-character
+# punctuation ("...", "--", quotes as '') is kept because word_tokenize
+# produces it and it counts as a non-word.
+_TOKEN_PATTERN = re.compile(r"""
+      \w+(?=n't\b)                          # stem of a negated contraction
+    | n't\b
+    | '(?:s|re|ve|ll|d|m)\b                  # clitics
+    | /*\w+(?:(?:[-./]+|[,:](?=\d))\w+)*    # words, numbers, abbreviations, paths
+    | ''|\.\.\.|--
+    | [^\w\s!-/:-@\[-`{-~]                  # non-ASCII symbols
+""", re.VERBOSE)
+
+
+def get_lexicon_path():
+    """
+    Get the path of the lexicon artifact.
+
+    Returns:
+        str: LEXICON_PATH from the environment, or the default artifact path
+    """
+    return os.getenv('LEXICON_PATH') or DEFAULT_LEXICON_PATH
+
+
+def build_lexicon(path=None, words=None, download=True):
+    """
+    Build the English lexicon artifact.
+
+    Args:
+        path (str, optional): Output path, defaults to get_lexicon_path()
+        words (iterable, optional): Words to store, defaults to the NLTK words corpus
+        download (bool): Download the NLTK corpus first if it is missing
+
+    Returns:
+        frozenset: The stored lexicon
+    """
+    path = path or get_lexicon_path()
+    if words is None:
+        import nltk
+        if download:
+            nltk.download('words', quiet=True)
+        from nltk.corpus import words as words_corpus
+        words = words_corpus.words()
+
+    lexicon = frozenset(words)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Write to a temporary file first so a crashed build never leaves a truncated artifact
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(lexicon, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+    return lexicon
+
+
+def load_lexicon(path):
+    """
+    Load a lexicon artifact.
+
+    Args:
+        path (str): Path of the pickled frozenset
+
+    Returns:
+        frozenset: The English lexicon
+    """
+    with open(path, 'rb') as f:
+        lexicon = pickle.load(f)
+    if not isinstance(lexicon, frozenset):
+        raise ValueError(f"Lexicon artifact {path} does not contain a frozenset")
+    return lexicon
+
+
+def get_english_words():
+    """
+    Get the English lexicon, loading it on first use.
+
+    Falls back to an already installed NLTK words corpus when the artifact is
+    missing, but never downloads anything.
+
+    Returns:
+        frozenset: The English lexicon
+
+    Raises:
+        LookupError: If neither the artifact nor a local NLTK corpus is available
+    """
+    global _english_words
+    if _english_words is None:
+        with _english_words_lock:
+            if _english_words is None:
+                path = get_lexicon_path()
+                if os.path.exists(path):
+                    _english_words = load_lexicon(path)
+                else:
+                    try:
+                        from nltk.corpus import words
+                        _english_words = frozenset(words.words())
+                    except LookupError:
+                        raise LookupError(
+                            f"English lexicon not found at {path}; build it with 'python build_lexicon.py'"
+                        )
+    return _english_words
+
+
+def tokenize(text):
+    """
+    Split text into the lowercased tokens scored by the validity check.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Tokens, without single punctuation characters
+    """
+    # word_tokenize turns double quotes into `` and '', which are kept as tokens
+    return _TOKEN_PATTERN.findall(text.lower().replace('"', " '' "))
+
+
+def text_validity_scores(texts):
+    """
+    Compute the proportion of English words in many texts at once.
+
+    Args:
+        texts (iterable): Texts to score
+
+    Returns:
+        list: Validity score per text, 0 for texts without tokens
+    """
+    is_english = get_english_words().__contains__
+    findall = _TOKEN_PATTERN.findall
+    scores = []
+    for text in texts:
+        tokens = findall(text.lower().replace('"', " '' ")) if text else []
+        scores.append(sum(map(is_english, tokens)) / len(tokens) if tokens else 0)
+    return scores
+
+
+def classify_texts(texts, threshold=0.5):
+    """
+    Classify many texts as genuine or not.
+
+    Args:
+        texts (iterable): Texts to classify
+        threshold (float): Minimum proportion of English words for a genuine text
+
+    Returns:
+        list: 'genuine' or 'not_genuine' per text
+    """
+    return ["genuine" if score > threshold else "not_genuine" for score in text_validity_scores(texts)]
+
+
+def nltk_text_validity_check(text):
+    """
+    Reference implementation of the validity score using NLTK's word_tokenize.
+
+    Kept to check the regex tokenizer against; requires the punkt tokenizer data.
+
+    Args:
+        text (str): Text to score
+
+    Returns:
+        float: Proportion of English words among the non-punctuation tokens
+    """
+    from nltk.tokenize import word_tokenize
+
+    english_words = get_english_words()
     tokens = word_tokenize(text)
     tokens = [token.lower() for token in tokens if token not in string.punctuation]
     valid_words = sum(1 for token in tokens if token in english_words)
@@ -21,8 +197,8 @@ def text_validity_check(text):
     
     return proportion_of_valid_words
 
+def text_validity_check(text):
+    return text_validity_scores([text])[0]
+
 def classify_text(text):
-    threshold=0.5
-    validity_score = text_validity_check(text)
-    
-    return "genuine" if validity_score > threshold else "not_genuine"
+    return classify_texts([text])[0]